@@ -3,25 +3,82 @@
 # version 0.2
 # please give credit if you intend to modify!
 
+import sys
+import time
+
+# --- Startup profiling ---
+# startup phases are always timed (see mark_startup / the Startup section at the bottom).
+# with --profile-startup every import is timed too, like python -X importtime but also
+# inside the PyInstaller build, and a report of both is printed once the app is ready
+STARTUP_BEGAN = time.perf_counter() # startup timings are measured from here
+PROFILE_STARTUP = '--profile-startup' in sys.argv
+startup_timings = {}  # phase -> seconds since STARTUP_BEGAN
+import_timings = []  # (module, self seconds, cumulative seconds, nesting depth), in import order
+
+def mark_startup(phase):
+    startup_timings[phase] = time.perf_counter() - STARTUP_BEGAN
+
+if PROFILE_STARTUP:
+    import builtins
+    _original_import = builtins.__import__
+    _import_stack = []  # seconds spent in nested imports, one entry per import in progress
+
+    def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return _original_import(name, globals, locals, fromlist, level)
+        _import_stack.append(0.0)
+        began = time.perf_counter()
+        try:
+            return _original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - began
+            nested = _import_stack.pop()
+            if _import_stack:
+                _import_stack[-1] += cumulative
+            import_timings.append((name, cumulative - nested, cumulative, len(_import_stack)))
+
+    builtins.__import__ = _timed_import
+
 import tkinter as tk
-from PIL import Image, ImageTk
 from tkinter import ttk, messagebox, filedialog, simpledialog, PhotoImage
 import os
 import shutil
 import threading
 import json
-import io
 import subprocess
-import zipfile
-import sys
-import shutil
-import requests
-import pathlib
-import tomllib
-import ssl
-
-print(ssl.get_default_verify_paths())
-print(ssl.OPENSSL_VERSION)
+import importlib
+import hashlib
+import queue
+import heapq
+import random
+import struct
+import re
+import fnmatch
+import mmap
+import collections
+from urllib.parse import urlsplit
+import concurrent.futures
+
+class LazyModule:
+    """Stands in for a module that most sessions never need (requests is only used once
+    something goes over the network, zipfile once something is installed) and imports it
+    the first time one of its attributes is used. main.spec lists these as hiddenimports."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            began = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            if PROFILE_STARTUP:
+                seconds = time.perf_counter() - began
+                import_timings.append((f"{self._name} (lazy, first use)", seconds, seconds, 0))
+        return getattr(self._module, attr)
+
+requests = LazyModule('requests')
+zipfile = LazyModule('zipfile')
 
 # Optional drag-and-drop support via tkinterdnd2 (recommended on Windows)
 try:
@@ -30,6 +87,8 @@ try:
 except Exception:
     HAVE_TKDN = False
 
+mark_startup('imports')
+
 # Define the utility function outside of update_xenia()
 def get_app_root_dir(): # this is important for the pyinstaller temp folder handling
     """Returns the directory where the main executable or script is located."""
@@ -43,6 +102,1396 @@ def get_app_root_dir(): # this is important for the pyinstaller temp folder hand
 # Define the absolute path for the 'temp' folder 
 APP_ROOT_DIR = get_app_root_dir()
 TEMP_DIR = os.path.join(APP_ROOT_DIR, "temp") # oray that this works
+CACHE_DIR = os.path.join(APP_ROOT_DIR, "cache") # persistent caches (http responses, etc.)
+
+# --- Shared HTTP client ---
+# every network call goes through one pooled session so we don't pay for a fresh
+# TLS handshake per request, and GitHub API responses are cached on disk and
+# revalidated with ETag / Last-Modified (a 304 doesn't count against the rate limit)
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+HTTP_USER_AGENT = "xenia-manager/0.2"
+
+_http_session = None
+_http_session_lock = threading.Lock()
+_http_cache_lock = threading.Lock()
+
+def get_http_session():
+    """Returns the shared requests.Session, creating it on first use."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"User-Agent": HTTP_USER_AGENT})
+            _http_session = session
+        return _http_session
+
+# nothing waits on the network forever: every request has connect/read timeouts,
+# idempotent requests that hit a dropped connection, a timeout or a 5xx are retried
+# with jittered exponential backoff, and each host has a circuit breaker. after
+# CIRCUIT_FAILURE_THRESHOLD failed requests in a row (a request only counts once, when
+# its retries are used up) the host is considered down and
+# requests to it fail immediately (CircuitOpenError) for CIRCUIT_OPEN_SECONDS, then
+# a single trial request decides whether it's back
+HTTP_TIMEOUT = (5, 30) # (connect, read) seconds; read is per socket read, not the whole body
+HTTP_RETRIES = 2 # extra attempts for GET/HEAD
+HTTP_BACKOFF_BASE = 0.5 # seconds, doubled every attempt
+HTTP_BACKOFF_MAX = 8
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 60
+CIRCUIT_TRIAL_POLL = 1 # seconds between checks while another request is the half-open trial
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of contacting a host whose circuit breaker is open. It's the builtin
+    ConnectionError (defining it on requests' would import requests at startup), so the
+    places that fall back on cached data when offline catch it next to RequestException.
+    retry_after is how long until the host gets another try (0 while a trial request to it
+    is still running)."""
+
+    def __init__(self, message, retry_after=0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """Per-host failure counter: closed -> open after repeated failures -> half-open trial."""
+
+    def __init__(self, host):
+        self.host = host
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + CIRCUIT_OPEN_SECONDS - time.monotonic()
+            if remaining > 0 or self.trial_running:
+                raise CircuitOpenError(f"{self.host} is unreachable, not retrying for {max(int(remaining), 1)}s", max(remaining, 0))
+            # half-open: let exactly one request through to see if the host is back
+            self.trial_running = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.trial_running = False
+            if self.opened_at is not None or self.failures >= CIRCUIT_FAILURE_THRESHOLD:
+                if self.opened_at is None:
+                    print(f"Warning: {self.host} keeps failing, pausing requests to it for {CIRCUIT_OPEN_SECONDS}s")
+                self.opened_at = time.monotonic()
+
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(url):
+    host = urlsplit(url).netloc.lower()
+    with _circuit_breakers_lock:
+        if host not in _circuit_breakers:
+            _circuit_breakers[host] = CircuitBreaker(host)
+        return _circuit_breakers[host]
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff for retry number attempt (1-based)."""
+    return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * 2 ** attempt))
+
+def http_request(method, url, retries=None, **kwargs):
+    """Send a request through the shared session with timeouts, retries and the host's
+    circuit breaker. GET/HEAD are retried (retries defaults to HTTP_RETRIES), anything
+    else is sent once. Returns the response (possibly a 5xx once retries run out) or
+    raises requests.RequestException, or CircuitOpenError when the host is known down."""
+    kwargs.setdefault('timeout', HTTP_TIMEOUT)
+    if retries is None:
+        retries = HTTP_RETRIES if method.upper() in ('GET', 'HEAD') else 0
+    breaker = get_circuit_breaker(url)
+    # the breaker is asked once and told once per request: retries of the same request
+    # are one failure, not one each, so a single flaky request can't open it by itself
+    breaker.before_request()
+    attempt = 0
+    while True:
+        try:
+            response = get_http_session().request(method, url, **kwargs)
+        except requests.RequestException as e:
+            if attempt >= retries:
+                breaker.record_failure()
+                raise
+            error = e
+        else:
+            if response.status_code not in HTTP_RETRY_STATUSES:
+                breaker.record_success()
+                return response
+            if attempt >= retries:
+                breaker.record_failure()
+                return response
+            response.close()
+            error = f"HTTP {response.status_code}"
+        attempt += 1
+        delay = backoff_delay(attempt)
+        print(f"Warning: {method} {url} failed ({error}), retrying in {delay:.1f}s ({attempt}/{retries})...")
+        time.sleep(delay)
+
+# background pool for network lookups; workers never touch Tk, results are handed
+# back to the UI thread through a queue drained with after()
+_network_pool = None
+_network_pool_lock = threading.Lock()
+
+def get_network_pool():
+    """Returns the shared worker pool used for release lookups."""
+    global _network_pool
+    with _network_pool_lock:
+        if _network_pool is None:
+            _network_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="xm-net")
+        return _network_pool
+
+# product -> (owner, repo) for every Xenia build we know how to install
+XENIA_RELEASE_REPOS = {
+    'canary': ('xenia-canary', 'xenia-canary-releases'),
+    'stable': ('xenia-project', 'release-builds-windows'),
+    'oldercanary': ('xenia-canary', 'xenia-canary'), # older releases were kept at the xenia-canary repo
+    'canary-dbexperiment': ('seven7000real', 'xenia-canary'), # experimental dashboard changes
+    'canary-netplay': ('AdrianCassar', 'xenia-canary'), # netplay builds
+}
+
+# releases are browsed a page at a time; GitHub allows up to 100 per page
+RELEASES_PER_PAGE = 50
+
+def _http_cache_path(url):
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(HTTP_CACHE_DIR, f"{key}.json")
+
+def _load_http_cache_entry(url):
+    path = _http_cache_path(url)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry.get("url") == url:
+            return entry
+    except Exception:
+        pass
+    return None
+
+def _save_http_cache_entry(url, entry):
+    path = _http_cache_path(url)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with _http_cache_lock:
+            os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Warning: Failed to write http cache for {url}: {e}")
+
+# the last rate limit GitHub reported; the background update checker plans around it
+_rate_limit = {"remaining": None, "reset": None}
+
+def _record_rate_limit(headers):
+    try:
+        if "X-RateLimit-Remaining" in headers:
+            _rate_limit["remaining"] = int(headers["X-RateLimit-Remaining"])
+        if "X-RateLimit-Reset" in headers:
+            _rate_limit["reset"] = int(headers["X-RateLimit-Reset"])
+    except ValueError:
+        pass
+
+def get_rate_limit():
+    """Returns {"remaining": int|None, "reset": unix time|None} from the latest API response."""
+    return dict(_rate_limit)
+
+def _max_age_from(headers):
+    # GitHub sends "Cache-Control: public, max-age=60, s-maxage=60"
+    for part in headers.get("Cache-Control", "").split(","):
+        part = part.strip()
+        if part.startswith("max-age="):
+            try:
+                return int(part.split("=", 1)[1])
+            except ValueError:
+                return 0
+    return 0
+
+def github_get_json(url):
+    """GET a GitHub API url through the shared session and the on-disk response cache.
+    Returns (status_code, data). A fresh cache hit or a 304 revalidation is reported as
+    200 with the cached body; if the network is down, a stale cached body is returned too."""
+    entry = _load_http_cache_entry(url)
+    now = time.time()
+    if entry and entry.get("expires", 0) > now:
+        return 200, entry["body"]
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = http_request('GET', url, headers=headers)
+    except (requests.RequestException, CircuitOpenError):
+        if entry:
+            return 200, entry["body"]
+        raise
+
+    _record_rate_limit(response.headers)
+    if response.status_code == 304 and entry:
+        entry["expires"] = now + _max_age_from(response.headers)
+        _save_http_cache_entry(url, entry)
+        return 200, entry["body"]
+    if response.status_code != 200:
+        return response.status_code, None
+
+    body = response.json()
+    _save_http_cache_entry(url, {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "expires": now + _max_age_from(response.headers),
+        "body": body,
+    })
+    return 200, body
+
+# --- Release backends ---
+# every release lookup goes through get_release_backend(source), so the app can run off a
+# local mirror (a folder, or the same folder served over the LAN) instead of GitHub.
+# settings -> release_source: empty for GitHub, otherwise a folder path or http(s) url.
+# a mirror is laid out like the GitHub API paths it stands in for:
+#   repos/<owner>/<repo>/releases.json                  the full release list, GitHub's JSON as-is
+#   repos/<owner>/<repo>/assets/<asset id>/<asset name> the mirrored release assets
+# and is filled with: python main.py --sync-mirror <folder> [--releases N] [--source <other mirror>]
+GITHUB_API_BASE = "https://api.github.com"
+DASHBOARD_RELEASE_REPO = ('misterwaztaken', 'xbox360-dashboard-collection')
+MIRROR_SYNC_DEFAULT_RELEASES = 5 # newest releases per repo whose assets get mirrored
+
+class GitHubReleaseBackend:
+    """Release lookups straight against the GitHub REST API (cached, see github_get_json)."""
+    name = "GitHub"
+
+    def list_releases(self, owner, repo, page=1, per_page=RELEASES_PER_PAGE):
+        return github_get_json(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases?per_page={per_page}&page={page}")
+
+    def get_release(self, owner, repo, tag=None):
+        """A single release by tag, or the latest one when tag is None."""
+        suffix = f"tags/{tag}" if tag else "latest"
+        return github_get_json(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/{suffix}")
+
+class MirrorReleaseBackend:
+    """Release lookups against a mirror folder or a LAN http server hosting one."""
+
+    def __init__(self, root):
+        self.root = root.rstrip('/\\')
+        self.is_http = self.root.lower().startswith(('http://', 'https://'))
+        self.name = f"Mirror ({self.root})"
+
+    def _location(self, *parts):
+        if self.is_http:
+            return "/".join((self.root,) + tuple(requests.utils.quote(p) for p in parts))
+        return os.path.join(self.root, *parts)
+
+    def _load(self, owner, repo):
+        location = self._location('repos', owner, repo, 'releases.json')
+        if self.is_http:
+            status_code, releases = github_get_json(location)
+            if status_code != 200:
+                return status_code, None
+        else:
+            try:
+                with open(location, 'r', encoding='utf-8') as f:
+                    releases = json.load(f)
+            except FileNotFoundError:
+                return 404, None
+        # point assets at the mirror instead of github
+        for release in releases:
+            for asset in release.get('assets', []):
+                asset['browser_download_url'] = self._location('repos', owner, repo, 'assets', str(asset['id']), asset['name'])
+        return 200, releases
+
+    def list_releases(self, owner, repo, page=1, per_page=RELEASES_PER_PAGE):
+        status_code, releases = self._load(owner, repo)
+        if status_code != 200:
+            return status_code, None
+        return 200, releases[(page - 1) * per_page:page * per_page]
+
+    def get_release(self, owner, repo, tag=None):
+        status_code, releases = self._load(owner, repo)
+        if status_code != 200:
+            return status_code, None
+        for release in releases:
+            if tag and release.get('tag_name') == tag:
+                return 200, release
+            # like github, "latest" is the newest release that isn't a draft or prerelease
+            if not tag and not release.get('draft') and not release.get('prerelease'):
+                return 200, release
+        return 404, None
+
+def get_release_backend(source):
+    """The backend for a release source: a mirror folder or http(s) url, GitHub when empty.
+    The UI passes settings -> release_source, --sync-mirror its --source option."""
+    source = (source or '').strip()
+    if source:
+        return MirrorReleaseBackend(source)
+    return GitHubReleaseBackend()
+
+def sync_release_mirror(mirror_dir, releases_with_assets=MIRROR_SYNC_DEFAULT_RELEASES, source=''):
+    """Copy every known repo's release list from source (GitHub when empty, or another mirror)
+    into mirror_dir, plus the assets of the newest releases_with_assets releases of each
+    (all dashboard releases are mirrored)."""
+    upstream = get_release_backend(source)
+    repos = list(XENIA_RELEASE_REPOS.values()) + [DASHBOARD_RELEASE_REPO]
+    for owner, repo in dict.fromkeys(repos):  # the older canary repo shows up once
+        releases = []
+        page = 1
+        while True:
+            status_code, batch = upstream.list_releases(owner, repo, page=page, per_page=100)
+            if status_code != 200:
+                raise Exception(f"Failed to fetch releases for {owner}/{repo}: HTTP {status_code}")
+            releases.extend(batch)
+            if len(batch) < 100:
+                break
+            page += 1
+        repo_dir = os.path.join(mirror_dir, 'repos', owner, repo)
+        os.makedirs(repo_dir, exist_ok=True)
+
+        wanted = releases if (owner, repo) == DASHBOARD_RELEASE_REPO else releases[:releases_with_assets]
+        for release in wanted:
+            for asset in release.get('assets', []):
+                dest = os.path.join(repo_dir, 'assets', str(asset['id']), asset['name'])
+                if os.path.exists(dest) and os.path.getsize(dest) == asset.get('size'):
+                    sha256 = asset_sha256(asset) or _hash_file(dest)
+                else:
+                    print(f"  downloading {release.get('tag_name')} / {asset['name']} ({format_bytes(asset.get('size', 0))})")
+                    url = asset['browser_download_url']
+                    if url.lower().startswith(('http://', 'https://')):
+                        sha256 = download_file(url, dest, expected_sha256=asset_sha256(asset))
+                    else:
+                        sha256 = copy_mirror_asset(url, dest, asset_sha256(asset))
+                # releases.json doubles as the mirror's checksum manifest, fill in what GitHub didn't publish
+                asset['digest'] = f"sha256:{sha256}"
+
+        with open(os.path.join(repo_dir, 'releases.json.tmp'), 'w', encoding='utf-8') as f:
+            json.dump(releases, f)
+        os.replace(os.path.join(repo_dir, 'releases.json.tmp'), os.path.join(repo_dir, 'releases.json'))
+        print(f"{owner}/{repo}: {len(releases)} release(s)")
+
+# --- Transfer progress ---
+# every download, extract and import reports into a TransferProgress so the UI can show
+# bytes, a smoothed rate and an ETA, and so the per-stage timings (fetch, download,
+# verify, extract, copy) tell a slow mirror apart from a slow disk when installs drag
+TRANSFER_STAGES = ('fetch', 'download', 'verify', 'extract', 'copy', 'remove')
+TRANSFER_RATE_SMOOTHING = 0.3 # weight of the newest sample in the throughput average
+TRANSFER_SAMPLE_INTERVAL = 0.25 # seconds between throughput samples
+
+# --- Progress events ---
+# workers never call into Tk. a TransferProgress publishes itself into progress_events
+# when it changes (at most every PROGRESS_EVENT_INTERVAL, plus every stage change and
+# finish), and never has more than one event waiting, however fast the bytes arrive.
+# the UI drains the queue on an after() timer every PROGRESS_DRAIN_MS and hands the
+# latest snapshot of each transfer to whoever subscribed to it
+PROGRESS_EVENT_INTERVAL = 0.1 # seconds between events from one transfer
+PROGRESS_DRAIN_MS = 100 # how often the Tk thread looks at the queue
+
+progress_events = queue.Queue()
+_progress_subscribers = [] # (transfer or None for all, callback(transfer, snapshot)), Tk thread only
+
+def subscribe_progress(callback, transfer=None):
+    """Call callback(transfer, snapshot) on the Tk thread whenever transfer (or any
+    transfer, when None) publishes progress. Returns a token for unsubscribe_progress."""
+    token = (transfer, callback)
+    _progress_subscribers.append(token)
+    return token
+
+def unsubscribe_progress(token):
+    if token in _progress_subscribers:
+        _progress_subscribers.remove(token)
+
+def drain_progress_events():
+    """Tk thread: dispatch every transfer that published since the last drain, then re-arm."""
+    changed = []
+    while True:
+        try:
+            transfer = progress_events.get_nowait()
+        except queue.Empty:
+            break
+        changed.append(transfer)
+    for transfer in changed:
+        snapshot = transfer._take_event()
+        for wanted, callback in list(_progress_subscribers):
+            if wanted is None or wanted is transfer:
+                try:
+                    callback(transfer, snapshot)
+                except Exception as e:
+                    print(f"Warning: progress subscriber failed for {transfer.name}: {e}")
+    root.after(PROGRESS_DRAIN_MS, drain_progress_events)
+
+def format_bytes(n):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(n) < 1024 or unit == 'GB':
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+class TransferProgress:
+    """Byte progress, smoothed throughput, ETA and per-stage timings for one transfer.
+    Safe to update from worker threads; the UI gets it through subscribe_progress()
+    or reads it with snapshot()/describe()."""
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self.stage = None
+        self.status = "Queued"
+        self.done = 0
+        self.total = 0
+        self.rate = 0.0
+        self.stage_times = {}  # stage -> seconds spent
+        self.stage_bytes = {}  # stage -> bytes moved
+        self._stage_started = None
+        self._sample_time = None
+        self._sample_done = 0
+        self.finished = False
+        self._published = 0.0
+        self._event_pending = False
+
+    def _publish(self, force=False):
+        # called with self._lock held; queues at most one event per transfer
+        now = time.monotonic()
+        if self._event_pending or (not force and now - self._published < PROGRESS_EVENT_INTERVAL):
+            return
+        self._event_pending = True
+        self._published = now
+        progress_events.put(self)
+
+    def _take_event(self):
+        with self._lock:
+            self._event_pending = False
+        return self.snapshot()
+
+    def _close_stage(self, now):
+        if self.stage and self._stage_started is not None:
+            self.stage_times[self.stage] = self.stage_times.get(self.stage, 0.0) + now - self._stage_started
+            self.stage_bytes[self.stage] = self.stage_bytes.get(self.stage, 0) + self.done
+
+    def start_stage(self, stage, total=0, status=None):
+        now = time.monotonic()
+        with self._lock:
+            self._close_stage(now)
+            self.stage = stage
+            self.status = status or stage.capitalize()
+            self.done = 0
+            self.total = total
+            self.rate = 0.0
+            self._stage_started = now
+            self._sample_time = now
+            self._sample_done = 0
+            self._publish(force=True)
+
+    def set_status(self, status):
+        with self._lock:
+            self.status = status
+            self._publish(force=True)
+
+    def update(self, done, total=None):
+        now = time.monotonic()
+        with self._lock:
+            self.done = done
+            if total is not None:
+                self.total = total
+            elapsed = now - self._sample_time if self._sample_time is not None else 0
+            if elapsed >= TRANSFER_SAMPLE_INTERVAL:
+                sample = (done - self._sample_done) / elapsed
+                self.rate = sample if not self.rate else TRANSFER_RATE_SMOOTHING * sample + (1 - TRANSFER_RATE_SMOOTHING) * self.rate
+                self._sample_time = now
+                self._sample_done = done
+            self._publish()
+
+    def finish(self, status="Done"):
+        with self._lock:
+            self._close_stage(time.monotonic())
+            self.stage = None
+            self._stage_started = None
+            self.status = status
+            self.finished = True
+            self._publish(force=True)
+
+    def eta(self):
+        with self._lock:
+            if not self.rate or not self.total or self.done >= self.total:
+                return None
+            return (self.total - self.done) / self.rate
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'name': self.name, 'stage': self.stage, 'status': self.status,
+                'done': self.done, 'total': self.total, 'rate': self.rate,
+                'stage_times': dict(self.stage_times), 'finished': self.finished,
+            }
+
+    def describe(self):
+        """Short progress line, e.g. '12.3 MB / 40.0 MB, 5.2 MB/s, ETA 0:05'."""
+        snap = self.snapshot()
+        if not snap['total'] and not snap['done']:
+            return ""
+        text = format_bytes(snap['done'])
+        if snap['total']:
+            text += f" / {format_bytes(snap['total'])}"
+        if snap['rate']:
+            text += f", {format_bytes(snap['rate'])}/s"
+        eta = self.eta()
+        if eta is not None:
+            text += f", ETA {format_duration(eta)}"
+        return text
+
+    def summary(self):
+        """Per-stage timing line, e.g. 'fetch 0.3s, download 12.1s (8.2 MB/s), extract 2.0s (40.1 MB/s)',
+        or '' when no stage ran."""
+        with self._lock:
+            parts = []
+            for stage in TRANSFER_STAGES:
+                if stage not in self.stage_times:
+                    continue
+                seconds = self.stage_times[stage]
+                moved = self.stage_bytes.get(stage, 0)
+                part = f"{stage} {seconds:.1f}s"
+                if moved and seconds > 0:
+                    part += f" ({format_bytes(moved / seconds)}/s)"
+                parts.append(part)
+            return f"{self.name}: " + ", ".join(parts) if parts else ""
+
+def copy_file_with_progress(src, dest, progress=None, done=0, hasher=None):
+    """shutil.copy2 that calls progress(done) as it goes (e.g. TransferProgress.update).
+    done is the running byte count to start from; the new running count is returned.
+    hasher (a hashlib object) is fed every block on the way through."""
+    with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+        for block in iter(lambda: fsrc.read(DOWNLOAD_CHUNK_SIZE * 16), b''):
+            fdst.write(block)
+            if hasher:
+                hasher.update(block)
+            done += len(block)
+            if progress:
+                progress(done)
+    shutil.copystat(src, dest)
+    return done
+
+# --- Downloads ---
+# downloads land in "<dest>.part" next to a "<dest>.part.json" sidecar recording the url,
+# validators and bytes received, so a dropped connection (or a later install of the
+# same asset) continues with a Range request instead of starting from byte zero.
+# the SHA-256 is computed from the stream as it's written, so checking the file against
+# a published digest needs no second pass over it (only a resumed partial's existing
+# bytes are read back once, to bring the hash up to where the transfer continues)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_SEGMENTS = 4 # concurrent connections per large asset
+SEGMENTED_MIN_SIZE = 8 * 1024 * 1024 # smaller files aren't worth splitting
+
+def _load_partial_meta(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+def _save_partial_meta(meta_path, meta):
+    try:
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+    except Exception as e:
+        print(f"Warning: Failed to write download metadata {meta_path}: {e}")
+
+def _hash_into(hasher, path, start, end):
+    """Feed bytes [start, end) of path to hasher."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(remaining, DOWNLOAD_CHUNK_SIZE * 16))
+            if not block:
+                raise Exception(f"{os.path.basename(path)} is shorter than expected")
+            hasher.update(block)
+            remaining -= len(block)
+    return end
+
+def _discard_partial(part_path, meta_path):
+    for p in (part_path, meta_path):
+        try:
+            if os.path.exists(p):
+                os.remove(p)
+        except Exception:
+            pass
+
+def _probe_segmented(url, segments):
+    """HEAD the url and, if the server takes byte ranges and the file is big enough to be
+    worth splitting, return fresh download metadata with the segment table filled in."""
+    try:
+        response = http_request('HEAD', url, allow_redirects=True)
+    except (requests.RequestException, CircuitOpenError):
+        return None
+    if response.status_code != 200 or response.headers.get('Accept-Ranges', '').lower() != 'bytes':
+        return None
+    total = int(response.headers.get('content-length', 0))
+    if total < SEGMENTED_MIN_SIZE:
+        return None
+    segment_size = -(-total // segments)
+    return {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'total': total,
+        # [start, end (inclusive), bytes done] per segment
+        'segments': [[start, min(start + segment_size, total) - 1, 0] for start in range(0, total, segment_size)],
+    }
+
+def _download_segmented(url, part_path, meta_path, meta, progress, cancel, retries, stage=None):
+    """Fetch every unfinished segment of meta['segments'] concurrently into the preallocated
+    part file. Progress, cancellation and hashing are handled on the calling thread, which
+    hashes the file front to back as the leading ranges fill in (while the bytes are still
+    in the page cache); whatever is left unhashed once the last range is in is read back
+    as the 'verify' stage. Returns the SHA-256 hex digest."""
+    total = meta['total']
+    segments = meta['segments']
+    if not os.path.exists(part_path) or os.path.getsize(part_path) != total:
+        with open(part_path, 'wb') as f:
+            f.truncate(total)
+    validator = meta.get('etag') or meta.get('last_modified')
+    lock = threading.Lock()
+    stop = threading.Event()
+    changed = threading.Event()
+    hasher = hashlib.sha256()
+    hashed = 0
+
+    def contiguous():
+        # bytes from the start of the file that are all on disk
+        end = 0
+        for seg in segments:
+            end = seg[0] + seg[2]
+            if end <= seg[1]:
+                break
+        return end
+
+    def fetch_segment(segment):
+        attempt = 0
+        while True:
+            with lock:
+                offset = segment[0] + segment[2]
+            if offset > segment[1]:
+                return
+            headers = {'Range': f'bytes={offset}-{segment[1]}'}
+            if validator:
+                headers['If-Range'] = validator
+            try:
+                response = http_request('GET', url, stream=True, headers=headers)
+                if response.status_code != 206:
+                    response.close()
+                    changed.set()
+                    raise Exception(f"Remote file changed or ranges refused (HTTP {response.status_code})")
+                with open(part_path, 'r+b') as f:
+                    f.seek(offset)
+                    for data in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        if stop.is_set():
+                            response.close()
+                            return
+                        data = data[:segment[1] + 1 - offset]  # never write past our own range
+                        f.write(data)
+                        f.flush()  # the hashing thread reads it back as soon as it's counted
+                        offset += len(data)
+                        with lock:
+                            segment[2] += len(data)
+            except (requests.RequestException, CircuitOpenError) as e:
+                # an open breaker usually means the other segments hit the same blip; wait it
+                # out like any other retry. waiting on someone else's trial request is free
+                waiting_on_trial = isinstance(e, CircuitOpenError) and not e.retry_after
+                if not waiting_on_trial:
+                    attempt += 1
+                if attempt > retries:
+                    raise Exception(f"Segment {segment[0]}-{segment[1]} failed after {attempt - 1} retries: {e}")
+                delay = max(backoff_delay(attempt), getattr(e, 'retry_after', 0), CIRCUIT_TRIAL_POLL if waiting_on_trial else 0)
+                print(f"Warning: segment {segment[0]}-{segment[1]} of {url} interrupted ({e}), resuming in {delay:.1f}s ({attempt}/{retries})...")
+                if stop.wait(delay):
+                    return
+
+    try:
+        pending = [seg for seg in segments if seg[0] + seg[2] <= seg[1]]
+        # segments get their own short-lived pool so a download started from the network pool can't starve it
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(pending)), thread_name_prefix="xm-seg") as pool:
+            futures = [pool.submit(fetch_segment, seg) for seg in pending]
+            last_saved = time.monotonic()
+            try:
+                while futures:
+                    done, not_done = concurrent.futures.wait(futures, timeout=0.1, return_when=concurrent.futures.FIRST_EXCEPTION)
+                    for future in done:
+                        future.result()  # re-raise the first segment failure
+                    futures = list(not_done)
+                    with lock:
+                        received = sum(seg[2] for seg in segments)
+                        frontier = contiguous()
+                        if time.monotonic() - last_saved >= 1.0:
+                            _save_partial_meta(meta_path, meta)
+                            last_saved = time.monotonic()
+                    hashed = _hash_into(hasher, part_path, hashed, frontier)
+                    if cancel and cancel():
+                        raise Exception("Download cancelled by user")
+                    if progress:
+                        progress(received, total)
+            finally:
+                stop.set()
+                with lock:
+                    _save_partial_meta(meta_path, meta)
+    except Exception:
+        if changed.is_set():
+            # the partial belongs to an older file, resuming from it would corrupt the download
+            _discard_partial(part_path, meta_path)
+        raise
+
+    if sum(seg[2] for seg in segments) != total:
+        raise Exception("Segmented download finished with missing ranges")
+    if hashed < total:
+        if stage:
+            stage('verify', total - hashed, "Verifying")
+        _hash_into(hasher, part_path, hashed, total)
+        if progress:
+            progress(total - hashed, total - hashed)
+    return hasher.hexdigest()
+
+def _check_sha256(digest, expected_sha256, part_path, meta_path):
+    if expected_sha256 and digest != expected_sha256.lower():
+        # corrupt, never let it be resumed from or extracted
+        _discard_partial(part_path, meta_path)
+        raise Exception(f"Checksum mismatch: got sha256 {digest}, expected {expected_sha256}")
+
+def download_file(url, dest_path, progress=None, cancel=None, retries=3, segments=DOWNLOAD_SEGMENTS, expected_sha256=None, stage=None):
+    """Download url to dest_path, resuming any partial download left by an earlier attempt.
+    Large files on servers that advertise Accept-Ranges are split into byte ranges fetched
+    over several connections; everything else is a single resumable stream.
+    Returns the SHA-256 hex digest of the file, computed while it was written.
+    :param progress: optional callable(downloaded, total) called as data arrives (total may be 0)
+    :param cancel: optional callable returning True when the download should stop
+    :param retries: how many times a dropped connection is resumed before giving up
+    :param segments: number of concurrent connections for large files (1 disables splitting)
+    :param expected_sha256: optional hex digest; on a mismatch the file is discarded and an Exception raised
+    :param stage: optional callable(name, total, status) like TransferProgress.start_stage; reading finished
+        bytes back to complete the hash is reported as 'verify' (progress then counts those bytes)
+    """
+    part_path = dest_path + '.part'
+    meta_path = dest_path + '.part.json'
+    os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+
+    meta = _load_partial_meta(meta_path)
+    if not meta or meta.get('url') != url or not os.path.exists(part_path):
+        _discard_partial(part_path, meta_path)
+        meta = None
+    if meta is None and segments > 1:
+        meta = _probe_segmented(url, segments)
+    if meta and meta.get('segments'):
+        # a segmented partial is preallocated to the full size with holes where ranges are
+        # still missing, so it's only ever resumed segment by segment, whatever segments is now
+        digest = _download_segmented(url, part_path, meta_path, meta, progress, cancel, retries, stage)
+        _check_sha256(digest, expected_sha256, part_path, meta_path)
+        os.replace(part_path, dest_path)
+        _discard_partial(part_path, meta_path)
+        return digest
+
+    hasher = hashlib.sha256()
+    hashed = 0
+    attempt = 0
+    while True:
+        meta = _load_partial_meta(meta_path)
+        if not meta or meta.get('url') != url or meta.get('segments') or not os.path.exists(part_path):
+            # (a segmented partial's size says nothing about how much of it is there)
+            _discard_partial(part_path, meta_path)
+            meta = {'url': url, 'etag': None, 'last_modified': None, 'total': 0, 'received': 0}
+        # the file on disk is the source of truth for how much we really have
+        received = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+        headers = {}
+        if received:
+            headers['Range'] = f'bytes={received}-'
+            validator = meta.get('etag') or meta.get('last_modified')
+            if validator:
+                headers['If-Range'] = validator
+
+        try:
+            response = http_request('GET', url, stream=True, headers=headers)
+            if response.status_code == 416 and received:
+                response.close()
+                if received == meta.get('total'):
+                    # we already had every byte, the previous run just didn't get to finish up
+                    break
+                # the partial is longer than the file now is, start over
+                _discard_partial(part_path, meta_path)
+                continue
+            if response.status_code == 206:
+                mode = 'ab'
+                content_range = response.headers.get('Content-Range', '')  # bytes start-end/total
+                total = int(content_range.rsplit('/', 1)[1]) if '/' in content_range and not content_range.endswith('*') else 0
+            elif response.status_code == 200:
+                # no range support, or the file changed since the partial was written
+                mode = 'wb'
+                received = 0
+                total = int(response.headers.get('content-length', 0))
+            else:
+                response.close()
+                raise Exception(f"HTTP {response.status_code}")
+            if hashed != received:
+                # restarted, or resuming a partial from an earlier run: hash what's already there
+                hasher = hashlib.sha256()
+                hashed = _hash_into(hasher, part_path, 0, received)
+
+            meta.update({
+                'etag': response.headers.get('ETag') or meta.get('etag'),
+                'last_modified': response.headers.get('Last-Modified') or meta.get('last_modified'),
+                'total': total,
+                'received': received,
+            })
+            _save_partial_meta(meta_path, meta)
+
+            with open(part_path, mode) as f:
+                for data in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    if cancel and cancel():
+                        raise Exception("Download cancelled by user")
+                    f.write(data)
+                    hasher.update(data)
+                    received += len(data)
+                    hashed = received
+                    if progress:
+                        progress(received, total)
+            meta['received'] = received
+            _save_partial_meta(meta_path, meta)
+            break
+        except (requests.RequestException, CircuitOpenError) as e:
+            attempt += 1
+            if attempt > retries or isinstance(e, CircuitOpenError):
+                raise Exception(f"Download failed after {attempt - 1} retries: {e}")
+            delay = backoff_delay(attempt)
+            print(f"Warning: download of {url} interrupted ({e}), resuming in {delay:.1f}s ({attempt}/{retries})...")
+            time.sleep(delay)
+
+    size = os.path.getsize(part_path)
+    if meta.get('total') and size != meta['total']:
+        # a truncated or oversized file can't be trusted, don't resume from it either
+        _discard_partial(part_path, meta_path)
+        raise Exception(f"Downloaded size mismatch: got {size} bytes, expected {meta['total']}")
+    if hashed != size:
+        # the previous run already had every byte (416 above)
+        if stage:
+            stage('verify', size, "Verifying")
+        hasher = hashlib.sha256()
+        _hash_into(hasher, part_path, 0, size)
+        if progress:
+            progress(size, size)
+    digest = hasher.hexdigest()
+    _check_sha256(digest, expected_sha256, part_path, meta_path)
+    os.replace(part_path, dest_path)
+    _discard_partial(part_path, meta_path)
+    return digest
+
+# --- Asset cache ---
+# downloaded release assets are kept under cache/assets, keyed by the GitHub asset id
+# and size, so reinstalling or rolling back to a build we already fetched needs no
+# network at all. the least recently used assets are evicted past the size cap
+# (settings -> asset_cache_mb, 0 disables the cache; applied with set_asset_cache_limit
+# on the Tk thread, the job workers only read the resulting byte count)
+ASSET_CACHE_DIR = os.path.join(CACHE_DIR, "assets")
+ASSET_CACHE_DEFAULT_MB = 2048
+
+_asset_cache_lock = threading.Lock()
+_asset_cache_bytes = ASSET_CACHE_DEFAULT_MB * 1024 * 1024
+
+def asset_cache_key(asset):
+    return f"{asset['id']}-{asset['size']}"
+
+def asset_sha256(asset):
+    """The SHA-256 published for an asset ("digest": "sha256:<hex>" on GitHub, and in a
+    mirror's releases.json), or None when there isn't one."""
+    digest = (asset or {}).get('digest') or ''
+    if digest.lower().startswith('sha256:'):
+        return digest.split(':', 1)[1].lower()
+    return None
+
+def set_asset_cache_limit(mb):
+    """Apply the asset_cache_mb setting; a value that isn't a number keeps the default."""
+    global _asset_cache_bytes
+    try:
+        _asset_cache_bytes = max(0, int(mb)) * 1024 * 1024
+    except (TypeError, ValueError):
+        print(f"Warning: Invalid asset_cache_mb setting {mb!r}, using {ASSET_CACHE_DEFAULT_MB} MB")
+        _asset_cache_bytes = ASSET_CACHE_DEFAULT_MB * 1024 * 1024
+
+def _asset_cache_limit():
+    return _asset_cache_bytes
+
+def _load_asset_index():
+    try:
+        with open(os.path.join(ASSET_CACHE_DIR, "index.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def _save_asset_index(index):
+    path = os.path.join(ASSET_CACHE_DIR, "index.json")
+    try:
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(path + '.tmp', path)
+    except Exception as e:
+        print(f"Warning: Failed to write asset cache index: {e}")
+
+def _evict_assets(index, limit, keep=None):
+    # oldest last_used goes first; the asset we're about to use is never evicted
+    total = sum(entry['size'] for entry in index.values())
+    for key, entry in sorted(index.items(), key=lambda item: item[1].get('last_used', 0)):
+        if total <= limit:
+            break
+        if key == keep:
+            continue
+        try:
+            os.remove(os.path.join(ASSET_CACHE_DIR, entry['file']))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Failed to evict cached asset {entry['file']}: {e}")
+            continue
+        total -= entry['size']
+        del index[key]
+
+def asset_cache_lookup(asset):
+    """Return (path, sha256) of the cached file for a GitHub release asset dict, or None."""
+    if not asset or 'id' not in asset or _asset_cache_limit() <= 0:
+        return None
+    key = asset_cache_key(asset)
+    with _asset_cache_lock:
+        index = _load_asset_index()
+        entry = index.get(key)
+        if not entry:
+            return None
+        path = os.path.join(ASSET_CACHE_DIR, entry['file'])
+        expected = asset_sha256(asset)
+        if not os.path.exists(path) or os.path.getsize(path) != entry['size'] \
+                or not entry.get('sha256') or (expected and entry['sha256'] != expected):
+            # gone, truncated, cached before digests were recorded, or not what was published
+            index.pop(key, None)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            _save_asset_index(index)
+            return None
+        entry['last_used'] = time.time()
+        _save_asset_index(index)
+        return path, entry['sha256']
+
+def asset_cache_store(asset, file_path, sha256):
+    """Move a freshly downloaded (and verified) asset into the cache. Returns the path to use
+    from now on (the cache copy, or file_path unchanged if the asset can't or shouldn't be cached)."""
+    limit = _asset_cache_limit()
+    if not asset or 'id' not in asset or limit <= 0 or asset.get('size', 0) > limit:
+        return file_path
+    key = asset_cache_key(asset)
+    filename = key + os.path.splitext(asset.get('name', ''))[1]
+    with _asset_cache_lock:
+        try:
+            os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+            cached_path = os.path.join(ASSET_CACHE_DIR, filename)
+            shutil.move(file_path, cached_path)
+        except Exception as e:
+            print(f"Warning: Failed to cache asset {asset.get('name')}: {e}")
+            return file_path
+        index = _load_asset_index()
+        index[key] = {
+            'file': filename,
+            'name': asset.get('name'),
+            'url': asset.get('browser_download_url'),
+            'sha256': sha256,  # computed while downloading, checked against the published digest
+            'size': os.path.getsize(cached_path),
+            'last_used': time.time(),
+        }
+        _evict_assets(index, limit, keep=key)
+        _save_asset_index(index)
+        return cached_path
+
+def copy_mirror_asset(source, dest_path, expected_sha256=None, progress=None):
+    """Copy a release asset out of a mirror folder, hashing it on the way; returns the sha256.
+    :param progress: optional callable(done_bytes)"""
+    os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+    hasher = hashlib.sha256()
+    copy_file_with_progress(source, dest_path, progress, hasher=hasher)
+    sha256 = hasher.hexdigest()
+    if expected_sha256 and sha256 != expected_sha256:
+        os.remove(dest_path)
+        raise Exception(f"Checksum mismatch for {os.path.basename(source)}: got sha256 {sha256}, expected {expected_sha256}")
+    return sha256
+
+def fetch_release_asset(asset, download_path, progress=None, cancel=None, stage=None):
+    """Return (path, sha256) of a local file holding a GitHub release asset: straight from the
+    asset cache if we have it, otherwise downloaded to download_path and then added to the cache.
+    The SHA-256 is computed while the file streams in and checked against the published
+    digest (or at least the published size), so a corrupt or truncated file raises here,
+    before anything extracts it. The returned file may live in the cache, so callers must
+    not modify or delete it. stage is passed on to download_file."""
+    cached = asset_cache_lookup(asset)
+    if cached:
+        if progress:
+            progress(asset['size'], asset['size'])
+        return cached
+    expected = asset_sha256(asset)
+    source = asset['browser_download_url']
+    if source.lower().startswith(('http://', 'https://')):
+        sha256 = download_file(source, download_path, progress=progress, cancel=cancel, expected_sha256=expected, stage=stage)
+    else:
+        # asset from a mirror folder (local disk or network share)
+        sha256 = copy_mirror_asset(source, download_path, expected, (lambda done: progress(done, asset['size'])) if progress else None)
+    size = os.path.getsize(download_path)
+    if asset.get('size') and size != asset['size']:
+        os.remove(download_path)
+        raise Exception(f"{asset['name']} is truncated: got {size} bytes, expected {asset['size']}")
+    if not expected:
+        print(f"Warning: no published digest for {asset['name']}, only its size was checked (sha256 {sha256})")
+    return asset_cache_store(asset, download_path, sha256), sha256
+
+# --- Installing ---
+# zip members are streamed straight into a staging folder next to the target
+# version folder, which is then swapped in with renames (same volume, so no copy).
+# no temp extract tree, no second copy pass, and a failed install never leaves a
+# half-written version folder behind
+INSTALL_COPY_BUFFER = 1024 * 1024
+
+# installed files are also hashed into a shared object store (versions/.objects) and
+# hardlinked into each version folder, so content shared between builds (licenses,
+# data files, sometimes whole binaries) is only on disk once. an object whose link
+# count drops to 1 is referenced by no version any more and can be reclaimed.
+# user-editable files are never shared so editing one can't leak into other builds
+VERSION_OBJECTS_DIR = os.path.join(os.path.dirname(__file__), 'versions', '.objects')
+UNSHARED_EXTENSIONS = ('.toml', '.ini', '.cfg', '.log')
+
+def _link_from_store(path, digest):
+    """Replace path with a hardlink to the store object for digest, adding it to the store if new."""
+    if os.path.splitext(path)[1].lower() in UNSHARED_EXTENSIONS or os.path.getsize(path) == 0:
+        return
+    obj_path = os.path.join(VERSION_OBJECTS_DIR, digest[:2], digest)
+    try:
+        os.makedirs(os.path.dirname(obj_path), exist_ok=True)
+        try:
+            # first time we've seen this content: the staged file itself becomes the object
+            os.link(path, obj_path)
+            return
+        except FileExistsError:
+            pass
+        link_tmp = path + '.link'
+        os.link(obj_path, link_tmp)
+        os.replace(link_tmp, path)
+    except OSError as e:
+        # no hardlinks on this drive (FAT32/exFAT), keep the plain copy
+        print(f"Warning: Could not share {os.path.basename(path)} through the object store: {e}")
+
+def _hash_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(INSTALL_COPY_BUFFER), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def collect_version_objects():
+    """Delete store objects no installed version links to any more. Returns bytes freed."""
+    freed = 0
+    if not os.path.isdir(VERSION_OBJECTS_DIR):
+        return freed
+    for root_dir, dirs, files in os.walk(VERSION_OBJECTS_DIR):
+        for fn in files:
+            obj_path = os.path.join(root_dir, fn)
+            try:
+                st = os.stat(obj_path)
+                if st.st_nlink <= 1:
+                    os.remove(obj_path)
+                    freed += st.st_size
+            except Exception as e:
+                print(f"Warning: Failed to collect {obj_path}: {e}")
+    return freed
+
+def _staging_dir_for(dest_dir):
+    # hidden (dot-prefixed) sibling of dest_dir; scan_installed_emulators skips these, so a
+    # staging or .old folder left behind by a crash never shows up as an installed version
+    dest_dir = os.path.abspath(dest_dir)
+    return os.path.join(os.path.dirname(dest_dir), f".{os.path.basename(dest_dir)}.staging-{os.getpid()}-{threading.get_ident()}")
+
+def swap_in_dir(staging_dir, dest_dir):
+    """Replace dest_dir with staging_dir using renames only."""
+    dest_dir = os.path.abspath(dest_dir)
+    old_dir = None
+    if os.path.exists(dest_dir):
+        # windows can't rename over a non-empty folder, so move the old one aside first
+        old_dir = f"{_staging_dir_for(dest_dir)}.old"
+        os.rename(dest_dir, old_dir)
+    try:
+        os.rename(staging_dir, dest_dir)
+    except Exception:
+        if old_dir:
+            os.rename(old_dir, dest_dir)
+        raise
+    if old_dir:
+        shutil.rmtree(old_dir, ignore_errors=True)
+        collect_version_objects()
+
+def install_zip_to_dir(zip_path, dest_dir, progress=None, cancel=None):
+    """Stream every member of zip_path into dest_dir (replacing its contents).
+    :param progress: optional callable(done_bytes, total_bytes) over uncompressed sizes
+    :param cancel: optional callable returning True when the install should stop
+    """
+    staging_dir = _staging_dir_for(dest_dir)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            members = zf.infolist()
+            total = sum(m.file_size for m in members)
+            done = 0
+            for member in members:
+                if cancel and cancel():
+                    raise Exception("Install cancelled by user")
+                # refuse absolute paths and ../ tricks, everything has to land inside staging
+                rel_path = os.path.normpath(member.filename.replace('\\', '/'))
+                # (normpath leaves '..' only at the front; '..hidden' is an ordinary name)
+                if os.path.isabs(rel_path) or rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep) \
+                        or os.path.splitdrive(rel_path)[0]:
+                    raise Exception(f"Refusing to extract unsafe path: {member.filename}")
+                target = os.path.join(staging_dir, rel_path)
+                if member.is_dir():
+                    os.makedirs(target, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                # hash while writing so sharing through the object store needs no second read
+                h = hashlib.sha256()
+                with zf.open(member) as src, open(target, 'wb') as dst:
+                    for block in iter(lambda: src.read(INSTALL_COPY_BUFFER), b''):
+                        h.update(block)
+                        dst.write(block)
+                _link_from_store(target, h.hexdigest())
+                done += member.file_size
+                if progress:
+                    progress(done, total)
+        swap_in_dir(staging_dir, dest_dir)
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+def install_file_to_dir(file_path, dest_dir, filename=None):
+    """Copy a single downloaded file (e.g. a bare .exe release) into dest_dir, replacing its contents."""
+    staging_dir = _staging_dir_for(dest_dir)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+    try:
+        target = os.path.join(staging_dir, filename or os.path.basename(file_path))
+        shutil.copy2(file_path, target)
+        _link_from_store(target, _hash_file(target))
+        swap_in_dir(staging_dir, dest_dir)
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+# --- Job queue ---
+# every download/install runs as a Job on one shared queue: jobs run on worker threads
+# (never touching Tk), at most max_workers at a time, lowest priority number first.
+# each job gets its own staging folder under temp/jobs/<key>, named after what it
+# installs, so a retried job resumes the partial download its previous attempt left.
+# finished jobs are handed back to the Tk thread, where their on_done callback runs
+JOB_PRIORITY_USER = 0 # the user is waiting on it (install from the Update tab, ...)
+JOB_PRIORITY_NORMAL = 10 # batch work the user asked for (dashboard collections)
+JOB_PRIORITY_BACKGROUND = 20 # prefetching nobody is waiting on yet
+JOB_PRIORITY_NAMES = {JOB_PRIORITY_USER: "User", JOB_PRIORITY_NORMAL: "Normal", JOB_PRIORITY_BACKGROUND: "Background"}
+JOB_QUEUE_DEFAULT_WORKERS = 3
+JOB_QUEUE_MAX_WORKERS = 8 # upper bound offered in the jobs panel
+JOB_HISTORY_LIMIT = 50 # finished jobs kept around for the Jobs panel
+JOBS_DIR = os.path.join(TEMP_DIR, "jobs")
+
+class Job:
+    """One unit of download/install work. func(job) runs on a worker thread, reports into
+    job.transfer, checks job.cancelled() and returns a result handed to on_done(job)."""
+
+    _ids = iter(range(1, 1 << 62))
+
+    def __init__(self, name, func, priority=JOB_PRIORITY_NORMAL, key=None, on_done=None):
+        self.id = next(Job._ids)
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.key = key or f"job-{self.id}"
+        self.on_done = on_done
+        self.transfer = TransferProgress(name)
+        self.state = "queued" # queued -> running -> done / failed / cancelled
+        self.error = None
+        self.result = None
+        self.batch = None # the JobBatch it was queued with, if any
+        self._cancel = threading.Event()
+
+    @property
+    def staging_dir(self):
+        safe_key = "".join(c if c.isalnum() or c in "-_." else "_" for c in self.key)
+        return os.path.join(JOBS_DIR, safe_key)
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def clone(self):
+        return Job(self.name, self.func, self.priority, self.key, self.on_done)
+
+class JobBatch:
+    """Jobs queued together (e.g. a dashboard collection). The Jobs panel lists them under
+    one row showing the batch's overall progress. Only used from the Tk thread."""
+
+    _ids = iter(range(1, 1 << 62))
+
+    def __init__(self, name):
+        self.id = f"batch-{next(JobBatch._ids)}"
+        self.name = name
+        self.jobs = {} # job key -> latest job for it (a retry replaces the attempt it retries)
+        self.sizes = {} # job key -> bytes its download stage moves
+
+    def add(self, job, size=None):
+        job.batch = self
+        self.jobs[job.key] = job
+        if size is not None or job.key not in self.sizes:
+            self.sizes[job.key] = size or 0
+
+    def overall(self):
+        """(finished jobs, failed jobs, jobs, bytes downloaded, bytes to download)."""
+        finished = failed = done_bytes = 0
+        for key, job in self.jobs.items():
+            size = self.sizes[key]
+            if job.state in ("done", "failed", "cancelled"):
+                finished += 1
+                failed += job.state != "done"
+                done_bytes += size if job.state == "done" else 0
+            elif job.state == "running":
+                snap = job.transfer.snapshot()
+                if snap['stage'] == 'download':
+                    done_bytes += min(snap['done'], size)
+                elif snap['stage'] not in (None, 'fetch'):
+                    done_bytes += size  # downloaded, now verifying / extracting
+        return finished, failed, len(self.jobs), done_bytes, sum(self.sizes.values())
+
+class JobQueue:
+    """Priority queue of Jobs run by a capped number of worker threads."""
+
+    def __init__(self, max_workers=JOB_QUEUE_DEFAULT_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._cond = threading.Condition()
+        self._heap = [] # (priority, id, job)
+        self._jobs = [] # everything submitted, oldest first (for the Jobs panel)
+        self._threads = []
+        self._running = 0
+        self.finished = queue.Queue() # jobs whose on_done still has to run on the Tk thread
+
+    def jobs(self):
+        with self._cond:
+            return list(self._jobs)
+
+    def submit(self, job):
+        """Queue job, or return the queued/running job that already works on the same key."""
+        with self._cond:
+            for other in self._jobs:
+                if other.key == job.key and other.state in ("queued", "running"):
+                    if job.priority < other.priority and other.state == "queued":
+                        # the user now wants what was only being prefetched: bump it
+                        other.priority = job.priority
+                        self._heap = [(o.priority, o.id, o) for _, _, o in self._heap]
+                        heapq.heapify(self._heap)
+                    return other
+            self._jobs.append(job)
+            heapq.heappush(self._heap, (job.priority, job.id, job))
+            self._ensure_workers()
+            self._cond.notify()
+            return job
+
+    def cancel(self, job):
+        with self._cond:
+            if job.state == "queued":
+                self._heap = [entry for entry in self._heap if entry[2] is not job]
+                heapq.heapify(self._heap)
+                job._cancel.set()
+                job.state = "cancelled"
+                job.transfer.finish("Cancelled")
+                self.finished.put(job)
+            elif job.state == "running":
+                job._cancel.set()
+                job.transfer.set_status("Cancelling")
+
+    def retry(self, job):
+        if job.state not in ("failed", "cancelled"):
+            return job
+        clone = job.clone()
+        accepted = self.submit(clone)
+        if accepted is clone and job.batch:
+            job.batch.add(clone)
+        return accepted
+
+    def clear_finished(self):
+        with self._cond:
+            self._jobs = [job for job in self._jobs if job.state in ("queued", "running")]
+
+    def set_max_workers(self, max_workers):
+        with self._cond:
+            self.max_workers = max(1, int(max_workers))
+            if self._heap:
+                self._ensure_workers()
+            # extra threads from a higher cap just stay idle, the running count gates them
+            self._cond.notify_all()
+
+    def _ensure_workers(self):
+        while len(self._threads) < self.max_workers:
+            thread = threading.Thread(target=self._worker, name=f"xm-job-{len(self._threads) + 1}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._heap or self._running >= self.max_workers:
+                    self._cond.wait()
+                _, _, job = heapq.heappop(self._heap)
+                job.state = "running"
+                self._running += 1
+            self._run(job)
+            with self._cond:
+                self._running -= 1
+                finished = [j for j in self._jobs if j.state not in ("queued", "running")]
+                for old in finished[:-JOB_HISTORY_LIMIT]:
+                    self._jobs.remove(old)
+                self._cond.notify()
+
+    def _run(self, job):
+        job.transfer.set_status("Starting")
+        try:
+            os.makedirs(job.staging_dir, exist_ok=True)
+            job.result = job.func(job)
+            if job.cancelled():
+                raise Exception("Cancelled by user")
+            job.state = "done"
+            job.transfer.finish("Done")
+            # partial downloads are only worth keeping for a retry
+            shutil.rmtree(job.staging_dir, ignore_errors=True)
+        except Exception as e:
+            job.error = e
+            job.state = "cancelled" if job.cancelled() else "failed"
+            job.transfer.finish("Cancelled" if job.cancelled() else f"Failed: {e}")
+            print(f"Job '{job.name}' {job.state}: {e}")
+        summary = job.transfer.summary()
+        if summary:
+            print(summary)
+        self.finished.put(job)
+
+job_queue = JobQueue()
 
 # helper function to get asset paths
 def get_asset_path(filename):
@@ -67,18 +1516,55 @@ def get_labels_path():
         parent = os.path.abspath(os.path.dirname(__file__))
     return os.path.join(parent, "config.json")
 
-def refresh_trees():
-    populate_dashboards_tree()
-    populate_games_tree()
-
-
-def ensure_dir(path):
-    try:
-        os.makedirs(path, exist_ok=True)
-        return True
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to create directory '{path}': {e}")
-        return False
+def import_files(paths, dest_dir):
+    """Copy paths into dest_dir on a worker thread while a small window shows byte progress,
+    rate and ETA. Returns the number of files copied; raises on the first file that fails."""
+    transfer = TransferProgress(f"Import into {dest_dir}")
+    result = {"copied": 0, "error": None}
+
+    popup = tk.Toplevel(root)
+    popup.title("Importing...")
+    popup.geometry("420x120")
+    popup.protocol("WM_DELETE_WINDOW", lambda: None)  # stays up until the copy is done
+    ttk.Label(popup, text=f"Copying {len(paths)} file(s) into '{dest_dir}'...").pack(padx=20, pady=(16, 6))
+    bar = ttk.Progressbar(popup, mode='determinate', maximum=100)
+    bar.pack(fill='x', padx=20, pady=4)
+    info = ttk.Label(popup, text="")
+    info.pack(padx=20, pady=4)
+
+    def worker():
+        try:
+            transfer.start_stage('copy', sum(os.path.getsize(p) for p in paths), "Copying")
+            done = 0
+            for p in paths:
+                dest = os.path.join(dest_dir, os.path.basename(p))
+                try:
+                    done = copy_file_with_progress(p, dest, transfer.update, done)
+                except Exception as e:
+                    raise Exception(f"Failed to copy '{p}' to '{dest_dir}': {e}")
+                result["copied"] += 1
+            transfer.finish()
+        except Exception as e:
+            result["error"] = e
+            transfer.finish("Failed")
+
+    def on_progress(_, snap):
+        if snap['total']:
+            bar['value'] = 100 * snap['done'] / snap['total']
+        info.config(text=transfer.describe())
+        if snap['finished']:
+            popup.destroy()
+
+    subscription = subscribe_progress(on_progress, transfer)
+    threading.Thread(target=worker, daemon=True).start()
+    popup.wait_window()
+    unsubscribe_progress(subscription)
+    summary = transfer.summary()
+    if summary:
+        print(summary)
+    if result["error"]:
+        raise result["error"]
+    return result["copied"]
 
 
 def add_dashboard():
@@ -101,13 +1587,11 @@ def import_dashboard():
     dash_dir = os.path.join("dashboard", name)
     if not ensure_dir(dash_dir):
         return
-    for p in paths:
-        try:
-            dest = os.path.join(dash_dir, os.path.basename(p))
-            shutil.copy2(p, dest)
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Failed to copy '{p}' to '{dash_dir}': {e}")
-            return
+    try:
+        import_files(paths, dash_dir)
+    except Exception as e:
+        messagebox.showerror("Import Error", str(e))
+        return
     messagebox.showinfo("Imported", f"Imported {len(paths)} file(s) into '{name}'")
     refresh_trees()
 
@@ -131,503 +1615,155 @@ def get_version_dir(emulator_type, version=None):
         return os.path.join(base, version)
     return base
 
-def update_xenia(emulator, version=None):
+def pick_windows_asset(owner, repo, assets):
+    """Find the Windows build among a release's assets (every repo names them differently)."""
+    for asset in assets:
+        name = asset["name"].lower()
+        if repo == "xenia-canary-releases" and owner == "xenia-canary": # canary releases
+            if name.endswith(".zip") and name.startswith("xenia_canary_windows"):
+                return asset
+        elif repo == "release-builds-windows" and owner == "xenia-project": # stable releases (nice naming convention LOL)
+            if name.endswith(".zip") and "xenia_master" in name:
+                return asset
+        elif repo == "xenia-canary" and owner == "xenia-canary": # older canary releases
+            if name.endswith(".zip") and "xenia_canary" in name:
+                return asset
+        elif repo == "xenia-canary" and owner == "seven7000real": # older canary releases
+            if name.endswith(".exe") and "xenia_canary" in name:
+                return asset
+        elif repo == "xenia-canary" and owner == "AdrianCassar": # netplay canary releases
+            if name.endswith(".zip") and "xenia_canary_netplay_windows" in name:
+                return asset
+    return None
+
+def install_xenia_job(job, emulator, version=None, source=None):
+    """Job body behind update_xenia: fetch the release, download and install it.
+    Runs on a job worker, so it never touches Tk or state (source is the release source
+    setting, read by the caller); it returns the release tag and the version folder for
+    the on_done callback to record."""
+    owner, repo = XENIA_RELEASE_REPOS[emulator[len('xenia-'):]]
+    transfer = job.transfer
+
+    transfer.start_stage('fetch', status="Fetching")
+    status_code, release_info = get_release_backend(source).get_release(owner, repo, version)
+    if status_code != 200:
+        raise Exception(f"Failed to fetch release info: {status_code}")
+
+    download_asset = pick_windows_asset(owner, repo, release_info.get("assets", []))
+    if not download_asset:
+        raise Exception("No Windows release found")
+    is_exe_download = (repo == "xenia-canary" and owner == "seven7000real")
+
+    # download into the job's staging folder, a retry of this job picks the partial up again
+    # (served from the asset cache if we fetched this build before)
+    transfer.start_stage('download', download_asset.get('size', 0), "Downloading")
+    download_path = os.path.join(job.staging_dir, download_asset["name"])
+    asset_path, sha256 = fetch_release_asset(download_asset, download_path, progress=transfer.update, cancel=job.cancelled,
+                                             stage=transfer.start_stage)
+    if job.cancelled():
+        raise Exception("Update cancelled by user")
+
+    # Install straight into the version-specific directory
+    transfer.start_stage('extract' if not is_exe_download else 'copy', status="Installing")
+    version_tag = version or release_info.get('tag_name', 'latest')
+    dest_dir = get_version_dir(emulator, version_tag)
+    os.makedirs(os.path.dirname(dest_dir), exist_ok=True)
+    if is_exe_download:
+        # the release asset is the EXE itself, it just gets copied into place
+        install_file_to_dir(asset_path, dest_dir, f"{emulator}_{version or 'latest'}.exe")
+    else:
+        install_zip_to_dir(asset_path, dest_dir, progress=transfer.update, cancel=job.cancelled)
+
+    # Create symlinks in root for convenience
+    main_dir = os.path.abspath(os.path.dirname(__file__))
+    for file in os.listdir(dest_dir):
+        if file.endswith('.exe'):
+            src = os.path.join(dest_dir, file)
+            dst = os.path.join(main_dir, file)
+            # Remove existing symlink/file
+            try:
+                if os.path.exists(dst):
+                    if os.path.islink(dst):
+                        os.remove(dst)
+                    else:
+                        # Backup real file if it exists
+                        backup = dst + '.backup'
+                        shutil.move(dst, backup)
+                # Create symlink
+                os.symlink(src, dst)
+            except Exception as e:
+                print(f"Warning: Failed to create symlink {dst}: {e}")
+    return release_info.get('tag_name', version or 'Unknown'), dest_dir, download_asset, sha256
+
+def record_asset_digest(tag, asset, sha256, installed_to):
+    """Remember which file (by SHA-256) an install came from (Tk thread only).
+    verified is False when the release published no digest to check it against."""
+    state.setdefault('asset_digests', {})[f"{tag}/{asset['name']}"] = {
+        'sha256': sha256,
+        'verified': asset_sha256(asset) is not None,
+        'installed_to': os.path.abspath(installed_to),
+    }
+
+def record_installed_xenia(emulator, version, tag, dest_dir, asset, sha256):
+    """Record a finished install in state (Tk thread only)."""
+    if not version:  # Store latest version
+        state.setdefault('versions', {})[emulator] = tag
+    record_asset_digest(tag, asset, sha256, dest_dir)
+    # Record installed executable version(s)
+    for fn in os.listdir(dest_dir):
+        if fn.lower().endswith('.exe') and 'xenia' in fn.lower():
+            ap = os.path.abspath(os.path.join(dest_dir, fn))
+            state.setdefault('installed_emulators', {})[ap] = tag
+            # also ensure emulators mapping has a friendly name
+            ems = state.setdefault('emulators', {})
+            if ap not in ems:
+                # if it is actually db-experiment, mark it as such
+                if 'dbexperiment' in fn.lower() or 'db-experiment' in emulator:
+                    ems[ap] = 'Xenia Canary (db-experiment)'
+                elif 'netplay' in fn.lower() or 'netplay' in emulator:
+                    ems[ap] = 'Xenia Canary (netplay)'
+                else:
+                    ems[ap] = 'Xenia Canary' if 'canary' in fn.lower() or 'canary' in emulator else 'Xenia'
+                # also, append version to name if possible
+                ems[ap] += f" {tag}"
+    save_state(state)
+
+def update_xenia(emulator, version=None, priority=JOB_PRIORITY_USER):
     """
     Update Xenia to a specific version or the latest version
     :param emulator: Either 'xenia-canary' or 'xenia-stable'
     :param version: Optional specific version to install
+    :param priority: Job priority on the shared job queue
+    The download and install run on the job queue, this returns the Job straight away.
     """
-    
-    # Parse emulator type
-    if emulator == "xenia-canary":
-        OWNER = "xenia-canary"
-        REPO = "xenia-canary-releases"
-    elif emulator == "xenia-stable":
-        OWNER = "xenia-project"
-        REPO = "release-builds-windows"
-    elif emulator == "xenia-oldercanary":
-        OWNER = "xenia-canary"
-        REPO = "xenia-canary" # older releases were kept at the xenia-canary repo
-    elif emulator == "xenia-canary-dbexperiment":
-        OWNER = "seven7000real"
-        REPO = "xenia-canary" # experimental dashboard changes
-    elif emulator == "xenia-canary-netplay":
-        OWNER = "AdrianCassar"
-        REPO = "xenia-canary" # netplay builds
-    else:
+    if not emulator.startswith('xenia-') or emulator[len('xenia-'):] not in XENIA_RELEASE_REPOS:
         messagebox.showerror("Error", "Invalid emulator type specified: " + emulator)
-        return
-        
+        return None
+
     # Create version directory
     try:
         version_dir = get_version_dir(emulator)
         os.makedirs(version_dir, exist_ok=True)
     except Exception as e:
         messagebox.showerror("Error", f"Failed to create version directory: {e}")
-        return
-        
-    # Create progress popup
-    popup = tk.Toplevel()
-    popup.title(f"{emulator} Update")
-    popup.geometry("400x150")
-    
-    temp_dir = os.path.join(os.path.dirname(__file__), TEMP_DIR)
-    # Create and pack widgets
-    status_var = tk.StringVar(value="Preparing update...")
-    progress_var = tk.StringVar(value="")
-    
-    status_label = ttk.Label(popup, textvariable=status_var)
-    status_label.pack(padx=20, pady=(20, 6))
-    
-    progress_bar = ttk.Progressbar(popup, mode='determinate')
-    progress_bar.pack(fill='x', padx=20, pady=6)
-    
-    progress_label = ttk.Label(popup, textvariable=progress_var)
-    progress_label.pack(padx=20, pady=6)
-
-    cancel_state = {"cancelled": False}
-    def cancel_update():
-        cancel_state["cancelled"] = True
-        popup.destroy()
-    
-    cancel_btn = ttk.Button(popup, text="Cancel", command=cancel_update)
-    cancel_btn.pack(pady=6)
-
-    # Ensure popup appears
-    popup.update()
-    orig_Toplevel = tk.Toplevel
-    orig_Label = tk.Label
-
-    # optional cancel state (can be checked later if you add cancellation support)
-    cancel_state = {"cancelled": False}
-    def _cancel():
-        cancel_state["cancelled"] = True
-        status_label.config(text="Cancelled by user.")
-    tk.Button(popup, text="Cancel", command=_cancel).pack(pady=(0, 12))
-
-    # ensure popup appears immediately
-    popup.update_idletasks()
-    popup.update()
-
-    # override tk.Label so subsequent calls in this function update our existing labels
-    def _label_override(*args, **kwargs):
-        text = kwargs.get("text", "")
-        if isinstance(text, str):
-            lower = text.lower()
-            # heuristics: status vs progress
-            if "download" in lower or "install" in lower or "prepar" in lower:
-                status_label.config(text=text)
-            else:
-                progress_label.config(text=text)
-        # return a dummy object that supports .pack() and .config() to satisfy callers
-        class _Dummy:
-            def pack(self, *a, **k): return None
-            def config(self, **kw):
-                t = kw.get("text")
-                if isinstance(t, str):
-                    status_label.config(text=t)
-            def __getattr__(self, name):
-                return lambda *a, **k: None
-        return _Dummy()
-
-    tk.Label = _label_override
-
-    # override tk.Toplevel so later code that creates a new popup will get the same one
-    def _toplevel_override(*a, **k):
-        return popup
-    tk.Toplevel = _toplevel_override
-
-    # restore original factories when the popup is destroyed
-    def _restore(event=None):
-        try:
-            tk.Toplevel = orig_Toplevel
-            tk.Label = orig_Label
-        except Exception:
-            pass
-
-    popup.bind("<Destroy>", _restore)
-
-    # Ensure popup appears
-    popup.update()
-    
-    def update_status(text):
-        status_var.set(text)
-        popup.update()
-        
-    def update_progress(percent, text=""):
-        progress_bar['value'] = percent
-        progress_var.set(text)
-        popup.update()
-    
-    def download_with_progress(url, dest_path):
-        response = requests.get(url, stream=True)
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 1024
-        downloaded = 0
-        
-        with open(dest_path, 'wb') as f:
-            for data in response.iter_content(block_size):
-                if cancel_state["cancelled"]:
-                    raise Exception("Update cancelled by user")
-                downloaded += len(data)
-                f.write(data)
-                if total_size:
-                    percent = int(100 * downloaded / total_size)
-                    update_progress(percent, f"Downloaded: {downloaded // 1024}KB / {total_size // 1024}KB")
-    
-    try:
-        # Get release info
-        update_status("Fetching release information...")
-        releases_url = f"https://api.github.com/repos/{OWNER}/{REPO}/releases"
-        if version:
-            releases_url += f"/tags/{version}"
-        else:
-            releases_url += "/latest"
-            
-        response = requests.get(releases_url)
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch release info: {response.status_code}")
-            
-        release_info = response.json()
-        if not version:  # Store latest version
-            state.setdefault('versions', {})[emulator] = release_info['tag_name']
-            save_state(state)
-        
-        # Find Windows zip asset
-        assets = release_info.get("assets", [])
-        download_url = None
-        for asset in assets:
-            if REPO == "xenia-canary-releases" and OWNER == "xenia-canary": # canary releases
-                if asset["name"].endswith(".zip") and asset["name"].startswith("xenia_canary_windows"):
-                    download_url = asset["browser_download_url"]
-                    break
-            elif REPO == "release-builds-windows" and OWNER == "xenia-project": # stable releases (nice naming convention LOL)
-                if asset["name"].endswith(".zip") and "xenia_master" in asset["name"].lower():
-                    download_url = asset["browser_download_url"]
-                    break
-            elif REPO == "xenia-canary" and OWNER == "xenia-canary": # older canary releases
-                if asset["name"].endswith(".zip") and "xenia_canary" in asset["name"].lower():
-                    download_url = asset["browser_download_url"]
-                    break
-            elif REPO == "xenia-canary" and OWNER == "seven7000real": # older canary releases
-                if asset["name"].endswith(".exe") and "xenia_canary" in asset["name"].lower():
-                    download_url = asset["browser_download_url"]
-                    break
-            elif REPO == "xenia-canary" and OWNER == "AdrianCassar": # netplay canary releases
-                if asset["name"].endswith(".zip") and "xenia_canary_netplay_windows" in asset["name"].lower():
-                    download_url = asset["browser_download_url"]
-                    break
-                
-        if not download_url:
-            raise Exception("No Windows release found")
-            
-        # Create temp directory using the absolute path next to the executable
-        update_status("Downloading update...")
-        os.makedirs(TEMP_DIR, exist_ok=True) 
-        if not REPO == "xenia-canary" and not OWNER == "seven7000real": 
-            zip_path = os.path.join(TEMP_DIR, f"{emulator}_{version or 'latest'}.zip")
-        else:
-            zip_path = os.path.join(TEMP_DIR, f"{emulator}_{version or 'latest'}.exe")
-        # Download with progress tracking
-        download_with_progress(download_url, zip_path)
-        
-        if cancel_state["cancelled"]:
-            raise Exception("Update cancelled by user")
-            
-        # Extract and install
-        update_status("Installing update...")
-        update_progress(0, "Extracting files...")
+        return None
 
-        is_exe_download = (REPO == "xenia-canary" and OWNER == "seven7000real")
-        
-        # Determine the source directory for installation files
-        if is_exe_download:
-            # If it's an EXE, the source is the temp directory itself, 
-            # and the file is the EXE itself.
-            src_dir = os.path.dirname(zip_path) # "temp"
-            exe_filename = os.path.basename(zip_path) # xenia_canary-dbexperiment_*.exe
-        else:
-            # Extract the zip for all other cases
-            update_extract_dir = os.path.join(TEMP_DIR, "xenia_update")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(update_extract_dir) # Use absolute path
-            src_dir = update_extract_dir
-            
-        # Copy files to version-specific directory
-        update_progress(50, "Copying files...")
-        version_tag = version or release_info.get('tag_name', 'latest')
-        dest_dir = get_version_dir(emulator, version_tag)
-        os.makedirs(dest_dir, exist_ok=True)
-        
-        src_dir = os.path.join(TEMP_DIR, "xenia_update")
-        
-        # Clean existing version directory
-        for item in os.listdir(dest_dir):
-            item_path = os.path.join(dest_dir, item)
+    def on_done(job):
+        if job.state == "done":
+            tag = job.result[0]
             try:
-                if os.path.isfile(item_path):
-                    os.remove(item_path)
-                else:
-                    shutil.rmtree(item_path)
+                record_installed_xenia(emulator, version, *job.result)
             except Exception as e:
-                print(f"Warning: Failed to clean {item_path}: {e}")
-        
-        # Copy new files
-        if is_exe_download:
-            # For the EXE download, move the EXE file directly
-            src_path = zip_path # The full path to the downloaded EXE
-            dest_path = os.path.join(dest_dir, exe_filename)
-            shutil.copy2(src_path, dest_path)
-        else:
-            # Copy all files from the extracted zip folder
-            for root, dirs, files in os.walk(src_dir):
-                if cancel_state["cancelled"]:
-                    raise Exception("Update cancelled by user")
-                for file in files:
-                    src_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(src_path, src_dir)
-                    dest_path = os.path.join(dest_dir, rel_path)
-                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                    shutil.copy2(src_path, dest_path)
-                
-        # Create symlinks in root for convenience
-        main_dir = os.path.abspath(os.path.dirname(__file__))
-        for file in os.listdir(dest_dir):
-            if file.endswith('.exe'):
-                src = os.path.join(dest_dir, file)
-                dst = os.path.join(main_dir, file)
-                # Remove existing symlink/file
-                try:
-                    if os.path.exists(dst):
-                        if os.path.islink(dst):
-                            os.remove(dst)
-                        else:
-                            # Backup real file if it exists
-                            backup = dst + '.backup'
-                            shutil.move(dst, backup)
-                    # Create symlink
-                    os.symlink(src, dst)
-                except Exception as e:
-                    print(f"Warning: Failed to create symlink {dst}: {e}")
-        
-        # Record installed executable version(s)
-        try:
-            detected = []
-            for fn in os.listdir(dest_dir):
-                if fn.lower().endswith('.exe') and 'xenia' in fn.lower():
-                    ap = os.path.abspath(os.path.join(dest_dir, fn))
-                    # choose release tag if available
-                    tag = release_info.get('tag_name') if isinstance(release_info, dict) else (version or 'Unknown')
-                    state.setdefault('installed_emulators', {})[ap] = tag
-                    # also ensure emulators mapping has a friendly name
-                    ems = state.setdefault('emulators', {})
-                    if ap not in ems:
-                        # if it is actually db-experiment, mark it as such
-                        emulator = fn
-                        if 'dbexperiment' in fn.lower() or 'db-experiment' in emulator:
-                            ems[ap] = 'Xenia Canary (db-experiment)'
-                        elif 'netplay' in fn.lower() or 'netplay' in emulator:
-                            ems[ap] = 'Xenia Canary (netplay)'
-                        else:
-                            ems[ap] = 'Xenia Canary' if 'canary' in fn.lower() or 'canary' in emulator else 'Xenia'
-                        # also, append version to name if possible
-                        ems[ap] += f" {tag}"
-                        # add the version if we can
-                        state['emulators'] = ems
-                    detected.append((ap, tag))
-            # persist state if we detected anything
-            if detected:
-                save_state(state)
-        except Exception:
-            pass
-
-        # Clean up
-        update_status("Cleaning up...")
-        update_progress(90, "Removing temporary files...")
-        update_extract_dir = os.path.join(TEMP_DIR, "xenia_update") # Must redefine for this block if not global
-        if not is_exe_download:
-            shutil.rmtree(update_extract_dir, ignore_errors=True)  
-            
-        # cleanup for zip_path  
-        try:
-            if os.path.exists(zip_path):
-                os.remove(zip_path)
-        except Exception:
-            pass
-
-        update_status("Update complete!")
-        update_progress(100, "Finished!")
-        messagebox.showinfo("Success", f"{emulator} has been updated successfully!")
-        popup.destroy()
-        
-    except Exception as e:
-        error_msg = str(e)
-        update_status(f"Error: {error_msg}")
-        update_progress(0, "")
-        messagebox.showerror("Error", f"Failed to update {emulator}: {error_msg}")
-        if not popup.winfo_exists():
-            return
-        # Add close button since cancel button might be gone
-        ttk.Button(popup, text="Close", command=popup.destroy).pack(pady=6)
-    finally:
-        # Clean up temp files if they exist
-        try:
-            if not is_exe_download:
-                shutil.rmtree(os.path.join(temp_dir, "xenia_update"), ignore_errors=True)
-            if 'zip_path' in locals() and os.path.exists(zip_path):
-                 os.remove(zip_path)
-        except Exception:
-            pass
-        
-    try:
-        response = requests.get(releases_url)
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch release info: {response.status_code}")
-            
-        release_info = response.json()
-        if not version:  # Store latest version
-            state.setdefault('versions', {})[emulator] = release_info['tag_name']
-            save_state(state)
-            
-        status_label.config(text="Downloading update...")
-        
-        # Download and process the zip file
-        assets = release_info.get("assets", [])
-        download_url = None
-        for asset in assets:
-            if asset["name"].endswith(".zip") and "windows" in asset["name"].lower():
-                download_url = asset["browser_download_url"]
-                break
-                
-        if not download_url:
-            raise Exception("No Windows release found")
-            
-        # Create temp directory if it doesn't exist
-        os.makedirs(TEMP_DIR, exist_ok=True)
-        zip_path = os.path.join(TEMP_DIR, f"{emulator}_{version or 'latest'}.zip")
-        
-        # Download with progress
-        response = requests.get(download_url, stream=True)
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 1024
-        
-        with open(zip_path, 'wb') as f:
-            downloaded = 0
-            for data in response.iter_content(block_size):
-                downloaded += len(data)
-                f.write(data)
-                if total_size:
-                    percent = int(100 * downloaded / total_size)
-                    status_label.config(text=f"Downloading... {percent}%")
-                    popup.update()
-                    
-        status_label.config(text="Installing update...")
-        popup.update()
-        
-      
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(os.path.join(temp_dir, "xenia_update"))
-            
-        # Copy files to main directory
-        dest_dir = os.path.abspath(os.path.dirname(__file__))
-        src_dir = os.path.join(TEMP_DIR, "xenia_update")
-        
-        for root, dirs, files in os.walk(src_dir):
-            for file in files:
-                src_path = os.path.join(root, file)
-                rel_path = os.path.relpath(src_path, src_dir)
-                dest_path = os.path.join(dest_dir, rel_path)
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                shutil.copy2(src_path, dest_path)
-        
-        # Clean up
-        shutil.rmtree(os.path.join(temp_dir, "xenia_update"), ignore_errors=True)
-        os.remove(zip_path)
-        
-        status_label.config(text="Update complete!")
-        messagebox.showinfo("Success", f"{emulator} has been updated successfully!")
-        popup.destroy()
-        
-    except Exception as e:
-        status_label.config(text=f"Error: {str(e)}")
-        messagebox.showerror("Error", f"Failed to update {emulator}: {str(e)}")
-        popup.destroy()
-
-        os.makedirs(TEMP_DIR, exist_ok=True)
-        releases_url = f"https://api.github.com/repos/{OWNER}/{REPO}/releases/latest"
-
-        response = requests.get(releases_url)
-
-        if response.status_code != 200:
-            print(f"Failed to fetch release info: {response}")
-            return
-
-
-        release_info = response.json()
-        assets = release_info.get("assets", [])
-
-        if not assets:
-            print("No assets found for the latest release.")
-            return
+                print(f"Warning: Failed to record {emulator} {tag}: {e}")
+            messagebox.showinfo("Success", f"{emulator} has been updated successfully!")
+        elif job.state == "failed":
+            messagebox.showerror("Error", f"Failed to update {emulator}: {job.error}")
 
-
-        for asset in assets:
-            if asset["name"].endswith(".zip") and asset["name"].startswith("xenia_canary_windows"):
-                asset_url = asset["browser_download_url"]
-                file_name = asset["name"]
-                download_path = pathlib.Path(TEMP_DIR) / file_name
-
-                print(f"Downloading {file_name}...") #TODO: make this a pop-up loader
-                updatelabel = tk.Label(popup, text="Downloading Xenia Canary Update, please wait...").pack(padx=20, pady=20)
-                smalllabel = tk.Label(popup, text="(Downloading chunks...)").pack(padx=20, pady=10)
-                asset_response = requests.get(asset_url, stream=True)
-
-                if asset_response.status_code == 200:
-                    with open(download_path, "wb") as f:
-                        # get number of chunks (where each chunk is 1024) for percent
-                        total_size = int(asset_response.headers.get('content-length', 0))
-                        chunks_downloaded = 0
-                        for chunk in asset_response.iter_content(chunk_size=1024):
-                            if chunk:
-                                chunks_downloaded += 1
-                                updatelabel = tk.Label(text=f"Downloading Xenia Canary Update... {int((chunks_downloaded * 1024 / total_size) * 100)}%") #FIXME
-                                f.write(chunk)
-
-                    print(f"Successfully downloaded Xenia Canary update")
-                else:
-                    print(f"Failed to download Xenia Canary update: Internet resource responded with error code {asset_response.status_code}" )
-
-        updatelabel = tk.Label(popup, text="Installing Xenia Canary update, please wait...").pack(padx=20, pady=20)
-        smalllabel = tk.Label(popup, text="(Replacing older executable with newer update...)").pack(padx=20, pady=10)
-
-        # Extract and replace files
-        try:
-            with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                zip_ref.extractall("temp/xenia_canary_update")
-
-            # Copy extracted files to current directory (overwrite)
-            src_dir = pathlib.Path("temp/xenia_canary_update")
-            dest_dir = pathlib.Path(os.path.abspath(os.path.dirname(__file__)))
-
-            for item in src_dir.rglob('*'):
-                relative_path = item.relative_to(src_dir)
-                dest_path = dest_dir / relative_path
-
-                if item.is_dir():
-                    os.makedirs(dest_path, exist_ok=True)
-                else:
-                    shutil.copy2(item, dest_path)
-
-            print("Xenia Canary update installed successfully.")
-            updatelabel = tk.Label(popup, text="Xenia Canary update installed successfully.").pack(padx=20, pady=20)
-        except Exception as e:
-            popup.close()
-            # make new popup to show error
-            error_popup = tk.Toplevel()
-            error_popup.title("Xenia Canary Update Error")
-            error_label = tk.Label(error_popup, text=f"Failed to install Xenia Canary update: {e}").pack(padx=20, pady=20)
-            # add ok button to close
-            ok_button = tk.Button(error_popup, text="OK", command=error_popup.destroy).pack(pady=10)
+    source = state.get('settings', {}).get('release_source')
+    job = job_queue.submit(Job(f"{emulator} {version or 'latest'}", lambda job: install_xenia_job(job, emulator, version, source),
+                               priority, key=f"{emulator}-{version or 'latest'}", on_done=on_done))
+    show_jobs_panel()
+    return job
 
 def uninstall_xenia(emulator, version=None):
     """
@@ -702,86 +1838,88 @@ def uninstall_xenia(emulator, version=None):
         messagebox.showerror("Error", f"Could not determine installation directories: {e}")
         return
 
-    # --- 3. Confirmation Popup (Mirroring Update Popup) ---
-    
+    if not dirs_to_remove and not keys_to_remove_from_state:
+        messagebox.showinfo("Info", f"No installed instances of '{emulator}' (version: {version or 'any'}) found.")
+        return
+
+    # --- 3. Progress Popup ---
+    # the folders are removed on a worker thread which only reports through `transfer`;
+    # this window follows it through progress events and does the state cleanup at the end
+
     popup = tk.Toplevel()
     popup.title(f"{emulator} Uninstall")
     popup.geometry("400x180")
-    
+
     status_var = tk.StringVar(value="Preparing for uninstallation...")
-    
+
     status_label = ttk.Label(popup, textvariable=status_var)
     status_label.pack(padx=20, pady=(20, 6))
 
-    # Simple progress bar for visual feedback
-    progress_bar = ttk.Progressbar(popup, mode='determinate', maximum=len(dirs_to_remove) if not version else 100)
+    # Simple progress bar for visual feedback (one step per directory)
+    progress_bar = ttk.Progressbar(popup, mode='determinate', maximum=max(len(dirs_to_remove), 1))
     progress_bar.pack(fill='x', padx=20, pady=6)
-    
-    cancel_state = {"cancelled": False}
-    def cancel_uninstall():
-        cancel_state["cancelled"] = True
-        popup.destroy()
-    
-    ttk.Button(popup, text="Cancel", command=cancel_uninstall).pack(pady=6)
-    popup.update()
 
-    # --- 4. Perform Uninstallation ---
-    
-    try:
-        if not dirs_to_remove and not keys_to_remove_from_state:
-             status_var.set(f"No installed instances of '{emulator}' (version: {version or 'any'}) found.")
-             progress_bar['value'] = 100
-             messagebox.showinfo("Info", status_var.get())
-             popup.destroy()
-             return
-
-        status_var.set(f"Found {len(dirs_to_remove)} directory(ies) to remove...")
-        
-        # Remove Directories
-        for i, dir_path in enumerate(dirs_to_remove):
-            if cancel_state["cancelled"]:
-                raise Exception("Uninstallation cancelled by user")
-            
-            status_var.set(f"Removing directory: {os.path.basename(dir_path)}...")
-            shutil.rmtree(dir_path)
-            
-            progress_bar['value'] = (i + 1) / len(dirs_to_remove) * 50 if dirs_to_remove else 50
-            popup.update()
-            
-        status_var.set("Cleaning up state information...")
-        progress_bar['value'] = 75
+    transfer = TransferProgress(f"Uninstall {emulator} {version or 'all'}")
+    cancel_event = threading.Event()
+    result = {"error": None}
 
+    cancel_btn = ttk.Button(popup, text="Cancel", command=cancel_event.set)
+    cancel_btn.pack(pady=6)
+
+    # --- 4. Perform Uninstallation (worker thread, never touches Tk) ---
+
+    def worker():
+        try:
+            transfer.start_stage('remove', len(dirs_to_remove), f"Found {len(dirs_to_remove)} directory(ies) to remove...")
+            for i, dir_path in enumerate(dirs_to_remove):
+                if cancel_event.is_set():
+                    raise Exception("Uninstallation cancelled by user")
+                transfer.set_status(f"Removing directory: {os.path.basename(dir_path)}...")
+                shutil.rmtree(dir_path)
+                transfer.update(i + 1)
+            # Reclaim shared files that no remaining version links to
+            transfer.set_status("Reclaiming unused shared files...")
+            collect_version_objects()
+            transfer.finish("Cleaning up state information...")
+        except Exception as e:
+            result["error"] = e
+            transfer.finish(f"Error during uninstallation: {e}")
+
+    def on_progress(_, snap):
+        # the popup may have been closed while the folders are still being removed;
+        # the job carries on and the cleanup below still has to run, only the widgets are gone
+        if snap['finished']:
+            unsubscribe_progress(subscription)
+            finish_uninstall()
+        elif popup.winfo_exists():
+            status_var.set(snap['status'])
+            progress_bar['value'] = snap['done']
+
+    def finish_uninstall():
+        if result["error"]:
+            messagebox.showerror("Error", f"Failed to uninstall {emulator}: {result['error']}")
+            if popup.winfo_exists():
+                status_var.set(f"Error during uninstallation: {result['error']}")
+                cancel_btn.destroy()
+                ttk.Button(popup, text="Close", command=popup.destroy).pack(pady=6)
+            return
         # Remove State Entries (assuming state is managed globally)
         for key in keys_to_remove_from_state:
-            # Logic to remove from state['installed_emulators'] and state['emulators']
             # Since we used the EXE path as the key for 'installed_emulators', we use that:
             if key in state.get('installed_emulators', {}):
                 del state['installed_emulators'][key]
             # Clean up friendly name in 'emulators' map:
-            for emu_path, emu_name in list(state.get('emulators', {}).items()):
-                 if key == emu_path:
-                     del state['emulators'][emu_path]
-                     break
-            
+            state.get('emulators', {}).pop(key, None)
         save_state(state)
-        progress_bar['value'] = 90
-
-        status_var.set("Uninstallation complete!")
-        progress_bar['value'] = 100
+        if popup.winfo_exists():
+            status_var.set("Uninstallation complete!")
+            progress_bar['value'] = progress_bar['maximum']
         messagebox.showinfo("Success", f"Successfully uninstalled {emulator} (Version: {version or 'All'}).")
-        popup.destroy()
-        
-    except Exception as e:
-        error_msg = str(e)
-        status_var.set(f"Error during uninstallation: {error_msg}")
-        messagebox.showerror("Error", f"Failed to uninstall {emulator}: {error_msg}")
-        
-        # Replace Cancel with Close button on error
-        for widget in popup.winfo_children():
-            if isinstance(widget, ttk.Button) and widget.cget("text") == "Cancel":
-                 widget.destroy()
-        ttk.Button(popup, text="Close", command=popup.destroy).pack(pady=6)
-        popup.update()
+        if popup.winfo_exists():
+            popup.destroy()
+
+    subscription = subscribe_progress(on_progress, transfer)
+    threading.Thread(target=worker, daemon=True).start()
 
 def add_game():
     name = simpledialog.askstring("New Game", "Enter folder name for new game:")
@@ -803,13 +1941,11 @@ def import_game():
     game_dir = os.path.join("games", name)
     if not ensure_dir(game_dir):
         return
-    for p in paths:
-        try:
-            dest = os.path.join(game_dir, os.path.basename(p))
-            shutil.copy2(p, dest)
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Failed to copy '{p}' to '{game_dir}': {e}")
-            return
+    try:
+        import_files(paths, game_dir)
+    except Exception as e:
+        messagebox.showerror("Import Error", str(e))
+        return
     messagebox.showinfo("Imported", f"Imported {len(paths)} file(s) into '{name}'")
     refresh_trees()
 
@@ -828,13 +1964,11 @@ def import_dashboards_menu():
         dash_dir = os.path.join("dashboard", name)
         if not ensure_dir(dash_dir):
             return
-        for p in paths:
-            try:
-                dest = os.path.join(dash_dir, os.path.basename(p))
-                shutil.copy2(p, dest)
-            except Exception as e:
-                messagebox.showerror("Import Error", f"Failed to copy '{p}' to '{dash_dir}': {e}")
-                return
+        try:
+            import_files(paths, dash_dir)
+        except Exception as e:
+            messagebox.showerror("Import Error", str(e))
+            return
         messagebox.showinfo("Imported", f"Imported {len(paths)} file(s) into '{name}'")
     else:
         ips = state.setdefault('imports', {}).setdefault('dashboards', [])
@@ -861,13 +1995,11 @@ def import_games_menu():
         game_dir = os.path.join("games", name)
         if not ensure_dir(game_dir):
             return
-        for p in paths:
-            try:
-                dest = os.path.join(game_dir, os.path.basename(p))
-                shutil.copy2(p, dest)
-            except Exception as e:
-                messagebox.showerror("Import Error", f"Failed to copy '{p}' to '{game_dir}': {e}")
-                return
+        try:
+            import_files(paths, game_dir)
+        except Exception as e:
+            messagebox.showerror("Import Error", str(e))
+            return
         messagebox.showinfo("Imported", f"Imported {len(paths)} file(s) into '{name}'")
     else:
         ips = state.setdefault('imports', {}).setdefault('games', [])
@@ -974,6 +2106,7 @@ def open_manager_config():
             save_state(state)
             refresh_folders()
             refresh_trees()
+            restart_library_watcher()
             messagebox.showinfo('Added', 'Dashboard folder added.')
 
     def remove_folder():
@@ -994,6 +2127,7 @@ def open_manager_config():
                 save_state(state)
                 refresh_folders()
                 refresh_trees()
+                restart_library_watcher()
                 messagebox.showinfo('Removed', 'Dashboard folder removed from configuration.')
                 return
 
@@ -1040,10 +2174,31 @@ def open_manager_config():
     suppress_var = tk.BooleanVar(value=state.get('settings', {}).get('suppress_does_not_work_warning', False))
     chk = ttk.Checkbutton(gen_frame, text="Suppress 'Does Not Work' launch warning", variable=suppress_var)
     chk.pack(anchor='w', padx=8, pady=8)
+
+    cache_frame = ttk.Frame(gen_frame)
+    cache_frame.pack(anchor='w', padx=8, pady=8)
+    ttk.Label(cache_frame, text="Download cache size (MB, 0 = off):").pack(side='left')
+    cache_mb_var = tk.IntVar(value=state.get('settings', {}).get('asset_cache_mb', ASSET_CACHE_DEFAULT_MB))
+    ttk.Spinbox(cache_frame, from_=0, to=1024 * 1024, increment=256, width=8, textvariable=cache_mb_var).pack(side='left', padx=6)
+    
+    source_frame = ttk.Frame(gen_frame)
+    source_frame.pack(anchor='w', fill='x', padx=8, pady=8)
+    ttk.Label(source_frame, text="Release source (blank = GitHub, or a mirror folder / URL):").pack(anchor='w')
+    source_var = tk.StringVar(value=state.get('settings', {}).get('release_source', ''))
+    ttk.Entry(source_frame, textvariable=source_var, width=60).pack(side='left', fill='x', expand=True)
+    ttk.Button(source_frame, text='Browse...',
+               command=lambda: source_var.set(filedialog.askdirectory(title='Select release mirror folder') or source_var.get())).pack(side='left', padx=6)
     
     def save_general():
         s = state.setdefault('settings', {})
         s['suppress_does_not_work_warning'] = bool(suppress_var.get())
+        s['release_source'] = source_var.get().strip()
+        try:
+            s['asset_cache_mb'] = max(0, int(cache_mb_var.get()))
+        except (tk.TclError, ValueError):
+            messagebox.showerror('Error', 'Download cache size must be a whole number of MB.')
+            return
+        set_asset_cache_limit(s['asset_cache_mb'])
         state['settings'] = s
         save_state(state)
         messagebox.showinfo('Saved', 'Settings saved.')
@@ -1054,132 +2209,205 @@ def open_manager_config():
     nb.add(update_frame, text='Update')
 
     # Create tree view for versions
-    versions_tree = ttk.Treeview(update_frame)
-    versions_tree.pack(fill='both', expand=True, padx=8, pady=8)
+    versions_frame = ttk.Frame(update_frame)
+    versions_frame.pack(fill='both', expand=True, padx=8, pady=8)
+    versions_tree = ttk.Treeview(versions_frame)
+    versions_tree.pack(side='left', fill='both', expand=True)
     versions_tree.heading('#0', text='Available Xenia Versions')
-        
-    def fetch_xenia_versions(product):
-        if product == 'canary':
-            owner = 'xenia-canary'
-            repo = 'xenia-canary-releases'
-        elif product == 'stable':
-            owner = 'xenia-project'
-            repo = 'release-builds-windows'
-        elif product == 'oldercanary':
-            owner = 'xenia-canary'
-            repo = 'xenia-canary' # older releases were kept at the xenia-canary repo
-        elif product == 'canary-dbexperiment':
-            owner = 'seven7000real'
-            repo = 'xenia-canary' # experimental dashboard changes
-        elif product == 'canary-netplay':
-            owner = 'AdrianCassar'
-            repo = 'xenia-canary' # older releases were kept at the xenia-canary repo
+    versions_scroll = ttk.Scrollbar(versions_frame, command=versions_tree.yview)
+    versions_scroll.pack(side='right', fill='y')
+
+    def fetch_xenia_versions(product, page=1):
+        # runs on the network pool: must not touch Tk, errors are reported by the caller
+        if product in XENIA_RELEASE_REPOS:
+            owner, repo = XENIA_RELEASE_REPOS[product]
         else:
             print("Unknown product for fetching versions! Falling back to stable.")
             print(product)
-            owner = 'xenia-project'
-            repo = 'release-builds-windows' # default to stable
-        try:
-            url = f'https://api.github.com/repos/{owner}/{repo}/releases'
-            response = requests.get(url)
-            if response.status_code == 200:
-                return response.json()
-        except Exception as e:
-            messagebox.showerror('Error', f'Failed to fetch versions: {e}')
-        return []
+            owner, repo = XENIA_RELEASE_REPOS['stable'] # default to stable
+        status_code, releases = get_release_backend(state.get('settings', {}).get('release_source')).list_releases(owner, repo, page=page)
+        if status_code != 200:
+            raise Exception(f"HTTP {status_code}")
+        # keep only what the tree and changelog view need, the rest (assets, authors...) is dropped
+        return [{key: release.get(key) for key in ('tag_name', 'published_at', 'body')} for release in releases]
+
+    # product nodes fill in as their pages arrive; results come back through a queue
+    # that is drained on the Tk thread, so the window never waits on the network.
+    # only the first page of each feed is fetched up front, later pages are requested
+    # when the "Load more..." node at the end of a product is scrolled into view or opened
+    version_products = [
+        ('canary', 'Xenia Canary'),
+        ('oldercanary', 'Xenia Canary (older)'),
+        ('canary-dbexperiment', 'Xenia Canary (dbexperiment) (seven7000real)'),
+        ('canary-netplay', 'Xenia Canary (netplay) (AdrianCassar)'),
+        ('stable', 'Xenia Stable'),
+    ]
+    release_nodes = {}  # iid -> (product, release)
+    feed_pages = {}  # product -> {"pages": {page: releases}, "next_page": int, "loading": bool, "exhausted": bool}
+    feed_results = queue.Queue()
+    feed_state = {"generation": 0, "pending": 0, "draining": False}
+
+    def request_page(product):
+        feed = feed_pages[product]
+        if feed["loading"] or feed["exhausted"]:
+            return
+        page = feed["next_page"]
+        if page in feed["pages"]:  # already loaded, nothing to fetch
+            return
+        feed["loading"] = True
+        more_id = f"more::{product}"
+        if versions_tree.exists(more_id):
+            versions_tree.item(more_id, text='Loading...')
+        else:
+            versions_tree.insert(f"product::{product}", 'end', more_id, text='Loading...')
+        generation = feed_state["generation"]
+        feed_state["pending"] += 1
+        future = get_network_pool().submit(fetch_xenia_versions, product, page)
+        future.add_done_callback(lambda f: feed_results.put((generation, product, page, f)))
+        if not feed_state["draining"]:
+            feed_state["draining"] = True
+            versions_tree.after(50, drain_feed_results)
 
     def populate_versions_tree():
         versions_tree.delete(*versions_tree.get_children())
-        
-        # Add Xenia Canary node
-        canary_node = versions_tree.insert('', 'end', text='Xenia Canary', open=True)
-        canary_versions = fetch_xenia_versions('canary')
-        for release in canary_versions:
-            version = release.get('tag_name', '')
-            date = release.get('published_at', '').split('T')[0]
-            node_id = f"canary_{version}"
-            versions_tree.insert(canary_node, 'end', node_id, text=f"{version} ({date})")
-            
-        # Add older Xenia Canary node
-        old_canary_node = versions_tree.insert('', 'end', text='Xenia Canary (older)', open=True)
-        old_canary_versions = fetch_xenia_versions('oldercanary')
-        for release in old_canary_versions:
-            version = release.get('tag_name', '')
-            date = release.get('published_at', '').split('T')[0]
-            node_id = f"oldercanary_{version}"
-            versions_tree.insert(old_canary_node, 'end', node_id, text=f"{version} ({date})")
-            
-        # Add experimental Xenia Canary (dashboard experiment) node
-        exp_node = versions_tree.insert('', 'end', text='Xenia Canary (dbexperiment) (seven7000real)', open=True)
-        exp_versions = fetch_xenia_versions('canary-dbexperiment')
-        for release in exp_versions:
-            version = release.get('tag_name', '')
-            date = release.get('published_at', '').split('T')[0]
-            node_id = f"canary-dbexperiment_{version}"
-            versions_tree.insert(exp_node, 'end', node_id, text=f"{version} ({date})")
-            
-        # Add experimental Xenia Canary (netplay) node
-        netplay_node = versions_tree.insert('', 'end', text='Xenia Canary (netplay) (AdrianCassar)', open=True)
-        netplay_versions = fetch_xenia_versions('canary-netplay')
-        for release in netplay_versions:
-            version = release.get('tag_name', '')
-            date = release.get('published_at', '').split('T')[0]
-            node_id = f"canary-netplay_{version}"
-            versions_tree.insert(netplay_node, 'end', node_id, text=f"{version} ({date})")
-
-        # Add Xenia Stable node
-        stable_node = versions_tree.insert('', 'end', text='Xenia Stable', open=True)
-        stable_versions = fetch_xenia_versions('stable')
-        for release in stable_versions:
-            version = release.get('tag_name', '')
-            date = release.get('published_at', '').split('T')[0]
-            node_id = f"stable_{version}"
-            versions_tree.insert(stable_node, 'end', node_id, text=f"{version} ({date})")
-        
-    def show_version_info(event):
-        item_id = versions_tree.selection()[0]
-        if not versions_tree.parent(item_id):  # Skip root nodes
+        release_nodes.clear()
+        feed_pages.clear()
+        feed_state["generation"] += 1
+        feed_state["pending"] = 0
+
+        for product, text in version_products:
+            versions_tree.insert('', 'end', f"product::{product}", text=text, open=True)
+            feed_pages[product] = {"pages": {}, "next_page": 1, "loading": False, "exhausted": False}
+            request_page(product)
+
+    def fill_product_node(product, page, future):
+        feed = feed_pages[product]
+        feed["loading"] = False
+        product_node = f"product::{product}"
+        more_id = f"more::{product}"
+        error_id = f"error::{product}"
+        if versions_tree.exists(error_id):
+            versions_tree.delete(error_id)
+        try:
+            releases = future.result()
+        except Exception as e:
+            if versions_tree.exists(more_id):
+                versions_tree.delete(more_id)
+            versions_tree.insert(product_node, 'end', error_id, text=f"(Failed to fetch versions: {e}) - double-click to retry")
             return
-            
-        product, version = item_id.split('_', 1) 
-        releases = fetch_xenia_versions(product)
-        
+
+        feed["pages"][page] = releases
+        feed["next_page"] = page + 1
+        feed["exhausted"] = len(releases) < RELEASES_PER_PAGE
         for release in releases:
-            if release.get('tag_name') == version:
-                info_window = tk.Toplevel()
-                info_window.title(f"Version Info - {version}")
-                info_window.geometry("600x400")
-                
-                text = tk.Text(info_window, wrap=tk.WORD)
-                text.pack(fill='both', expand=True, padx=8, pady=8)
-                
-                # Add version info
-                text.insert('end', f"Version: {version}\n\n")
-                text.insert('end', f"Released: {release.get('published_at', '').split('T')[0]}\n\n")
-                text.insert('end', f"Changelog:\n{release.get('body', 'No changelog available.')}\n\n")
-                
-                text.config(state='disabled')
-                
-                # Add action buttons
-                btn_frame = ttk.Frame(info_window)
-                btn_frame.pack(fill='x', padx=8, pady=8)
-                
-                ttk.Button(btn_frame, text="Switch to This Version", 
-                          command=lambda: update_xenia(f'xenia-{product}', version)).pack(side='left', padx=4)
-                          
-                ttk.Button(btn_frame, text="Close", 
-                          command=info_window.destroy).pack(side='right', padx=4)
+            version = release.get('tag_name', '')
+            date = (release.get('published_at') or '').split('T')[0]
+            node_id = f"{product}_{version}"
+            if versions_tree.exists(node_id):
+                continue
+            versions_tree.insert(product_node, 'end', node_id, text=f"{version} ({date})")
+            release_nodes[node_id] = (product, release)
+
+        # keep the sentinel as the last child while there are more pages to load
+        if feed["exhausted"]:
+            if versions_tree.exists(more_id):
+                versions_tree.delete(more_id)
+        elif versions_tree.exists(more_id):
+            versions_tree.item(more_id, text='Load more...')
+            versions_tree.move(more_id, product_node, 'end')
+        else:
+            versions_tree.insert(product_node, 'end', more_id, text='Load more...')
+
+    def drain_feed_results():
+        if not versions_tree.winfo_exists():
+            feed_state["draining"] = False
+            return
+        while True:
+            try:
+                generation, product, page, future = feed_results.get_nowait()
+            except queue.Empty:
                 break
+            if generation != feed_state["generation"]:
+                continue  # stale result from before a refresh
+            feed_state["pending"] -= 1
+            fill_product_node(product, page, future)
+        if feed_state["pending"] > 0:
+            versions_tree.after(50, drain_feed_results)
+        else:
+            feed_state["draining"] = False
+            load_visible_pages()
+
+    def load_visible_pages():
+        # a "Load more..." node that has a bounding box is on screen, i.e. the
+        # user scrolled (or expanded) down to the end of that product's releases
+        for product in feed_pages:
+            more_id = f"more::{product}"
+            if versions_tree.exists(more_id) and versions_tree.bbox(more_id):
+                request_page(product)
+
+    def on_versions_scroll(first, last):
+        versions_scroll.set(first, last)
+        if float(last) >= 1.0:
+            versions_tree.after_idle(load_visible_pages)
+
+    def on_versions_open(event):
+        item_id = versions_tree.focus()
+        if item_id.startswith('product::'):
+            product = item_id.split('::', 1)[1]
+            if not feed_pages.get(product, {}).get("pages"):
+                request_page(product)
+            versions_tree.after_idle(load_visible_pages)
+
+    versions_tree.config(yscrollcommand=on_versions_scroll)
+    versions_tree.bind('<<TreeviewOpen>>', on_versions_open)
+
+    def show_version_info(event):
+        selection = versions_tree.selection()
+        if not selection:
+            return
+        item_id = selection[0]
+        if item_id.startswith(('more::', 'error::')):  # sentinel nodes: fetch the next page / retry
+            request_page(item_id.split('::', 1)[1])
+            return
+        if item_id not in release_nodes:  # Skip root and placeholder nodes
+            return
+        product, release = release_nodes[item_id]
+        version = release.get('tag_name', '')
+
+        info_window = tk.Toplevel()
+        info_window.title(f"Version Info - {version}")
+        info_window.geometry("600x400")
+
+        text = tk.Text(info_window, wrap=tk.WORD)
+        text.pack(fill='both', expand=True, padx=8, pady=8)
+
+        # Add version info
+        text.insert('end', f"Version: {version}\n\n")
+        text.insert('end', f"Released: {(release.get('published_at') or '').split('T')[0]}\n\n")
+        text.insert('end', f"Changelog:\n{release.get('body') or 'No changelog available.'}\n\n")
+
+        text.config(state='disabled')
+
+        # Add action buttons
+        btn_frame = ttk.Frame(info_window)
+        btn_frame.pack(fill='x', padx=8, pady=8)
+
+        ttk.Button(btn_frame, text="Switch to This Version",
+                  command=lambda: update_xenia(f'xenia-{product}', version)).pack(side='left', padx=4)
+
+        ttk.Button(btn_frame, text="Close",
+                  command=info_window.destroy).pack(side='right', padx=4)
     
     def version_context_menu(event):
         item_id = versions_tree.identify_row(event.y)
-        if not item_id or not versions_tree.parent(item_id):  # Skip if no item or root
+        if not item_id or item_id not in release_nodes:  # Skip if no item, root or placeholder
             return
             
         versions_tree.selection_set(item_id)
         menu = tk.Menu(root, tearoff=0)
         
-        product, version = item_id.split('_', 1)
+        product, release = release_nodes[item_id]
+        version = release.get('tag_name', '')
         
         # Check if this version is already installed
         version_dir = get_version_dir(f'xenia-{product}', version)
@@ -1212,7 +2440,14 @@ def open_manager_config():
 
     ttk.Button(btn_frame, text="Refresh Versions", command=populate_versions_tree).pack(side='left', padx=4)
     check_updates_xm = tk.BooleanVar(value=state.get('update', {}).get('check_update_on_launch_xm', False))
-    chk = ttk.Checkbutton(btn_frame, text="Check for updates on launch", variable=check_updates_xm)
+
+    def save_check_updates():
+        state.setdefault('update', {})['check_update_on_launch_xm'] = bool(check_updates_xm.get())
+        save_state(state)
+        if check_updates_xm.get():
+            schedule_update_check(UPDATE_CHECK_STARTUP_DELAY)
+
+    chk = ttk.Checkbutton(btn_frame, text="Check for updates on launch", variable=check_updates_xm, command=save_check_updates)
     chk.pack(side='right', padx=4)
 
     # Initial population
@@ -1319,8 +2554,9 @@ def open_manager_config():
                     symlink = os.path.join(script_dir, exe_name)
                     if os.path.islink(symlink) and os.path.realpath(symlink) == path:
                         os.remove(symlink)
-                    # Remove version directory
+                    # Remove version directory, then any shared files only it was using
                     shutil.rmtree(version_dir)
+                    collect_version_objects()
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to remove version: {e}")
             
@@ -1345,21 +2581,25 @@ def open_manager_config():
     refresh_installed_list()
     
 
-if HAVE_TKDN:
-    # use TkinterDnD root if available for native file-drop support
-    root = TkinterDnD.Tk()
-else:
-    root = tk.Tk()
-root.title("Xenia Manager")
-
-plus_icon_path = get_asset_path("plus.png")
-minus_icon_path = get_asset_path("minus.png")
-open_folder_icon_path = get_asset_path("open-folder.png")
-
+# command line tools that run without the UI
+if __name__ == '__main__' and '--sync-mirror' in sys.argv:
+    import argparse
+    parser = argparse.ArgumentParser(description="Fill an offline release mirror from GitHub and exit.")
+    parser.add_argument('--sync-mirror', metavar='FOLDER', required=True,
+                        help="mirror folder to create or update (point settings -> release_source at it)")
+    parser.add_argument('--source', default='', metavar='FOLDER_OR_URL',
+                        help="mirror to copy from instead of GitHub (another mirror folder or http(s) url)")
+    parser.add_argument('--releases', type=int, default=MIRROR_SYNC_DEFAULT_RELEASES,
+                        help=f"newest releases per repo whose assets are mirrored (default {MIRROR_SYNC_DEFAULT_RELEASES})")
+    args = parser.parse_args()
+    try:
+        sync_release_mirror(os.path.abspath(args.sync_mirror), args.releases, args.source)
+    except Exception as e:
+        print(f"Mirror sync failed: {e}")
+        sys.exit(1)
+    print("Mirror sync complete.")
+    sys.exit(0)
 
-plus_icon = PhotoImage(file=plus_icon_path)
-minus_icon = PhotoImage(file=minus_icon_path)
-open_folder_icon = PhotoImage(file=open_folder_icon_path)
 
 def load_state():
     path = get_labels_path()
@@ -1383,29 +2623,23 @@ def save_state(state):
     except Exception as e:
         messagebox.showerror('Save Error', f'Failed to save config: {e}')
 
-state = load_state()
-state = state if state is not None else {} # If state is None, assign {} to state.
-
-labels = state.get("labels", {})
-emulators = state.get("emulators", {})
 
-# Detect local Xenia Canary executables next to this script and add to emulators if found
 script_dir = os.path.abspath(os.path.dirname(__file__))
-for candidate in ("xenia_canary.exe", "xenia_canary_netplay.exe"):
-    candidate_path = os.path.join(script_dir, candidate)
-    if os.path.exists(candidate_path):
-        # store absolute path -> display name
-        # netplay is NOT the same as normal canary, so seperate into its own entry
-        display_name = "Xenia Canary (netplay)" if "netplay" in candidate.lower() else "Xenia Canary"
-        emulators[candidate_path] = display_name
-        if candidate_path not in emulators:
-            emulators[candidate_path] = "Xenia Canary"
-            state["emulators"] = emulators
-            save_state(state)
-        break
 
-# Track installed emulator versions (path -> version string)
-installed_emulators = state.setdefault('installed_emulators', {})
+def probe_emulator_candidates():
+    """Detect local Xenia Canary executables next to this script. Returns
+    {absolute path: display name} for the caller to add to emulators (runs at startup
+    off the Tk thread, see the Startup section)."""
+    found = {}
+    for candidate in ("xenia_canary.exe", "xenia_canary_netplay.exe"):
+        candidate_path = os.path.join(script_dir, candidate)
+        if os.path.exists(candidate_path):
+            # store absolute path -> display name
+            # netplay is NOT the same as normal canary, so seperate into its own entry
+            found[candidate_path] = "Xenia Canary (netplay)" if "netplay" in candidate.lower() else "Xenia Canary"
+            break
+    return found
+
 
 def dashboard_installer():
     """Open a dashboard installer window to select and download dashboards from a predefined list."""
@@ -1422,11 +2656,9 @@ def dashboard_installer():
     
     # --- 2. Fetch Dashboard List ---
     dashboards = {}
-    url = "https://api.github.com/repos/misterwaztaken/xbox360-dashboard-collection/releases"
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            releases = response.json()
+        status_code, releases = get_release_backend(state.get('settings', {}).get('release_source')).list_releases(*DASHBOARD_RELEASE_REPO, per_page=100)
+        if status_code == 200:
             for release in releases:
                 release_tag = release.get("tag_name", "unknown")
                 assets = release.get("assets", [])
@@ -1438,10 +2670,11 @@ def dashboard_installer():
                         dashboards[unique_id] = {
                             "name": asset_name,
                             "url": asset["browser_download_url"],
-                            "tag_name": release_tag
+                            "tag_name": release_tag,
+                            "asset": asset
                         }
         else:
-            messagebox.showerror("Error", f"Failed to fetch dashboard list: HTTP {response.status_code}")
+            messagebox.showerror("Error", f"Failed to fetch dashboard list: HTTP {status_code}")
             top.destroy()
             return
     except Exception as e:
@@ -1455,121 +2688,94 @@ def dashboard_installer():
         
     dashboard_listbox.pack(fill='both', expand=True, padx=10, pady=10)
 
-    # --- 4. Threaded Download Logic ---
+    # --- 4. Download Jobs ---
+    # each selected dashboard becomes a job on the shared job queue; its worker streams the
+    # zip into the job's staging folder and extracts it as soon as it lands. progress and
+    # cancelling live in the Jobs panel, this window only reports when the batch is over
 
     def start_download_thread():
-        """Starts the download process in a new thread."""
+        """Queues one job per selected dashboard and opens the Jobs panel."""
         selected_indices = dashboard_listbox.curselection()
         if not selected_indices:
             messagebox.showinfo("No Selection", "No dashboards selected for download.")
             return
 
-        # Disable the buttons while downloading
-        download_button.config(state=tk.DISABLED)
-        cancel_button.config(state=tk.DISABLED)
-        
         # Get the unique_ids for the selected items
-        selected_dashboards_keys = [dashboard_listbox.get(i) for i in selected_indices]
-        
-        # Start the heavy lifting in a new thread
-        download_thread = threading.Thread(
-            target=threaded_download_worker,
-            args=(selected_dashboards_keys, top, download_button, cancel_button)
-        )
-        download_thread.start()
-
-
-    def threaded_download_worker(selected_keys, parent_window, download_btn, cancel_btn):
-        """Worker function executed in the separate thread."""
-        
-        # Create a non-blocking progress window
-        progress_top = tk.Toplevel(parent_window)
-        progress_top.title("Downloading...")
-        progress_top.geometry("300x150")
-        
-        progress_label = ttk.Label(progress_top, text="Starting downloads...")
-        progress_label.pack(pady=10, padx=10)
-        
-        # A main progress bar for all packages
-        total_progress = ttk.Progressbar(progress_top, orient='horizontal', length=280, mode='determinate')
-        total_progress.pack(pady=5, padx=10)
-        total_progress['maximum'] = len(selected_keys)
-        
-        # A sub-progress bar for the current file (will use 'indeterminate' as chunking is complex)
-        file_progress = ttk.Progressbar(progress_top, orient='horizontal', length=280, mode='indeterminate')
-        file_progress.pack(pady=5, padx=10)
-
-        # Start the file progress bar spinning
-        file_progress.start(10) # 10ms update interval
-        
-        successful_downloads = 0
-        
-        for i, unique_id in enumerate(selected_keys):
-            dash_info = dashboards.get(unique_id)
-            if not dash_info:
-                continue
-
-            download_url = dash_info["url"]
-            dash_name = dash_info["name"]
-            release_tag = dash_info["tag_name"]
-            
-            # Update the status label (must be done safely in the main thread)
-            progress_top.after(0, lambda name=dash_name: progress_label.config(text=f"Downloading: {name}"))
-            
-            try:
-                # Use stream=True to potentially handle large files, though we won't use chunking for this example
-                response = requests.get(download_url, stream=True)
-                if response.status_code == 200:
-                    zip_data = response.content
-                    with zipfile.ZipFile(io.BytesIO(zip_data)) as zip_ref:
-                        extract_path = os.path.join("dashboard") 
-                        # Use parent_window.after(0, ...) to call a helper function 
-                        # to ensure ensure_dir is defined and safe, or trust your setup.
-                        
-                        # Assuming ensure_dir is safe/defined globally:
-                        ensure_dir(extract_path)
-                        zip_ref.extractall(extract_path)
-                        
-                        print(f"Successfully installed dashboard: {dash_name}")
-                        successful_downloads += 1
-                        
-                        # Update the total progress bar
-                        progress_top.after(0, lambda count=i+1: total_progress.config(value=count))
-                else:
-                    print(f"Failed to download dashboard {dash_name}: HTTP {response.status_code}")
-            except Exception as e:
-                print(f"Error downloading dashboard {dash_name}: {e}")
-                
-        # --- Download Complete Cleanup (run in main thread) ---
-        
-        # Stop file progress bar
-        file_progress.stop()
-
-        # Update final message and close the progress window
-        progress_top.after(0, progress_top.destroy) 
-        
-        # Show final message and destroy the original window (in main thread)
-        parent_window.after(0, lambda: messagebox.showinfo("Download Complete", f"Successfully installed {successful_downloads} dashboard(s)."))
-        parent_window.after(0, parent_window.destroy) 
-        
-        # Assume refresh_trees is defined globally and safe to call in the main thread
-        parent_window.after(0, refresh_trees)
+        selected_keys = [dashboard_listbox.get(i) for i in selected_indices]
+        batch = {"pending": set(), "installed": 0} # keys of the jobs this batch still waits on
+
+        def on_done(job):
+            if job.state == "done":
+                info = job_dashboards[job.key]
+                record_asset_digest(info["tag_name"], info["asset"], job.result, "dashboard")
+            if job.key not in batch["pending"]:
+                # a retry (Jobs panel) of a job the batch already counted, it finishes up on its own
+                if job.state == "done":
+                    save_state(state)
+                    refresh_trees()
+                return
+            batch["pending"].discard(job.key)
+            if job.state == "done":
+                batch["installed"] += 1
+            if not batch["pending"]:
+                save_state(state)
+                refresh_trees()
+                messagebox.showinfo("Download Complete", f"Successfully installed {batch['installed']} dashboard(s).")
+
+        job_dashboards = {}
+        job_batch = JobBatch(f"Dashboards ({len(selected_keys)})")
+        for unique_id in selected_keys:
+            dash_info = dashboards[unique_id]
+            key = f"dashboard-{dash_info['tag_name']}-{dash_info['name']}"
+            job_dashboards[key] = dash_info
+            job = Job(unique_id, lambda job, info=dash_info: dashboard_download_worker(job, info), JOB_PRIORITY_NORMAL,
+                      key=key, on_done=on_done)
+            if job_queue.submit(job) is job:
+                # (one already queued from an earlier batch reports with that batch)
+                batch["pending"].add(key)
+                job_batch.add(job, dash_info["asset"].get("size", 0))
+        top.destroy()
+        show_jobs_panel()
+        if not batch["pending"]:
+            messagebox.showinfo("Already Queued", "The selected dashboard(s) are already being installed.")
+
+
+    def dashboard_download_worker(job, dash_info):
+        """Job body for one dashboard. Runs on a job worker, never touches Tk."""
+        transfer = job.transfer
+        transfer.start_stage('download', dash_info["asset"].get("size", 0), "Downloading")
+        zip_path = os.path.join(job.staging_dir, dash_info["name"])
+        asset_path, sha256 = fetch_release_asset(dash_info["asset"], zip_path, progress=transfer.update, cancel=job.cancelled,
+                                                 stage=transfer.start_stage)
+        with zipfile.ZipFile(asset_path) as zip_ref:
+            members = zip_ref.infolist()
+            transfer.start_stage('extract', sum(m.file_size for m in members), "Extracting")
+            extract_path = os.path.join("dashboard")
+            os.makedirs(extract_path, exist_ok=True)
+            extracted = 0
+            for member in members:
+                if job.cancelled():
+                    raise Exception("Install cancelled by user")
+                zip_ref.extract(member, extract_path)
+                extracted += member.file_size
+                transfer.update(extracted)
+        print(f"Successfully installed dashboard: {dash_info['name']}")
+        return sha256
 
 
     # --- 5. Button Setup (Main Selection Window) ---
     btn_frame = ttk.Frame(top)
     btn_frame.pack(fill='x', padx=10, pady=10)
     
-    # 🌟 CRITICAL CHANGE: Hook button to the new threading function
     download_button = ttk.Button(btn_frame, text="Download Selected", command=start_download_thread)
     download_button.pack(side='left', padx=5)
     
     cancel_button = ttk.Button(btn_frame, text="Cancel", command=top.destroy)
     cancel_button.pack(side='right', padx=5)
 
-def detect_installed_emulators(scan_dirs=None):
-    """Scan for installed emulator executables and populate state['installed_emulators'].
-    Detects both versioned installations and legacy installations."""
+def scan_installed_emulators(scan_dirs=None):
+    """Find installed emulator executables, both versioned and legacy installations.
+    Only reads state, so it's safe off the Tk thread; returns {exe path: version}."""
     found = {}
     
     # First check versioned installations
@@ -1579,6 +2785,8 @@ def detect_installed_emulators(scan_dirs=None):
             variant_dir = os.path.join(versions_dir, variant)
             if os.path.exists(variant_dir):
                 for version_dir in os.listdir(variant_dir):
+                    if version_dir.startswith('.'):
+                        continue  # staging / swap folder of an install (see _staging_dir_for)
                     version_path = os.path.join(variant_dir, version_dir)
                     if os.path.isdir(version_path):
                         for fn in os.listdir(version_path):
@@ -1621,40 +2829,294 @@ def detect_installed_emulators(scan_dirs=None):
                 found[ap] = state.get('installed_emulators', {}).get(ap, 'Unknown')
         except Exception:
             pass
+    return found
 
+def merge_installed_emulators(found):
     # Merge into state and persist
     # preserve any prior entries and update with detected ones
     prior = state.get('installed_emulators', {})
+    # drop anything an older scan picked up from an interrupted install's staging folder
+    prior = {path: version for path, version in prior.items() if not str(version).startswith('.')}
     merged = {**prior, **found}
     state['installed_emulators'] = merged
     save_state(state)
     return state['installed_emulators']
 
-# Run detection at startup
-detect_installed_emulators()
-
-# --- Menu bar (File, Settings, Help)
-menubar = tk.Menu(root)
-file_menu = tk.Menu(menubar, tearoff=0)
-# open xenia emulator directly using subprocess by getting default emulator, do not use open_xex, no dashboard or game
-file_menu.add_command(label="Launch Xenia Emulator", command=lambda: subprocess.Popen([pick_preferred_emulator()]))
-file_menu.add_separator()
-file_menu.add_command(label="Import Dashboards...", command=import_dashboards_menu)
-file_menu.add_command(label="Import Games...", command=import_games_menu)
-file_menu.add_separator()
-file_menu.add_command(label="Exit", command=root.quit)
-menubar.add_cascade(label="File", menu=file_menu)
-
-settings_menu = tk.Menu(menubar, tearoff=0)
-settings_menu.add_command(label="Configure Manager...", command=open_manager_config)
-settings_menu.add_command(label="Configure Emulator...", command=configure_emulator)
-menubar.add_cascade(label="Settings", menu=settings_menu)
-
-help_menu = tk.Menu(menubar, tearoff=0)
-help_menu.add_command(label="About", command=lambda: messagebox.showinfo("About", "Xenia Manager\nVersion 0.2\n\nA simple manager for Xenia Xbox 360 emulator dashboards and games.\n\nDeveloped by kazwaztaken."))
-menubar.add_cascade(label="Help", menu=help_menu)
+def detect_installed_emulators(scan_dirs=None):
+    """Scan for installed emulator executables and populate state['installed_emulators'].
+    Detects both versioned installations and legacy installations."""
+    return merge_installed_emulators(scan_installed_emulators(scan_dirs))
+
+# --- Jobs panel ---
+# finished jobs are handed over through job_queue.finished and their on_done callbacks run
+# here on the Tk thread. the panel itself is a single window listing every job; progress
+# of running jobs arrives as progress events, the job list itself is synced on a timer
+JOBS_PANEL_REFRESH_MS = 250 # how often finished jobs are handed to their on_done
+JOBS_PANEL_SYNC_MS = 500 # how often the panel picks up new, finished and removed jobs
+jobs_panel = {"window": None}
+
+def pump_finished_jobs():
+    while True:
+        try:
+            job = job_queue.finished.get_nowait()
+        except queue.Empty:
+            break
+        if job.on_done:
+            try:
+                job.on_done(job)
+            except Exception as e:
+                print(f"Warning: on_done for job '{job.name}' failed: {e}")
+    root.after(JOBS_PANEL_REFRESH_MS, pump_finished_jobs)
+
+def prefetch_xenia_job(job, emulator, source=None):
+    """Background job: download the newest build of emulator into the asset cache so
+    installing it later doesn't have to wait for the download. source as for install_xenia_job."""
+    owner, repo = XENIA_RELEASE_REPOS[emulator[len('xenia-'):]]
+    job.transfer.start_stage('fetch', status="Fetching")
+    status_code, release_info = get_release_backend(source).get_release(owner, repo)
+    if status_code != 200:
+        raise Exception(f"Failed to fetch release info: {status_code}")
+    asset = pick_windows_asset(owner, repo, release_info.get("assets", []))
+    if not asset:
+        raise Exception("No Windows release found")
+    job.transfer.start_stage('download', asset.get('size', 0), "Prefetching")
+    fetch_release_asset(asset, os.path.join(job.staging_dir, asset["name"]), progress=job.transfer.update, cancel=job.cancelled,
+                        stage=job.transfer.start_stage)
+
+def show_jobs_panel():
+    """Open (or raise) the Jobs window."""
+    if jobs_panel["window"] is not None and jobs_panel["window"].winfo_exists():
+        jobs_panel["window"].deiconify()
+        jobs_panel["window"].lift()
+        return
+    win = tk.Toplevel(root)
+    win.title("Jobs")
+    win.geometry("720x320")
+    jobs_panel["window"] = win
+
+    jobs_tree = ttk.Treeview(win, columns=('status', 'progress', 'priority'), selectmode='extended')
+    jobs_tree.heading('#0', text='Job')
+    jobs_tree.heading('status', text='Status')
+    jobs_tree.heading('progress', text='Progress')
+    jobs_tree.heading('priority', text='Priority')
+    jobs_tree.column('#0', width=240)
+    jobs_tree.column('status', width=140)
+    jobs_tree.column('progress', width=240)
+    jobs_tree.column('priority', width=80)
+    jobs_tree.pack(fill='both', expand=True, padx=10, pady=(10, 4))
+
+    jobs_by_iid = {}
+
+    def selected_jobs():
+        # a selected batch row stands for every job in it
+        iids = []
+        for iid in jobs_tree.selection():
+            iids += jobs_tree.get_children(iid) if iid.startswith('batch-') else [iid]
+        return [jobs_by_iid[iid] for iid in dict.fromkeys(iids) if iid in jobs_by_iid]
+
+    def cancel_selected():
+        for job in selected_jobs():
+            job_queue.cancel(job)
+
+    def retry_selected():
+        for job in selected_jobs():
+            job_queue.retry(job)
+
+    def clear_finished():
+        job_queue.clear_finished()
+
+    btns = ttk.Frame(win)
+    btns.pack(fill='x', padx=10, pady=(4, 10))
+    ttk.Button(btns, text="Cancel Selected", command=cancel_selected).pack(side='left')
+    ttk.Button(btns, text="Retry Selected", command=retry_selected).pack(side='left', padx=6)
+    ttk.Button(btns, text="Clear Finished", command=clear_finished).pack(side='left')
+
+    workers_var = tk.StringVar(value=str(job_queue.max_workers))
+    def save_workers(*_):
+        # arrows call this directly, typed values once Enter is pressed or focus leaves;
+        # anything that isn't a number goes back to the current setting
+        try:
+            count = min(JOB_QUEUE_MAX_WORKERS, max(1, int(workers_var.get().strip())))
+        except ValueError:
+            count = job_queue.max_workers
+        workers_var.set(str(count))
+        if count == job_queue.max_workers and state.get('settings', {}).get('max_concurrent_jobs') == count:
+            return
+        job_queue.set_max_workers(count)
+        state.setdefault('settings', {})['max_concurrent_jobs'] = count
+        save_state(state)
+    workers_box = ttk.Spinbox(btns, from_=1, to=JOB_QUEUE_MAX_WORKERS, width=4, textvariable=workers_var, command=save_workers)
+    workers_box.bind('<Return>', save_workers)
+    workers_box.bind('<FocusOut>', save_workers)
+    workers_box.pack(side='right')
+    ttk.Label(btns, text="Max concurrent jobs:").pack(side='right', padx=(0, 4))
+
+    def row_values(job, snapshot=None):
+        if job.state == "running":
+            snapshot = snapshot or job.transfer.snapshot()
+            status, progress = snapshot["status"], job.transfer.describe()
+        elif job.state == "failed":
+            status, progress = f"Failed: {job.error}", ""
+        else:
+            status, progress = job.state.capitalize(), ""
+        return (status, progress, JOB_PRIORITY_NAMES.get(job.priority, job.priority))
+
+    def batch_values(batch):
+        # the batch's own row: how many of its jobs finished, and bytes over all of them
+        finished, failed, count, done_bytes, total_bytes = batch.overall()
+        status = f"{finished - failed} of {count} done" + (f", {failed} failed" if failed else "")
+        progress = f"{format_bytes(done_bytes)} / {format_bytes(total_bytes)}" if total_bytes else ""
+        if total_bytes:
+            progress += f" ({done_bytes * 100 // total_bytes}%)"
+        priorities = {job.priority for job in batch.jobs.values()}
+        return (status, progress, JOB_PRIORITY_NAMES.get(min(priorities), "") if priorities else "")
+
+    def on_progress(transfer, snapshot):
+        # running jobs are redrawn from progress events, at most once per drain
+        job = jobs_by_transfer.get(transfer)
+        if job and jobs_tree.exists(str(job.id)):
+            jobs_tree.item(str(job.id), values=row_values(job, snapshot))
+            if job.batch and jobs_tree.exists(job.batch.id):
+                jobs_tree.item(job.batch.id, values=batch_values(job.batch))
+
+    jobs_by_transfer = {}
+    subscription = subscribe_progress(on_progress)
+
+    def on_destroy(event):
+        if event.widget is win:
+            unsubscribe_progress(subscription)
+    win.bind("<Destroy>", on_destroy)
+
+    def sync_rows():
+        # adds/removes rows and picks up queued/finished state changes; progress comes from events
+        if not win.winfo_exists():
+            return
+        live = set()
+        batches = {}
+        for job in job_queue.jobs():
+            iid = str(job.id)
+            live.add(iid)
+            jobs_by_iid[iid] = job
+            jobs_by_transfer[job.transfer] = job
+            parent = ''
+            if job.batch:
+                parent = job.batch.id
+                batches[parent] = job.batch
+                if not jobs_tree.exists(parent):
+                    jobs_tree.insert('', 'end', parent, text=job.batch.name, open=True)
+            if not jobs_tree.exists(iid):
+                jobs_tree.insert(parent, 'end', iid, text=job.name, values=row_values(job))
+            elif job.state != "running":
+                jobs_tree.item(iid, values=row_values(job))
+        for iid in list(jobs_by_iid):
+            if iid not in live:
+                if jobs_tree.exists(iid):
+                    jobs_tree.delete(iid)
+                jobs_by_transfer.pop(jobs_by_iid.pop(iid).transfer, None)
+        for iid in jobs_tree.get_children():
+            if iid in batches:
+                jobs_tree.item(iid, values=batch_values(batches[iid]))
+            elif iid.startswith('batch-'):
+                jobs_tree.delete(iid)  # every job in it was cleared
+        win.after(JOBS_PANEL_SYNC_MS, sync_rows)
+
+    sync_rows()
+
+
+# --- Background update checker ---
+# when "Check for updates on launch" is on, the newest tag of every variant recorded in
+# state['versions'] is checked a little after startup and then periodically, off the Tk
+# thread. checks are conditional requests (304s are free) and are spaced out using the
+# X-RateLimit-Remaining/Reset headers so they never eat the budget the user needs
+UPDATE_CHECK_STARTUP_DELAY = 5 # seconds after launch before the first check
+UPDATE_CHECK_INTERVAL = 6 * 3600 # seconds between checks while the app is open
+UPDATE_CHECK_RETRY = 300 # first back-off after a failed check, doubles up to the interval
+UPDATE_CHECK_MIN_REMAINING = 10 # api calls always left for the user
+
+update_check_state = {"after_id": None, "failures": 0, "notified": set()}
+
+def find_available_updates(installed_versions, source=None):
+    """Runs on the network pool. Returns ({emulator: (installed, latest)}, retry_after or None)."""
+    backend = get_release_backend(source)
+    updates = {}
+    for emulator, installed_tag in installed_versions.items():
+        product = emulator[len('xenia-'):] if emulator.startswith('xenia-') else emulator
+        if product not in XENIA_RELEASE_REPOS:
+            continue
+        limit = get_rate_limit()
+        if isinstance(backend, GitHubReleaseBackend) and limit["remaining"] is not None \
+                and limit["remaining"] < UPDATE_CHECK_MIN_REMAINING and limit["reset"]:
+            return updates, max(limit["reset"] - time.time(), 60)
+        status_code, release = backend.get_release(*XENIA_RELEASE_REPOS[product])
+        if status_code in (403, 429):
+            # rate limited: come back once the window resets
+            reset = get_rate_limit()["reset"]
+            return updates, max(reset - time.time(), 60) if reset else UPDATE_CHECK_RETRY
+        if status_code != 200:
+            raise Exception(f"HTTP {status_code} checking {emulator}")
+        latest = release.get('tag_name')
+        if latest and latest != installed_tag:
+            updates[emulator] = (installed_tag, latest)
+    return updates, None
+
+def schedule_update_check(delay):
+    if update_check_state["after_id"]:
+        root.after_cancel(update_check_state["after_id"])
+    update_check_state["after_id"] = root.after(int(delay * 1000), run_update_check)
+
+def run_update_check():
+    update_check_state["after_id"] = None
+    if not state.get('update', {}).get('check_update_on_launch_xm', False):
+        return
+    source = state.get('settings', {}).get('release_source')
+    future = get_network_pool().submit(find_available_updates, dict(state.get('versions', {})), source)
 
-root.config(menu=menubar)
+    def poll():
+        if not future.done():
+            root.after(250, poll)
+            return
+        try:
+            updates, retry_after = future.result()
+        except Exception as e:
+            update_check_state["failures"] += 1
+            delay = min(UPDATE_CHECK_RETRY * 2 ** (update_check_state["failures"] - 1), UPDATE_CHECK_INTERVAL)
+            print(f"Warning: update check failed ({e}), retrying in {int(delay)}s")
+            schedule_update_check(delay)
+            return
+        update_check_state["failures"] = 0
+        new = {emulator: tags for emulator, tags in updates.items() if (emulator, tags[1]) not in update_check_state["notified"]}
+        if new:
+            update_check_state["notified"].update((emulator, tags[1]) for emulator, tags in new.items())
+            show_update_notice(new)
+            if _asset_cache_limit() > 0:
+                # get the new builds into the asset cache while the user decides
+                for emulator, (_, latest_tag) in new.items():
+                    job_queue.submit(Job(f"Prefetch {emulator} {latest_tag}", lambda job, e=emulator, source=source: prefetch_xenia_job(job, e, source),
+                                         JOB_PRIORITY_BACKGROUND, key=f"prefetch-{emulator}-{latest_tag}"))
+        if retry_after is None:
+            limit = get_rate_limit()
+            if limit["remaining"] is not None and limit["remaining"] < UPDATE_CHECK_MIN_REMAINING and limit["reset"]:
+                retry_after = max(limit["reset"] - time.time(), 60)
+        schedule_update_check(retry_after or UPDATE_CHECK_INTERVAL)
+
+    root.after(250, poll)
+
+def show_update_notice(updates):
+    """Non-modal window listing variants with a newer release than the one installed."""
+    notice = tk.Toplevel(root)
+    notice.title("Updates Available")
+    ttk.Label(notice, text="Newer Xenia builds are available:").pack(anchor='w', padx=12, pady=(12, 6))
+    for emulator, (installed_tag, latest_tag) in sorted(updates.items()):
+        ttk.Label(notice, text=f"  {emulator}: {installed_tag} -> {latest_tag}").pack(anchor='w', padx=12)
+    btns = ttk.Frame(notice)
+    btns.pack(fill='x', padx=12, pady=12)
+
+    def open_updates():
+        notice.destroy()
+        open_manager_config()
+
+    ttk.Button(btns, text="Configure Manager...", command=open_updates).pack(side='left')
+    ttk.Button(btns, text="Dismiss", command=notice.destroy).pack(side='right')
 
 
 def pick_preferred_emulator():
@@ -1731,91 +3193,71 @@ def load_index():
             "Boot Animations": ["bootanim.xex", "$flash_bootanim.xex"]
         }
 
+class DashboardIndex:
+    """The dashboard index compiled for classifying a folder's files in one pass over its
+    listing: exact names go in a dict keyed by lowercased name, patterns with glob
+    characters (*, ?, [) become case-insensitive regexes, and patterns naming a file in a
+    subfolder ("sub/dash.xex") are checked on disk since the listing can't see them.
+    Like checking every pattern in turn, a file shows up under every category with a
+    pattern matching it, placed by the first such pattern of each.
+    Results are cached per folder for as long as scan_dir returns the same listing."""
+
+    def __init__(self, index):
+        self.categories = list(index)
+        self.exact = {}  # lowercased name -> [(category number, pattern number)]
+        self.globs = []  # (compiled pattern, category number, pattern number)
+        self.nested = []  # (relative path, category number, pattern number)
+        for c, patterns in enumerate(index.values()):
+            for p, pattern in enumerate(patterns):
+                if '/' in pattern or '\\' in pattern:
+                    self.nested.append((pattern, c, p))
+                elif any(ch in pattern for ch in '*?['):
+                    self.globs.append((re.compile(fnmatch.translate(pattern), re.IGNORECASE), c, p))
+                else:
+                    self.exact.setdefault(pattern.lower(), []).append((c, p))
+        self._cache = {}  # abs folder path -> (files listing it was made from, result)
+        self._lock = threading.Lock()
+
+    def _matches(self, name):
+        """(category number, pattern number) of every pattern matching name, in index order."""
+        found = list(self.exact.get(name.lower(), ()))
+        found += [(c, p) for regex, c, p in self.globs if regex.match(name)]
+        return sorted(found)
+
+    def classify(self, folder_path, files):
+        """Returns [(category, [file names])] for the files (names from scan_dir) of
+        folder_path, categories in index order and files in pattern order."""
+        key = os.path.abspath(folder_path)
+        with self._lock:
+            cached = self._cache.get(key)
+        # scan_dir hands back the very same list while the folder is unchanged
+        if cached is not None and cached[0] is files:
+            result = cached[1]
+        else:
+            matched = []
+            for name in files:
+                seen = set()
+                for c, p in self._matches(name):
+                    if c not in seen:
+                        seen.add(c)
+                        matched.append(((c, p), name))
+            result = {}
+            for (c, p), name in sorted(matched):
+                result.setdefault(c, []).append(name)
+            with self._lock:
+                self._cache[key] = (files, result)
+        if not self.nested:
+            return [(self.categories[c], names) for c, names in sorted(result.items())]
+        merged = {c: list(names) for c, names in result.items()}
+        for pattern, c, p in self.nested:
+            if os.path.exists(os.path.join(folder_path, pattern)):
+                merged.setdefault(c, []).append(pattern)
+        return [(self.categories[c], names) for c, names in sorted(merged.items())]
 
-# (Toolbar removed — use drag-and-drop or right-click Import functions)
-
-# Create notebook for tabs
-notebook = ttk.Notebook(root)
-notebook.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
-
-# Create frames for each tab
-dashboards_frame = ttk.Frame(notebook)
-games_frame = ttk.Frame(notebook)
-
-# Add the frames to notebook
-notebook.add(dashboards_frame, text='Dashboards')
-notebook.add(games_frame, text='Games')
-
-# Create trees for both tabs
-dash_tree = ttk.Treeview(dashboards_frame)
-dash_tree.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
-
-games_tree = ttk.Treeview(games_frame)
-games_tree.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
-
-# If tkinterdnd2 is available, register the games_tree as a drop target
-if HAVE_TKDN:
-    def _parse_dnd_files(data):
-        # data may be a string like '{C:/path/one.iso} {C:/path/two.iso}' or space-separated
-        import re
-        parts = re.findall(r'\{([^}]*)\}|([^ ]+)', data)
-        files = []
-        for a, b in parts:
-            if a:
-                files.append(a)
-            elif b:
-                files.append(b)
-        return files
-
-    def on_games_drop(event):
-        data = event.data
-        files = _parse_dnd_files(data)
-        if not files:
-            return
-        # Determine drop target folder (if dropped onto a folder node)
-        try:
-            y = event.y_root - games_tree.winfo_rooty()
-            iid = games_tree.identify_row(y)
-        except Exception:
-            iid = None
-
-        target_folder = None
-        if iid and iid.startswith('game::'):
-            target_folder = iid.split('::', 1)[1]
-
-        if not target_folder:
-            # ask for folder name
-            target_folder = simpledialog.askstring("Import Games", "Enter target game folder name (will be created):")
-            if not target_folder:
-                return
-
-        game_dir = os.path.join('games', target_folder)
-        if not ensure_dir(game_dir):
-            return
-
-        imported = 0
-        for p in files:
-            try:
-                if not os.path.isfile(p):
-                    continue
-                # only accept .iso files for games
-                if not p.lower().endswith('.iso'):
-                    continue
-                dest = os.path.join(game_dir, os.path.basename(p))
-                shutil.copy2(p, dest)
-                imported += 1
-            except Exception as e:
-                messagebox.showerror("Import Error", f"Failed to copy '{p}' to '{game_dir}': {e}")
-        if imported:
-            messagebox.showinfo("Imported", f"Imported {imported} file(s) into '{target_folder}'")
-            refresh_trees()
-
-    games_tree.drop_target_register(DND_FILES)
-    games_tree.dnd_bind('<<Drop>>', on_games_drop)
 
 index_map = load_index()
+dashboard_index = DashboardIndex(index_map)
 file_nodes = {}  # iid -> abs path
-folder_nodes = []  # list of folder iids
 
 
 def display_text_for(folder):
@@ -1852,97 +3294,665 @@ def update_folder_display(folder):
     if games_tree.exists(game_id):
         games_tree.item(game_id, text=display_text_for(folder))
 
-def get_game_metadata(isopath): #TODO: finish & implement (ask user on first start if they want to try and fetch cover art via extract game file)
-    # oh boy here we go -me writing this, 2025
-    game_path = isopath
-    result = subprocess.run(['extract-iso.exe', f'{game_path}', '-d', './temp/game_extract/'])
+# --- XISO / XDVDFS reader ---
+# Xbox and Xbox 360 discs use XDVDFS: 2048 byte sectors, a volume descriptor in sector 32
+# ("MICROSOFT*XBOX*MEDIA", then the root directory's sector and size) and directories
+# stored as binary trees of entries ordered by case-insensitive name. a trimmed XISO has
+# the filesystem at offset 0; full disc dumps have the video partition in front of it, at
+# an offset that depends on the disc format. the ISO is memory-mapped and only the
+# sectors actually looked at are read, so finding default.xex touches a few KB of a 7GB file
+XDVDFS_MAGIC = b"MICROSOFT*XBOX*MEDIA"
+XDVDFS_SECTOR_SIZE = 2048
+XDVDFS_HEADER_SECTOR = 32
+XDVDFS_ATTRIBUTE_DIRECTORY = 0x10
+XDVDFS_PARTITION_OFFSETS = (
+    0,           # trimmed XISO (extract-xiso -r and friends)
+    0xFD90000,   # XGD2 disc dump
+    0x2080000,   # XGD3 disc dump
+    0x18300000,  # XGD1 disc dump
+)
+GAME_EXECUTABLES = ("default.xex", "default.xbe")
+
+XisoEntry = collections.namedtuple('XisoEntry', 'name sector size attributes')
+
+class XisoError(Exception):
+    """The file isn't an XDVDFS image, or its directory tree is damaged."""
+
+class XisoReader:
+    """Read-only access to the files inside an XISO or a full Xbox / Xbox 360 disc image.
+    Paths are '/' separated and case-insensitive, like on the console:
+
+        with XisoReader(path) as iso:
+            header = iso.read('default.xex', 0, 4096)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError) as e:  # empty file, or too big to map
+            self._file.close()
+            raise XisoError(f"Can't map {path}: {e}")
+        try:
+            self.partition_offset, self.root = self._find_volume()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        self._map.close()
+        self._file.close()
 
-def populate_dashboards_tree():
-    # builds the dashboards tree from the default folder and any configured folders
-    dash_tree.delete(*dash_tree.get_children())
-    file_nodes.clear()
-    folder_nodes.clear()
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _find_volume(self):
+        for offset in XDVDFS_PARTITION_OFFSETS:
+            header = offset + XDVDFS_HEADER_SECTOR * XDVDFS_SECTOR_SIZE
+            if self._map[header:header + len(XDVDFS_MAGIC)] != XDVDFS_MAGIC:
+                continue
+            sector, size = struct.unpack_from('<II', self._map, header + len(XDVDFS_MAGIC))
+            return offset, XisoEntry('', sector, size, XDVDFS_ATTRIBUTE_DIRECTORY)
+        raise XisoError(f"{os.path.basename(self.path)} is not an Xbox disc image")
+
+    def _sector_offset(self, sector):
+        return self.partition_offset + sector * XDVDFS_SECTOR_SIZE
+
+    def _is_empty(self, directory):
+        # an empty directory has no table at all, or one that is just 0xFF padding
+        start = self._sector_offset(directory.sector)
+        return directory.size == 0 or self._map[start:start + 2] == b'\xff\xff'
+
+    def _entry_at(self, directory, offset):
+        # one directory entry: left and right subtree offsets (in 4 byte units), start
+        # sector, size, attributes, name length and name
+        start = self._sector_offset(directory.sector)
+        if offset + 14 > directory.size or start + offset + 14 > len(self._map):
+            raise XisoError(f"Directory entry outside its directory in {os.path.basename(self.path)}")
+        left, right, sector, size, attributes, name_length = struct.unpack_from('<HHIIBB', self._map, start + offset)
+        name = self._map[start + offset + 14:start + offset + 14 + name_length].decode('latin-1')
+        return left, right, XisoEntry(name, sector, size, attributes)
+
+    def listdir(self, directory=None):
+        """The entries of a directory (an XisoEntry, or the root), in name order."""
+        directory = directory or self.root
+        if not directory.attributes & XDVDFS_ATTRIBUTE_DIRECTORY:
+            raise XisoError(f"{directory.name} is not a directory")
+        if self._is_empty(directory):
+            return []
+        entries = []
+        seen = set()
+        stack = []
+        offset = 0
+        # in-order walk of the tree without recursion; offset 0 (or 0xFFFF) ends a branch
+        while stack or offset is not None:
+            if offset is not None:
+                if offset in seen:
+                    raise XisoError(f"Directory loop in {os.path.basename(self.path)}")
+                seen.add(offset)
+                left, right, entry = self._entry_at(directory, offset)
+                stack.append((right, entry))
+                offset = left * 4 if left not in (0, 0xFFFF) else None
+                continue
+            right, entry = stack.pop()
+            entries.append(entry)
+            offset = right * 4 if right not in (0, 0xFFFF) else None
+        return entries
+
+    def find(self, path):
+        """The XisoEntry at path, or None."""
+        entry = self.root
+        for part in [p for p in path.replace('\\', '/').split('/') if p]:
+            if not entry.attributes & XDVDFS_ATTRIBUTE_DIRECTORY or self._is_empty(entry):
+                return None
+            entry = self._find_in(entry, part.upper())
+            if entry is None:
+                return None
+        return entry
+
+    def _find_in(self, directory, wanted):
+        # follow the tree like the console does; some authoring tools don't sort it,
+        # so a miss is double checked against the full listing
+        offset = 0
+        for _ in range(directory.size // 4 + 1):
+            left, right, entry = self._entry_at(directory, offset)
+            name = entry.name.upper()
+            if name == wanted:
+                return entry
+            branch = left if wanted < name else right
+            if branch in (0, 0xFFFF):
+                break
+            offset = branch * 4
+        for entry in self.listdir(directory):
+            if entry.name.upper() == wanted:
+                return entry
+        return None
+
+    def read(self, path, offset=0, size=None):
+        """Read size bytes (default: to the end) of the file at path, starting at offset."""
+        entry = path if isinstance(path, XisoEntry) else self.find(path)
+        if entry is None or entry.attributes & XDVDFS_ATTRIBUTE_DIRECTORY:
+            raise XisoError(f"No file {path} in {os.path.basename(self.path)}")
+        end = entry.size if size is None else min(entry.size, offset + size)
+        start = self._sector_offset(entry.sector)
+        if start + end > len(self._map):
+            raise XisoError(f"{entry.name} runs past the end of {os.path.basename(self.path)} (truncated image?)")
+        return self._map[start + offset:start + max(end, offset)]
+
+    def walk(self, directory=None, prefix=''):
+        """Yields ('dir/name', XisoEntry) for everything below directory, depth first."""
+        for entry in self.listdir(directory):
+            path = prefix + entry.name
+            yield path, entry
+            if entry.attributes & XDVDFS_ATTRIBUTE_DIRECTORY:
+                yield from self.walk(entry, path + '/')
+
+def get_game_metadata(isopath):
+    """What can be told about a game from its disc image without extracting it: which
+    executable it boots and where the filesystem sits, plus the title ID, version and
+    region from a XEX2 header. Raises XisoError for anything that isn't an Xbox disc image."""
+    with XisoReader(isopath) as iso:
+        for name in GAME_EXECUTABLES:
+            entry = iso.find(name)
+            if entry is not None and not entry.attributes & XDVDFS_ATTRIBUTE_DIRECTORY:
+                metadata = {
+                    'executable': entry.name,
+                    'executable_size': entry.size,
+                    'executable_magic': iso.read(entry, 0, 4).decode('latin-1'),
+                    'partition_offset': iso.partition_offset,
+                }
+                if metadata['executable_magic'] == XEX2_MAGIC.decode():
+                    metadata.update(parse_xex_header(lambda offset, size: iso.read(entry, offset, size)))
+                return metadata
+        return {'executable': None, 'partition_offset': iso.partition_offset}
+
+# --- XEX2 headers and the title metadata index ---
+# an Xbox 360 executable starts with a small header: magic, flags, the offsets of the PE
+# image and of the security info, then a table of (key, value) optional headers. the
+# execution info header carries the title ID, media ID, version and disc number, the
+# security info the region flags. parse_xex_header only reads those few structures, never
+# the (compressed, encrypted) image itself. the game's name isn't in the header, so names
+# come from titles.json next to config.json ({"4D5307E6": "Halo 3", ...}) when there is one
+XEX2_MAGIC = b"XEX2"
+XEX_HEADER_EXECUTION_INFO = 0x00040006
+XEX_SECURITY_REGION_OFFSET = 0x178
+XEX_MAX_OPTIONAL_HEADERS = 64
+XEX_REGIONS = (("NTSC-U", 0x000000FF), ("NTSC-J", 0x0000FF00), ("PAL", 0x00FF0000))
+
+METADATA_INDEX_PATH = os.path.join(CACHE_DIR, "metadata.json")
+METADATA_INDEX_VERSION = 1
+
+def format_xex_version(version):
+    return f"{version >> 28}.{(version >> 24) & 0xF}.{(version >> 8) & 0xFFFF}.{version & 0xFF}"
+
+def format_xex_region(region):
+    if region & 0x00FFFFFF == 0x00FFFFFF:
+        return "Region Free"
+    return ", ".join(name for name, mask in XEX_REGIONS if region & mask) or "None"
+
+def parse_xex_header(read):
+    """Title metadata from a XEX2 header. read(offset, size) returns bytes from the
+    executable, so this works on loose files and on files inside an ISO alike."""
+    header = read(0, 24)
+    if len(header) < 24 or header[:4] != XEX2_MAGIC:
+        raise Exception("Not a XEX2 executable")
+    flags, pe_offset, _, security_offset, count = struct.unpack('>IIIII', header[4:24])
+    if count > XEX_MAX_OPTIONAL_HEADERS:
+        raise Exception(f"Implausible optional header count {count}")
+    table = read(24, count * 8)
+    metadata = {'module_flags': flags}
+    for i in range(len(table) // 8):
+        key, value = struct.unpack_from('>II', table, i * 8)
+        if key != XEX_HEADER_EXECUTION_INFO:
+            continue
+        info = read(value, 24)
+        if len(info) < 24:
+            raise Exception("Execution info runs past the end of the header")
+        media_id, version, base_version, title_id, platform, executable_type, disc, discs, savegame_id = struct.unpack('>IIIIBBBBI', info)
+        metadata.update(
+            title_id=f"{title_id:08X}",
+            media_id=f"{media_id:08X}",
+            version=format_xex_version(version),
+            base_version=format_xex_version(base_version),
+            disc=[disc, discs],
+        )
+    region = read(security_offset + XEX_SECURITY_REGION_OFFSET, 4)
+    if len(region) == 4:
+        metadata['region'] = format_xex_region(struct.unpack('>I', region)[0])
+    return metadata
+
+def read_file_metadata(path):
+    """Parse the metadata of a disc image (its default.xex) or a loose .xex file."""
+    if path.lower().endswith('.iso'):
+        return get_game_metadata(path)
+    with open(path, 'rb') as f:
+        def read(offset, size):
+            f.seek(offset)
+            return f.read(size)
+        return parse_xex_header(read)
+
+def load_title_names():
+    path = os.path.join(os.path.dirname(get_labels_path()), "titles.json")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {title_id.upper(): name for title_id, name in json.load(f).items()}
+    except Exception:
+        return {}
+
+# path -> {'size', 'mtime', 'metadata'} (metadata is None for files that didn't parse, so
+# they aren't retried until they change). files missing from it are parsed by a single
+# background worker; each parsed file's folder is put on library_changes, which re-lists
+# the nodes showing it with their new text
+_metadata_index = None
+_metadata_dirty = False
+_metadata_lock = threading.Lock()
+_metadata_pending = set()
+_metadata_executor = None
+title_names = {}  # filled in by load_metadata_index
+
+def load_metadata_index():
+    # callers hold _metadata_lock
+    global _metadata_index, title_names
+    if _metadata_index is None:
+        try:
+            with open(METADATA_INDEX_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            _metadata_index = data['files'] if data.get('version') == METADATA_INDEX_VERSION else {}
+        except Exception:
+            _metadata_index = {}
+        title_names = load_title_names()
+    return _metadata_index
+
+def save_metadata_index():
+    global _metadata_dirty
+    with _metadata_lock:
+        if not _metadata_dirty:
+            return
+        data = json.dumps({'version': METADATA_INDEX_VERSION, 'files': load_metadata_index()})
+        _metadata_dirty = False
+    tmp_path = f"{METADATA_INDEX_PATH}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, METADATA_INDEX_PATH)
+    except Exception as e:
+        print(f"Warning: Failed to write metadata index: {e}")
+
+def cached_metadata(path):
+    """The indexed metadata of path, or None when it has none (yet): a file that is new or
+    changed since it was indexed is queued for parsing and None is returned for now."""
+    global _metadata_executor
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return None
+    with _metadata_lock:
+        entry = load_metadata_index().get(key)
+        if entry is not None and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime_ns:
+            return entry['metadata']
+        if key not in _metadata_pending:
+            _metadata_pending.add(key)
+            if _metadata_executor is None:
+                _metadata_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="xm-metadata")
+            _metadata_executor.submit(_index_metadata, key)
+    return None
+
+def _index_metadata(path):
+    global _metadata_dirty
+    try:
+        st = os.stat(path)
+        try:
+            metadata = read_file_metadata(path)
+        except Exception as e:
+            print(f"Warning: No metadata for {path}: {e}")
+            metadata = None
+        with _metadata_lock:
+            load_metadata_index()[path] = {'size': st.st_size, 'mtime': st.st_mtime_ns, 'metadata': metadata}
+            _metadata_dirty = True
+    except OSError:
+        pass  # gone before we got to it
+    finally:
+        with _metadata_lock:
+            _metadata_pending.discard(path)
+            done = not _metadata_pending
+    library_changes.put({os.path.dirname(path)})
+    if done:
+        save_metadata_index()
+
+def file_node_text(path, name):
+    # the tree text for a game image or executable: its title when titles.json knows the
+    # title ID, otherwise the file name with the ID, version and region from the header
+    metadata = cached_metadata(path)
+    if not metadata or 'title_id' not in metadata:
+        return name
+    title = title_names.get(metadata['title_id'])
+    details = f"{metadata['title_id']}, v{metadata['version']}" + (f", {metadata['region']}" if metadata.get('region') else "")
+    return f"{title} ({name})" if title else f"{name} [{details}]"
+
+# --- Library scanner ---
+# every directory listing the trees use goes through scan_dir, which remembers each
+# directory's entries together with its mtime in SCAN_CACHE_PATH. adding, removing or
+# renaming something in a directory changes that directory's mtime, so when the mtime
+# still matches the cached listing is used as is: a rescan of an unchanged library costs
+# one stat per directory instead of a listing. scan_library walks all the library roots
+# (default and configured dashboard folders, games/) at once, one thread per root, so
+# libraries spread over several drives are read in parallel, and leaves the cache warm
+# for the listings that follow
+SCAN_CACHE_PATH = os.path.join(CACHE_DIR, "scan.json")
+SCAN_CACHE_VERSION = 1
+SCAN_WORKERS = 4
+SCAN_RACY_SECONDS = 2 # FAT/exFAT keep mtimes to 2s, listings this close to a change are redone next time
+
+_scan_cache = None  # abs dir path -> {'mtime': ns, 'dirs': [...], 'files': [...]}, loaded on first use
+_scan_cache_dirty = False
+_scan_cache_lock = threading.Lock()
+
+def _get_scan_cache():
+    # callers hold _scan_cache_lock
+    global _scan_cache
+    if _scan_cache is None:
+        try:
+            with open(SCAN_CACHE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            _scan_cache = data['dirs'] if data.get('version') == SCAN_CACHE_VERSION else {}
+        except Exception:
+            _scan_cache = {}
+    return _scan_cache
+
+def save_scan_cache():
+    """Write the scan cache if anything changed since it was last written."""
+    global _scan_cache_dirty
+    with _scan_cache_lock:
+        if not _scan_cache_dirty:
+            return
+        data = json.dumps({'version': SCAN_CACHE_VERSION, 'dirs': _get_scan_cache()})
+        _scan_cache_dirty = False
+    tmp_path = f"{SCAN_CACHE_PATH}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, SCAN_CACHE_PATH)
+    except Exception as e:
+        print(f"Warning: Failed to write scan cache: {e}")
+
+def _drop_scan_entries(path):
+    # forget path and everything cached below it; callers hold _scan_cache_lock
+    global _scan_cache_dirty
+    cache = _get_scan_cache()
+    prefix = path.rstrip(os.sep) + os.sep
+    for key in [key for key in cache if key == path or key.startswith(prefix)]:
+        del cache[key]
+        _scan_cache_dirty = True
+
+def invalidate_scan_dir(path):
+    """Make the next scan_dir(path) list the directory again, whatever its mtime says."""
+    with _scan_cache_lock:
+        entry = _get_scan_cache().get(os.path.abspath(path))
+        if entry is not None:
+            entry['mtime'] = -1
+
+def scan_dir(path):
+    """Returns (dirs, files), the sorted names of path's subdirectories and other entries,
+    from the scan cache when the directory hasn't changed since it was listed. Raises
+    OSError like os.scandir when path can't be read."""
+    global _scan_cache_dirty
+    key = os.path.abspath(path)
+    try:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        with _scan_cache_lock:
+            _drop_scan_entries(key)
+        raise
+    with _scan_cache_lock:
+        entry = _get_scan_cache().get(key)
+    if entry is not None and entry['mtime'] == mtime:
+        return entry['dirs'], entry['files']
+
+    dirs, files = [], []
+    with os.scandir(key) as it:
+        for item in it:
+            try:
+                (dirs if item.is_dir() else files).append(item.name)
+            except OSError:
+                files.append(item.name)
+    dirs.sort()
+    files.sort()
+    # a directory changed within the mtime granularity may change again without its mtime
+    # moving, so such a listing is used this once but not trusted next time
+    trusted = time.time_ns() - mtime > SCAN_RACY_SECONDS * 1_000_000_000
+    with _scan_cache_lock:
+        cache = _get_scan_cache()
+        if entry is not None:
+            for gone in set(entry['dirs']) - set(dirs):
+                _drop_scan_entries(os.path.join(key, gone))
+        cache[key] = {'mtime': mtime if trusted else -1, 'dirs': dirs, 'files': files}
+        _scan_cache_dirty = True
+    return dirs, files
+
+def scan_tree(path, max_depth=None):
+    """Runs every directory under path (down to max_depth levels) through scan_dir.
+    Returns how many directories were visited."""
+    visited = 0
+    pending = [(path, 0)]
+    while pending:
+        folder, depth = pending.pop()
+        try:
+            dirs, _ = scan_dir(folder)
+        except OSError:
+            continue
+        visited += 1
+        if max_depth is None or depth < max_depth:
+            pending.extend((os.path.join(folder, name), depth + 1) for name in dirs)
+    return visited
+
+def library_scan_roots():
+    # (path, max_depth) for everything the trees show: dashboard folders are browsed all
+    # the way down, games/ only holds one level of game folders with the ISOs in them
+    roots = [('dashboard', None)]
+    roots += [(folder, None) for folder in state.get('settings', {}).get('dashboard_folders', [])]
+    roots.append(('games', 1))
+    return roots
+
+def scan_library():
+    """Walks all library roots concurrently, then persists the scan cache. Safe to call
+    off the UI thread. Returns (directories visited, seconds taken)."""
+    began = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="xm-scan") as pool:
+        visited = sum(pool.map(lambda root: scan_tree(*root), library_scan_roots()))
+    save_scan_cache()
+    return visited, time.perf_counter() - began
+
+# --- Lazy trees ---
+# folder nodes go in with a single "Loading..." placeholder child and are only filled in
+# the first time they're expanded (<<TreeviewOpen>>), so building the trees costs about
+# the same whether the library holds ten ISOs or ten thousand. long child lists are
+# inserted TREE_INSERT_BATCH at a time from after(), so a huge folder never blocks the UI.
+# refreshing doesn't rebuild anything: every loaded node's children are listed again and
+# compared with the last listing (tree_children), and only the differences are applied,
+# so expansion and selection survive and importing one file touches one node
+TREE_PLACEHOLDER = '::__loading__'
+TREE_INSERT_BATCH = 200
+
+lazy_loaders = {}  # iid -> callable returning the node's children (see sync_children)
+loaded_nodes = set()  # lazy nodes that have been expanded at least once
+tree_children = {}  # (tree, parent iid) -> {child iid: (text, path)} as last listed
+node_dirs = {}  # folder node iid -> abs path of the folder its children are listed from
+
+def load_lazy_node(tree, iid):
+    """Fill in a lazy node's children if that hasn't happened yet."""
+    if iid not in lazy_loaders or iid in loaded_nodes:
+        return
+    loaded_nodes.add(iid)
+    if tree.exists(iid + TREE_PLACEHOLDER):
+        tree.delete(iid + TREE_PLACEHOLDER)
+    sync_children(tree, iid, list_children(iid))
 
-    def add_folder_to_tree(folder_path, parent_node=''):
-        if not os.path.isdir(folder_path):
+def list_children(iid):
+    try:
+        return lazy_loaders[iid]()
+    except Exception as e:
+        print(f"Warning: Failed to list {iid}: {e}")
+        return []
+
+def on_tree_open(event):
+    tree = event.widget
+    load_lazy_node(tree, tree.focus())
+
+def forget_node(tree, iid):
+    # drop everything we know about a node that left the tree, and about its children
+    for child in tree_children.pop((tree, iid), {}):
+        forget_node(tree, child)
+    lazy_loaders.pop(iid, None)
+    loaded_nodes.discard(iid)
+    node_dirs.pop(iid, None)
+    file_nodes.pop(iid, None)
+
+def sync_children(tree, parent, children):
+    """Make parent's children match children, a fresh listing of
+    (iid, text, loader, path) tuples: a loader makes the child a lazy folder node,
+    a path registers it as a file node. Only changed nodes are touched; children that
+    were already expanded are synced recursively. New children go in batches."""
+    key = (tree, parent)
+    old = tree_children.get(key, {})
+    new = {iid: (text, path) for iid, text, loader, path in children}
+    tree_children[key] = new
+
+    for iid in old.keys() - new.keys():
+        if tree.exists(iid):
+            tree.delete(iid)
+        forget_node(tree, iid)
+
+    additions = []
+    for index, (iid, text, loader, path) in enumerate(children):
+        if loader:
+            lazy_loaders[iid] = loader  # always the newest listing for the next expand
+        if iid not in old:
+            additions.append((index, iid, text, loader, path))
+            continue
+        if old[iid][0] != text and tree.exists(iid):
+            tree.item(iid, text=text)
+        if path:
+            file_nodes[iid] = path
+        if iid in loaded_nodes:
+            sync_children(tree, iid, list_children(iid))
+
+    def insert_batch(start):
+        if parent and not tree.exists(parent):
+            return  # the folder was removed since
+        for index, iid, text, loader, path in additions[start:start + TREE_INSERT_BATCH]:
+            current = tree_children.get(key, {}).get(iid)
+            if current is None or tree.exists(iid):
+                continue  # gone again in a later refresh
+            tree.insert(parent, index, iid, text=current[0])
+            if loader:
+                tree.insert(iid, 'end', iid + TREE_PLACEHOLDER, text='Loading...')
+            if path:
+                file_nodes[iid] = path
+        if start + TREE_INSERT_BATCH < len(additions):
+            root.after(1, insert_batch, start + TREE_INSERT_BATCH)
+
+    if additions:
+        insert_batch(0)
+
+def dashboard_folder_children(folder_path, folder_id):
+    # categories (from the dashboard index) holding files that exist, then one node per subfolder,
+    # all from a single listing of the folder
+    children = []
+    subfolders, names = scan_dir(folder_path)
+    listed = set()
+    for category, matched in dashboard_index.classify(folder_path, names):
+        files = []
+        for name in matched:
+            file_path = os.path.join(folder_path, name)
+            text = file_node_text(file_path, os.path.basename(name)) if name.lower().endswith('.xex') else os.path.basename(name)
+            # a file in several categories needs a node id per category after the first
+            file_id = f"{folder_id}:::{name}" if name not in listed else f"{folder_id}:::{name}:::{category}"
+            listed.add(name)
+            files.append((file_id, text, None, file_path))
+        children.append((f"{folder_id}::{category}", category, lambda files=files: files, None))
+    for item in subfolders:
+        sub_id = f"{folder_id}::{item}"
+        node_dirs[sub_id] = os.path.abspath(os.path.join(folder_path, item))
+        children.append((sub_id, item, lambda p=os.path.join(folder_path, item), i=sub_id: dashboard_folder_children(p, i), None))
+    return children
+
+def imported_dashboard_children(imports):
+    # imported dashboard files grouped by parent folder
+    grouped = {}
+    for p in imports:
+        if os.path.exists(p):
+            grouped.setdefault(os.path.dirname(p), []).append(p)
+    def list_files(files):
+        # labelled like the files in dashboard folders, so re-listing picks up parsed titles
+        return [('dash::import::' + str(abs(hash(p))),
+                 file_node_text(p, os.path.basename(p)) if p.lower().endswith('.xex') else os.path.basename(p),
+                 None, p) for p in sorted(files)]
+
+    children = []
+    for parent, files in sorted(grouped.items()):
+        folder_id = f"dash::Imported::{os.path.basename(parent)}"
+        node_dirs[folder_id] = os.path.abspath(parent)
+        children.append((folder_id, os.path.basename(parent), lambda files=files: list_files(files), None))
+    return children
+
+def game_folder_children(folder_path, folder_id):
+    isos = [name for name in scan_dir(folder_path)[1] if name.lower().endswith('.iso')]
+    return [(f"{folder_id}:::{file}", file_node_text(os.path.join(folder_path, file), file), None, os.path.join(folder_path, file)) for file in isos]
+
+def list_dashboard_roots(check=True):
+    # the top level of the dashboards tree: the default folder and any configured folders,
+    # plus imported files. check=False skips touching the disk (painting from config.json)
+    top = []
+
+    def add_folder(folder_path):
+        if check and not os.path.isdir(folder_path):
             return
         folder = os.path.basename(folder_path)
-        folder_id = f"dash::{folder}" if not parent_node else f"{parent_node}::{folder}"
-        folder_nodes.append(folder_id)
-        node_text = display_text_for(folder) if not parent_node else folder
-        dash_tree.insert(parent_node, 'end', folder_id, text=node_text)
-
-        for category, file_patterns in index_map.items():
-            category_id = f"{folder_id}::{category}"
-            has_files = False
-            for pattern in file_patterns:
-                file_path = os.path.join(folder_path, pattern)
-                if os.path.exists(file_path):
-                    if not has_files:
-                        dash_tree.insert(folder_id, 'end', category_id, text=category)
-                        has_files = True
-                    file_id = f"{folder_id}:::{pattern}"
-                    file_nodes[file_id] = file_path
-                    dash_tree.insert(category_id, 'end', file_id, text=os.path.basename(pattern))
-
-        # one-level subfolders
-        for item in sorted(os.listdir(folder_path)):
-            sub = os.path.join(folder_path, item)
-            if os.path.isdir(sub):
-                add_folder_to_tree(sub, folder_id)
-
-    default_path = 'dashboard'
-    if os.path.exists(default_path):
-        add_folder_to_tree(default_path)
+        folder_id = f"dash::{folder}"
+        node_dirs[folder_id] = os.path.abspath(folder_path)
+        top.append((folder_id, display_text_for(folder), lambda: dashboard_folder_children(folder_path, folder_id), None))
 
+    add_folder('dashboard')
     for folder in state.get('settings', {}).get('dashboard_folders', []):
-        if os.path.isdir(folder):
-            add_folder_to_tree(folder)
+        add_folder(folder)
 
-    # imported dashboard files grouped by parent folder
     imports = state.get('imports', {}).get('dashboards', []) if isinstance(state.get('imports', {}), dict) else []
     if imports:
-        imported_id = 'dash::Imported'
-        dash_tree.insert('', 'end', imported_id, text='Imported Dashboards')
-        grouped = {}
-        for p in imports:
-            if not os.path.exists(p):
-                continue
-            parent = os.path.dirname(p)
-            grouped.setdefault(parent, []).append(p)
-        for parent, files in sorted(grouped.items()):
-            folder = os.path.basename(parent)
-            folder_id = f"{imported_id}::{folder}"
-            dash_tree.insert(imported_id, 'end', folder_id, text=folder)
-            for p in sorted(files):
-                fid = 'dash::import::' + str(abs(hash(p)))
-                file_nodes[fid] = p
-                dash_tree.insert(folder_id, 'end', fid, text=os.path.basename(p))
+        top.append(('dash::Imported', 'Imported Dashboards', lambda: imported_dashboard_children(imports), None))
+    return top
 
+def game_root_node(folder):
+    folder_id = f"game::{folder}"
+    node_dirs[folder_id] = os.path.abspath(os.path.join('games', folder))
+    return (folder_id, display_text_for(folder), lambda: game_folder_children(os.path.join('games', folder), folder_id), None)
 
-def populate_games_tree():
-    games_tree.delete(*games_tree.get_children())
+def list_game_roots():
+    # one node per folder in games/; returns (children, folder names)
     games_path = 'games'
-    if not os.path.exists(games_path):
-        return
     detected_games = []
     excluded_folders = {'cache', 'cache0', 'cache1'} # don't include cache folders as they are not games
-    for folder in sorted(os.listdir(games_path)):
-        if folder in excluded_folders:
-            continue
-        folder_path = os.path.join(games_path, folder)
-        if not os.path.isdir(folder_path):
-            continue
-        folder_id = f"game::{folder}"
-        folder_nodes.append(folder_id)
-        games_tree.insert('', 'end', folder_id, text=display_text_for(folder))
-        detected_games.append(folder)
-        for file in sorted(os.listdir(folder_path)):
-            if file.lower().endswith('.iso'):
-                file_path = os.path.join(folder_path, file)
-                file_id = f"{folder_id}:::{file}"
-                file_nodes[file_id] = file_path
-                games_tree.insert(folder_id, 'end', file_id, text=file)
+    if os.path.exists(games_path):
+        for folder in scan_dir(games_path)[0]:
+            if folder in excluded_folders:
+                continue
+            detected_games.append(folder)
+    return [game_root_node(folder) for folder in detected_games], detected_games
+
+def populate_dashboards_tree():
+    # lists the top level of the dashboards tree and syncs it; everything below is listed when expanded
+    sync_children(dash_tree, '', list_dashboard_roots())
+
+
+def apply_game_roots(listing):
+    children, detected_games = listing
+    sync_children(games_tree, '', children)
     try:
         state['games'] = detected_games
         save_state(state)
@@ -1950,9 +3960,16 @@ def populate_games_tree():
         pass
 
 
+def populate_games_tree():
+    apply_game_roots(list_game_roots())
+
+
 def refresh_trees():
+    # re-lists everything that's loaded and applies only the differences (see sync_children);
+    # unchanged folders come from the scan cache, which is written out in the background
     populate_dashboards_tree()
     populate_games_tree()
+    threading.Thread(target=save_scan_cache, daemon=True).start()
 
 
 def ensure_dir(path):
@@ -2053,29 +4070,482 @@ def on_double_click(event):
         open_xex(xex_path, preferred)
     else:
         # toggle expand/collapse for folder/category nodes
+        load_lazy_node(tree, iid)
         children = tree.get_children(iid)
         if children:
             is_open = tree.item(iid, 'open')
             tree.item(iid, open=not is_open)
 
 
+# --- Library watcher ---
+# keeps the trees live: games/, dashboard/ and the configured dashboard folders are
+# watched (inotify on Linux, otherwise a stat of every watched folder's mtime every
+# WATCH_POLL_SECONDS) and folders that changed are collected until nothing has happened
+# for WATCH_DEBOUNCE_SECONDS (or WATCH_BATCH_MAX_SECONDS have passed, so a long copy still
+# shows progress). each batch goes through library_changes to the Tk thread, which re-lists
+# just the nodes showing those folders (node_dirs) and syncs them like a refresh would
+WATCH_POLL_SECONDS = 2
+WATCH_DEBOUNCE_SECONDS = 0.5
+WATCH_BATCH_MAX_SECONDS = 2
+WATCH_DRAIN_MS = 200
+
+library_changes = queue.Queue()  # sets of changed folders (abs paths), from the watcher thread
+library_watcher = None
+
+class LibraryWatcher:
+    """Watches the library roots for entries being added, removed or renamed and puts
+    debounced batches of changed folders on library_changes. Subclasses provide the
+    mechanism: _add_watch/_remove_watch and _wait_for_changes(timeout)."""
+
+    mechanism = None
+
+    def __init__(self, roots):
+        self.roots = roots  # (path, max_depth) as from library_scan_roots
+        self.watched = {}  # abs folder path -> levels below it still watched (None = all)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="xm-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _watch_tree(self, path, depth):
+        # watch path and the folders below it, listing them through the scan cache
+        pending = [(os.path.abspath(path), depth)]
+        while pending:
+            folder, depth = pending.pop()
+            if folder in self.watched:
+                continue
+            try:
+                dirs, _ = scan_dir(folder)
+                self._add_watch(folder)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                print(f"Warning: Not watching {folder}: {e}")
+                continue
+            self.watched[folder] = depth
+            if depth is None or depth > 0:
+                pending.extend((os.path.join(folder, name), None if depth is None else depth - 1) for name in dirs)
+
+    def _unwatch_tree(self, path):
+        prefix = path + os.sep
+        for folder in [f for f in self.watched if f == path or f.startswith(prefix)]:
+            del self.watched[folder]
+            self._remove_watch(folder)
+
+    def _update_watches(self, folder):
+        # after folder changed: watch subfolders that appeared, drop ones that went away
+        depth = self.watched.get(folder)
+        try:
+            dirs, _ = scan_dir(folder)
+        except OSError:
+            self._unwatch_tree(folder)
+            return
+        if depth is not None and depth <= 0:
+            return
+        present = {os.path.join(folder, name) for name in dirs}
+        for child in [f for f in self.watched if os.path.dirname(f) == folder and f not in present]:
+            self._unwatch_tree(child)
+        for child in present - self.watched.keys():
+            self._watch_tree(child, None if depth is None else depth - 1)
+
+    def _run(self):
+        for path, depth in self.roots:
+            self._watch_tree(path, depth)
+        print(f"Watching {len(self.watched)} library folders ({self.mechanism})")
+        pending = set()
+        first_change = None
+        while not self._stop.is_set():
+            changed = self._wait_for_changes(WATCH_DEBOUNCE_SECONDS if pending else WATCH_POLL_SECONDS)
+            if self._stop.is_set():
+                break
+            if changed:
+                pending |= changed
+                first_change = first_change or time.monotonic()
+                if time.monotonic() - first_change < WATCH_BATCH_MAX_SECONDS:
+                    continue
+            if not pending:
+                continue
+            for folder in pending:
+                invalidate_scan_dir(folder)
+                if folder in self.watched:
+                    self._update_watches(folder)
+            library_changes.put(pending)
+            pending = set()
+            first_change = None
+        self._close()
+
+    def _add_watch(self, folder):
+        pass
+
+    def _remove_watch(self, folder):
+        pass
+
+    def _close(self):
+        pass
+
+
+class PollingWatcher(LibraryWatcher):
+    """Fallback: compares every watched folder's mtime with the last one seen."""
+
+    mechanism = "polling"
+
+    def __init__(self, roots):
+        super().__init__(roots)
+        self.mtimes = {}
 
+    def _add_watch(self, folder):
+        self.mtimes[folder] = os.stat(folder).st_mtime_ns
+
+    def _remove_watch(self, folder):
+        self.mtimes.pop(folder, None)
+
+    def _wait_for_changes(self, timeout):
+        if self._stop.wait(timeout):
+            return set()
+        changed = set()
+        for folder, mtime in list(self.mtimes.items()):
+            try:
+                current = os.stat(folder).st_mtime_ns
+            except OSError:
+                current = None  # gone; its parent changed too and drops the watch
+            if current != mtime:
+                self.mtimes[folder] = current
+                changed.add(folder)
+        return changed
+
+
+class InotifyWatcher(LibraryWatcher):
+    """Linux: one inotify watch per folder, read straight from libc through ctypes."""
+
+    mechanism = "inotify"
+    # IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+    # (IN_CLOSE_WRITE: a game being copied in shows up at IN_CREATE while still partial; the
+    # folder is re-listed once the copy is closed, and cached_metadata re-parses the grown file)
+    WATCH_MASK = 0x08 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800 | 0x01000000
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+
+    def __init__(self, roots):
+        super().__init__(roots)
+        import ctypes
+        import ctypes.util
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._paths = {}  # watch descriptor -> folder
+        self._descriptors = {}  # folder -> watch descriptor
+
+    def _add_watch(self, folder):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), self.WATCH_MASK)
+        if wd < 0:
+            raise OSError(f"can't watch {folder} (out of inotify watches?)")
+        self._paths[wd] = folder
+        self._descriptors[folder] = wd
+
+    def _remove_watch(self, folder):
+        wd = self._descriptors.pop(folder, None)
+        if wd is not None and self._paths.pop(wd, None) is not None:
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _wait_for_changes(self, timeout):
+        import select
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = struct.unpack_from('iIII', data, offset)
+            offset += 16 + length
+            if mask & self.IN_Q_OVERFLOW:
+                return set(self.watched)  # events were lost, every folder gets checked
+            folder = self._paths.get(wd)
+            if folder is None:
+                continue
+            if mask & self.IN_IGNORED:
+                # the folder itself went away; the kernel already dropped the watch
+                self._paths.pop(wd, None)
+                self._descriptors.pop(folder, None)
+                continue
+            changed.add(folder)
+        return changed
+
+    def _close(self):
+        os.close(self._fd)
+
+
+def make_library_watcher(roots):
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(roots)
+        except Exception as e:
+            print(f"Warning: inotify unavailable ({e}), polling the library instead")
+    return PollingWatcher(roots)
+
+def restart_library_watcher():
+    # (re)start watching library_scan_roots(); called once the startup scan is done and
+    # whenever the configured dashboard folders change
+    global library_watcher
+    if library_watcher is not None:
+        library_watcher.stop()
+    library_watcher = make_library_watcher(library_scan_roots())
+    library_watcher.start()
+
+def apply_library_changes(folders):
+    # re-list the loaded nodes showing any of these folders; sync_children does the rest
+    if os.path.abspath('games') in folders:
+        populate_games_tree()
+    for iid, folder in list(node_dirs.items()):
+        if folder not in folders or iid not in loaded_nodes:
+            continue
+        tree = dash_tree if iid.startswith('dash::') else games_tree
+        if tree.exists(iid):
+            sync_children(tree, iid, list_children(iid))
+    threading.Thread(target=save_scan_cache, daemon=True).start()
+
+def pump_library_changes():
+    folders = set()
+    while True:
+        try:
+            folders |= library_changes.get_nowait()
+        except queue.Empty:
+            break
+    if folders:
+        try:
+            apply_library_changes(folders)
+        except Exception as e:
+            print(f"Warning: Failed to apply library changes: {e}")
+    root.after(WATCH_DRAIN_MS, pump_library_changes)
+
+# --- Startup ---
+# the window is painted straight away from what config.json already knows (the game
+# folders seen last time, the configured dashboard folders) without touching the disk.
+# emulator detection and the library listing then run in the background and land as
+# diffs on the trees, so a slow or unplugged USB drive delays those, never the window.
+# time-to-first-paint and time-to-ready are printed and kept in startup_timings;
+# run with --profile-startup for the per-import breakdown (the app quits once ready)
+STARTUP_POLL_MS = 50
+PROFILE_REPORT_IMPORTS = 25 # slowest imports listed by --profile-startup
+
+def print_startup_profile():
+    # --profile-startup report: slowest imports (self / cumulative) and the startup phases,
+    # in a fixed format so runs can be diffed or grepped between builds
+    print(f"Startup profile ({'frozen' if getattr(sys, 'frozen', False) else 'script'})")
+    print(f"  imports, {len(import_timings)} modules, slowest first:")
+    for name, self_seconds, cumulative, depth in sorted(import_timings, key=lambda t: t[2], reverse=True)[:PROFILE_REPORT_IMPORTS]:
+        print(f"    {cumulative * 1000:8.1f} ms  {self_seconds * 1000:8.1f} ms self  {'  ' * depth}{name}")
+    print("  phases:")
+    for phase, seconds in startup_timings.items():
+        print(f"    {seconds * 1000:8.1f} ms  {phase}")
+
+def apply_detected_emulators(result):
+    candidates, found = result
+    emulators.update(candidates)
+    merge_installed_emulators(found)
+
+def run_background_startup():
+    root.update_idletasks()
+    mark_startup('first_paint')
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="xm-startup")
+    stages = {
+        'library': (pool.submit(scan_library), lambda result: print(f"Library scan: {result[0]} folders in {result[1]:.3f}s")),
+        'emulators': (pool.submit(lambda: (probe_emulator_candidates(), scan_installed_emulators())), apply_detected_emulators),
+        'dashboards': (pool.submit(list_dashboard_roots), lambda top: sync_children(dash_tree, '', top)),
+        'games': (pool.submit(list_game_roots), apply_game_roots),
+    }
+    pool.shutdown(wait=False)
+
+    def poll():
+        for name, (future, apply) in list(stages.items()):
+            if not future.done():
+                continue
+            del stages[name]
+            try:
+                apply(future.result())
+            except Exception as e:
+                print(f"Warning: startup stage '{name}' failed: {e}")
+            mark_startup(name)
+        if stages:
+            root.after(STARTUP_POLL_MS, poll)
+            return
+        mark_startup('ready')
+        if not PROFILE_STARTUP:
+            restart_library_watcher()  # the scan cache is warm by now
+            root.after(WATCH_DRAIN_MS, pump_library_changes)
+        print("Startup: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in startup_timings.items()))
+        if PROFILE_STARTUP:
+            # measuring only: report and quit without checking for updates
+            print_startup_profile()
+            root.after(0, root.destroy)
+            return
+        # Check for new Xenia builds in the background once everything is in place
+        if state.get('update', {}).get('check_update_on_launch_xm', False):
+            schedule_update_check(UPDATE_CHECK_STARTUP_DELAY)
+
+    root.after(STARTUP_POLL_MS, poll)
+
+# --- Main window ---
+# everything above only defines things; the window is built and run from here, so
+# main.py can also be imported for its helpers (the scripts in tests/ do that)
+if __name__ == '__main__':
+    if HAVE_TKDN:
+        # use TkinterDnD root if available for native file-drop support
+        root = TkinterDnD.Tk()
+    else:
+        root = tk.Tk()
+    root.title("Xenia Manager")
+
+    plus_icon_path = get_asset_path("plus.png")
+    minus_icon_path = get_asset_path("minus.png")
+    open_folder_icon_path = get_asset_path("open-folder.png")
+
+
+    plus_icon = PhotoImage(file=plus_icon_path)
+    minus_icon = PhotoImage(file=minus_icon_path)
+    open_folder_icon = PhotoImage(file=open_folder_icon_path)
+
+    state = load_state()
+    state = state if state is not None else {} # If state is None, assign {} to state.
+    job_queue.set_max_workers(state.get('settings', {}).get('max_concurrent_jobs', JOB_QUEUE_DEFAULT_WORKERS))
+    set_asset_cache_limit(state.get('settings', {}).get('asset_cache_mb', ASSET_CACHE_DEFAULT_MB))
+    mark_startup('state_loaded')
+
+    labels = state.get("labels", {})
+    emulators = state.get("emulators", {})
+
+    # Track installed emulator versions (path -> version string)
+    installed_emulators = state.setdefault('installed_emulators', {})
+
+    root.after(PROGRESS_DRAIN_MS, drain_progress_events)
+
+    root.after(JOBS_PANEL_REFRESH_MS, pump_finished_jobs)
+
+    # --- Menu bar (File, Settings, Help)
+    menubar = tk.Menu(root)
+    file_menu = tk.Menu(menubar, tearoff=0)
+    # open xenia emulator directly using subprocess by getting default emulator, do not use open_xex, no dashboard or game
+    file_menu.add_command(label="Launch Xenia Emulator", command=lambda: subprocess.Popen([pick_preferred_emulator()]))
+    file_menu.add_separator()
+    file_menu.add_command(label="Import Dashboards...", command=import_dashboards_menu)
+    file_menu.add_command(label="Import Games...", command=import_games_menu)
+    file_menu.add_command(label="Jobs...", command=show_jobs_panel)
+    file_menu.add_separator()
+    file_menu.add_command(label="Exit", command=root.quit)
+    menubar.add_cascade(label="File", menu=file_menu)
+
+    settings_menu = tk.Menu(menubar, tearoff=0)
+    settings_menu.add_command(label="Configure Manager...", command=open_manager_config)
+    settings_menu.add_command(label="Configure Emulator...", command=configure_emulator)
+    menubar.add_cascade(label="Settings", menu=settings_menu)
+
+    help_menu = tk.Menu(menubar, tearoff=0)
+    help_menu.add_command(label="About", command=lambda: messagebox.showinfo("About", "Xenia Manager\nVersion 0.2\n\nA simple manager for Xenia Xbox 360 emulator dashboards and games.\n\nDeveloped by kazwaztaken."))
+    menubar.add_cascade(label="Help", menu=help_menu)
+
+    root.config(menu=menubar)
+
+    # (Toolbar removed — use drag-and-drop or right-click Import functions)
+
+    # Create notebook for tabs
+    notebook = ttk.Notebook(root)
+    notebook.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+
+    # Create frames for each tab
+    dashboards_frame = ttk.Frame(notebook)
+    games_frame = ttk.Frame(notebook)
+
+    # Add the frames to notebook
+    notebook.add(dashboards_frame, text='Dashboards')
+    notebook.add(games_frame, text='Games')
+
+    # Create trees for both tabs
+    dash_tree = ttk.Treeview(dashboards_frame)
+    dash_tree.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+
+    games_tree = ttk.Treeview(games_frame)
+    games_tree.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+
+    # If tkinterdnd2 is available, register the games_tree as a drop target
+    if HAVE_TKDN:
+        def _parse_dnd_files(data):
+            # data may be a string like '{C:/path/one.iso} {C:/path/two.iso}' or space-separated
+            import re
+            parts = re.findall(r'\{([^}]*)\}|([^ ]+)', data)
+            files = []
+            for a, b in parts:
+                if a:
+                    files.append(a)
+                elif b:
+                    files.append(b)
+            return files
+
+        def on_games_drop(event):
+            data = event.data
+            files = _parse_dnd_files(data)
+            if not files:
+                return
+            # Determine drop target folder (if dropped onto a folder node)
+            try:
+                y = event.y_root - games_tree.winfo_rooty()
+                iid = games_tree.identify_row(y)
+            except Exception:
+                iid = None
+
+            target_folder = None
+            if iid and iid.startswith('game::'):
+                target_folder = iid.split('::', 1)[1]
+
+            if not target_folder:
+                # ask for folder name
+                target_folder = simpledialog.askstring("Import Games", "Enter target game folder name (will be created):")
+                if not target_folder:
+                    return
+
+            game_dir = os.path.join('games', target_folder)
+            if not ensure_dir(game_dir):
+                return
+
+            # only accept .iso files for games
+            isos = [p for p in files if os.path.isfile(p) and p.lower().endswith('.iso')]
+            imported = 0
+            try:
+                imported = import_files(isos, game_dir)
+            except Exception as e:
+                messagebox.showerror("Import Error", str(e))
+            if imported:
+                messagebox.showinfo("Imported", f"Imported {imported} file(s) into '{target_folder}'")
+                refresh_trees()
 
+        games_tree.drop_target_register(DND_FILES)
+        games_tree.dnd_bind('<<Drop>>', on_games_drop)
 
-# Initialize tree views
-dash_tree.heading("#0", text="Dashboards")
-games_tree.heading("#0", text="Games")
+    # Initialize tree views
+    dash_tree.heading("#0", text="Dashboards")
+    games_tree.heading("#0", text="Games")
 
-# Bind events for both trees
-for tree in (dash_tree, games_tree):
-    tree.bind('<Button-3>', on_right_click)
-    tree.bind('<Double-Button-1>', on_double_click)
+    # Bind events for both trees
+    for tree in (dash_tree, games_tree):
+        tree.bind('<Button-3>', on_right_click)
+        tree.bind('<Double-Button-1>', on_double_click)
+        tree.bind('<<TreeviewOpen>>', on_tree_open)
 
-# Bind F5 to refresh
-root.bind('<F5>', lambda e: refresh_trees())
+    # Bind F5 to refresh
+    root.bind('<F5>', lambda e: refresh_trees())
 
-# Initial population
-populate_dashboards_tree()
-populate_games_tree()
+    # Initial population, from cached state only
+    sync_children(dash_tree, '', list_dashboard_roots(check=False))
+    sync_children(games_tree, '', [game_root_node(folder) for folder in state.get('games', [])])
+    mark_startup('ui_built')
+    root.after(0, run_background_startup)
 
-root.mainloop()
\ No newline at end of file
+    root.mainloop()
\ No newline at end of file
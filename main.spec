@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('assets', 'assets')],
-    hiddenimports=[],
+    hiddenimports=['requests', 'zipfile'],  # imported on first use through LazyModule, invisible to the analysis
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
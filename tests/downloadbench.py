@@ -0,0 +1,81 @@
+# script to compare the single stream downloader against the segmented one
+# runs a local http server that caps every connection at the same rate (like
+# github's cdn does on slow links), so splitting the file should scale with
+# the number of segments
+# usage: python tests/downloadbench.py [size_mb] [per_connection_mb_per_s]
+import http.server
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import main as xm  # importing main.py only defines its helpers, the window is built when it's run
+
+
+def start_server(data, rate):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header('Accept-Ranges', 'bytes')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+
+        def do_GET(self):
+            start, end = 0, len(data) - 1
+            match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+            if match:
+                start = int(match.group(1))
+                end = int(match.group(2)) if match.group(2) else end
+                self.send_response(206)
+                self.send_header('Content-Range', f'bytes {start}-{end}/{len(data)}')
+            else:
+                self.send_response(200)
+            self.send_header('Accept-Ranges', 'bytes')
+            self.send_header('Content-Length', str(end - start + 1))
+            self.end_headers()
+            # throttle this connection to `rate` bytes per second
+            chunk = 64 * 1024
+            began = time.monotonic()
+            sent = 0
+            for offset in range(start, end + 1, chunk):
+                piece = data[offset:min(offset + chunk, end + 1)]
+                self.wfile.write(piece)
+                sent += len(piece)
+                ahead = sent / rate - (time.monotonic() - began)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    rate_mb = float(sys.argv[2]) if len(sys.argv) > 2 else 8
+    data = os.urandom(size_mb * 1024 * 1024)
+    server = start_server(data, rate_mb * 1024 * 1024)
+    url = f'http://127.0.0.1:{server.server_port}/asset.zip'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for segments in (1, 2, 4, 8):
+            dest = os.path.join(tmp, f'asset_{segments}.zip')
+            began = time.monotonic()
+            xm.download_file(url, dest, segments=segments)
+            elapsed = time.monotonic() - began
+            with open(dest, 'rb') as f:
+                ok = f.read() == data
+            print(f"{segments} segment(s): {elapsed:.2f}s, {size_mb / elapsed:.1f} MB/s, intact: {ok}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+# local stand-in for github that misbehaves on purpose, to check the network layer
+# (timeouts, retry with backoff, circuit breaker, resumed downloads) without needing
+# an actually bad connection. runs every scenario against main.py's helpers with
+# short timeouts and prints how each one went
+# usage: python tests/faultserver.py            run the scenarios
+#        python tests/faultserver.py --serve 8765  just run the server (point a mirror url at it)
+# endpoints:
+#   /ok            small json body
+#   /hang          accepts the request and never answers
+#   /flaky/<n>     500 for the first n requests, then 200
+#   /reset         closes the connection without a response
+#   /drop          big file, the first response is cut off half way (ranges supported)
+#   /stall         big file, the first response stops sending half way and hangs
+import http.server
+import json
+import os
+import re
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import main as xm  # importing main.py only defines its helpers, the window is built when it's run
+
+BIG_FILE = os.urandom(2 * 1024 * 1024)
+
+
+def start_server(port=0):
+    hits = {}
+    lock = threading.Lock()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def count(self):
+            with lock:
+                hits[self.path] = hits.get(self.path, 0) + 1
+                return hits[self.path]
+
+        def send_body(self, body, status=200, content_type='application/json'):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_file(self, broken):
+            # serves BIG_FILE with range support; broken(first) decides how the first response fails
+            start = 0
+            match = re.match(r'bytes=(\d+)-', self.headers.get('Range', ''))
+            if match:
+                start = int(match.group(1))
+                self.send_response(206)
+                self.send_header('Content-Range', f'bytes {start}-{len(BIG_FILE) - 1}/{len(BIG_FILE)}')
+            else:
+                self.send_response(200)
+            self.send_header('Accept-Ranges', 'bytes')
+            self.send_header('ETag', '"big"')
+            self.send_header('Content-Length', str(len(BIG_FILE) - start))
+            self.end_headers()
+            body = BIG_FILE[start:]
+            if self.count() == 1:
+                self.wfile.write(body[:len(body) // 2])
+                self.wfile.flush()
+                broken(self)
+                return
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/ok':
+                self.count()
+                self.send_body(json.dumps({'ok': True}).encode())
+            elif self.path == '/hang':
+                self.count()
+                time.sleep(60)
+            elif self.path.startswith('/flaky/'):
+                failures = int(self.path.rsplit('/', 1)[1])
+                if self.count() <= failures:
+                    self.send_body(b'{"message": "server error"}', status=500)
+                else:
+                    self.send_body(json.dumps({'ok': True}).encode())
+            elif self.path == '/reset':
+                self.count()
+                self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, b'\x01\x00\x00\x00\x00\x00\x00\x00')
+                self.connection.close()
+            elif self.path == '/drop':
+                self.send_file(lambda handler: handler.connection.shutdown(socket.SHUT_RDWR))
+            elif self.path == '/stall':
+                self.send_file(lambda handler: time.sleep(60))
+            else:
+                self.send_body(b'{"message": "Not Found"}', status=404)
+
+        do_POST = do_GET
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, hits
+
+
+def closed_port():
+    # a port nothing listens on, connections to it are refused straight away
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def main():
+    if '--serve' in sys.argv:
+        port = int(sys.argv[sys.argv.index('--serve') + 1])
+        start_server(port)
+        print(f"fault server on http://127.0.0.1:{port}/ (ctrl+c to stop)")
+        while True:
+            time.sleep(3600)
+
+    # short timeouts so the whole run takes seconds
+    xm.HTTP_TIMEOUT, xm.HTTP_BACKOFF_BASE, xm.CIRCUIT_OPEN_SECONDS = (1, 1), 0.05, 2
+    server, hits = start_server()
+    base = f'http://127.0.0.1:{server.server_port}'
+    http_request = xm.http_request
+    results = []
+
+    def scenario(name, func):
+        xm._circuit_breakers.clear()
+        began = time.monotonic()
+        try:
+            outcome = func()
+            ok = outcome is True
+        except Exception as e:
+            outcome, ok = f'{type(e).__name__}: {e}', False
+        elapsed = time.monotonic() - began
+        results.append(ok)
+        print(f"{'PASS' if ok else 'FAIL'} {name} ({elapsed:.2f}s){'' if ok else ' -> ' + str(outcome)}")
+
+    def expect_raise(func, exc_type):
+        try:
+            func()
+        except exc_type:
+            return True
+        return False
+
+    def hang_times_out():
+        began = time.monotonic()
+        raised = expect_raise(lambda: http_request('GET', base + '/hang'), xm.requests.Timeout)
+        # 3 attempts of ~1s each plus a little backoff, not 60s
+        return raised and time.monotonic() - began < 6 and hits['/hang'] == 3
+
+    def flaky_recovers():
+        return http_request('GET', base + '/flaky/2').status_code == 200 and hits['/flaky/2'] == 3
+
+    def flaky_gives_up():
+        return http_request('GET', base + '/flaky/10').status_code == 500 and hits['/flaky/10'] == 3
+
+    def post_not_retried():
+        hits.pop('/reset', None)
+        raised = expect_raise(lambda: http_request('POST', base + '/reset'), xm.requests.RequestException)
+        return raised and hits.get('/reset', 0) <= 1
+
+    def breaker_fails_fast():
+        dead = f'http://127.0.0.1:{closed_port()}/repos/x/y/releases/latest'
+        expect_raise(lambda: http_request('GET', dead, retries=0), xm.requests.ConnectionError)
+        expect_raise(lambda: http_request('GET', dead, retries=0), xm.requests.ConnectionError)
+        expect_raise(lambda: http_request('GET', dead, retries=0), xm.requests.ConnectionError)
+        began = time.monotonic()
+        opened = expect_raise(lambda: http_request('GET', dead), xm.CircuitOpenError)
+        fast = time.monotonic() - began < 0.05
+        return opened and fast
+
+    def breaker_half_open():
+        dead = f'http://127.0.0.1:{closed_port()}/x'
+        for _ in range(3):
+            expect_raise(lambda: http_request('GET', dead, retries=0), xm.requests.ConnectionError)
+        time.sleep(2.1)
+        # the trial request goes out (and fails with a real connection error, not CircuitOpenError)
+        try:
+            http_request('GET', dead, retries=0)
+            trial = False
+        except xm.CircuitOpenError:
+            trial = False
+        except xm.requests.ConnectionError:
+            trial = True
+        reopened = expect_raise(lambda: http_request('GET', dead, retries=0), xm.CircuitOpenError)
+        return trial and reopened
+
+    def stale_cache_when_down():
+        with tempfile.TemporaryDirectory() as tmp:
+            xm.HTTP_CACHE_DIR = tmp
+            url = base + '/ok'
+            status, body = xm.github_get_json(url)
+            # pretend the cache entry expired and the host then went away
+            entry = xm._load_http_cache_entry(url)
+            entry['expires'] = 0
+            xm._save_http_cache_entry(url, entry)
+            for _ in range(3):
+                xm.get_circuit_breaker(url).record_failure()
+            began = time.monotonic()
+            status2, body2 = xm.github_get_json(url)
+            return status == status2 == 200 and body2 == body and time.monotonic() - began < 0.05
+
+    def download_resumes(path):
+        def run():
+            with tempfile.TemporaryDirectory() as tmp:
+                dest = os.path.join(tmp, 'asset.zip')
+                xm.download_file(base + path, dest, segments=1)
+                with open(dest, 'rb') as f:
+                    return f.read() == BIG_FILE
+        return run
+
+    scenario('request that never answers times out and is retried', hang_times_out)
+    scenario('5xx twice, then success', flaky_recovers)
+    scenario('5xx every time returns the last 500', flaky_gives_up)
+    scenario('POST is not retried', post_not_retried)
+    scenario('unreachable host trips the breaker, then fails fast', breaker_fails_fast)
+    scenario('breaker lets one trial through after the open period', breaker_half_open)
+    scenario('release lookup serves the stale cache while the breaker is open', stale_cache_when_down)
+    scenario('download cut off half way resumes', download_resumes('/drop'))
+    scenario('download that stalls half way times out and resumes', download_resumes('/stall'))
+    server.shutdown()
+    print(f"{sum(results)}/{len(results)} scenarios passed")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == '__main__':
+    main()
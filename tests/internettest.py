@@ -3,7 +3,7 @@
 # we will have to use proxy which will suck
 import requests
 try:
-    response = requests.get('https://api.github.com/users/xenia-project') 
+    response = requests.get('https://api.github.com/users/xenia-project', timeout=(5, 30))
     response.raise_for_status()
     print("Success!")
 except requests.exceptions.RequestException as e: